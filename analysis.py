@@ -0,0 +1,155 @@
+"""Dashboard computations as plain functions (no Streamlit).
+
+The dashboard tabs and the headless batch report generator
+(batch_report.py) both call these, so the numbers on screen and in the
+overnight reports come from one code path.
+"""
+import numpy as np
+import pandas as pd
+
+from correlation import compute_correlation
+from descriptive_stats import compute_statistics, describe_table
+from grouping import GroupedAggregates
+from metrics_engine import PASS_GRADE, SCHOOLS, SEXES, MetricsKernel
+
+CATEGORICAL_COLUMNS = ['school', 'sex', 'address', 'famsize', 'Pstatus', 'Mjob', 'Fjob',
+                       'reason', 'guardian', 'schoolsup', 'famsup', 'paid', 'activities',
+                       'nursery', 'higher', 'internet', 'romantic']
+
+BOXPLOT_FEATURES = ['G1', 'G2', 'G3', 'studytime', 'failures', 'absences', 'Medu', 'Fedu']
+
+
+def _share(mask):
+    # Percentage of True values, NaN for an empty selection
+    return mask.mean() * 100 if len(mask) else np.nan
+
+
+def overview_metrics(df):
+    """Values behind the eight Tab 1 metric tiles, from the kernel the dashboard updates per selection."""
+    return MetricsKernel(df).baseline
+
+
+def _aggregates(df, by, aggregates):
+    # A shared engine when the caller has one, else one over just the columns needed
+    if aggregates is not None:
+        return aggregates
+    return GroupedAggregates(df, group_columns=[by] if isinstance(by, str) else list(by))
+
+
+def grade_by(df, by, value='Average_Grade', aggregates=None):
+    """Mean of ``value`` for each group of ``by`` (a column or list of columns).
+
+    ``aggregates`` is an optional ``grouping.GroupedAggregates`` over ``df``
+    to read the result from.
+    """
+    return _aggregates(df, by, aggregates).stat(by, value).reset_index()
+
+
+def category_counts(df, column, aggregates=None):
+    """Students per category of ``column``, most common first (as ``value_counts``)."""
+    counts = _aggregates(df, column, aggregates).size(column).rename('count')
+    return counts.sort_values(ascending=False).reset_index()
+
+
+def grade_period_means(df):
+    return pd.DataFrame({
+        'Grade Period': ['G1', 'G2', 'G3'],
+        'Average Score': [df['G1'].mean(), df['G2'].mean(), df['G3'].mean()]
+    })
+
+
+def categorical_summary(df, column, aggregates=None):
+    """Statistical summary of grades, study time, failures and absences per category."""
+    table = _aggregates(df, column, aggregates).table(column)
+    summary_stats = table[[
+        ('Average_Grade', 'count'), ('Average_Grade', 'mean'), ('Average_Grade', 'std'),
+        ('Average_Grade', 'min'), ('Average_Grade', 'max'),
+        ('studytime', 'mean'), ('failures', 'mean'), ('absences', 'mean'), ('G3', 'mean')
+    ]].round(2)
+    summary_stats.columns = ['Count', 'Mean_Grade', 'Std_Grade', 'Min_Grade', 'Max_Grade',
+                             'Avg_StudyTime', 'Avg_Failures', 'Avg_Absences', 'Avg_G3']
+    return summary_stats
+
+
+def study_time_analysis(df, aggregates=None):
+    """Average grades and student count for each study time level."""
+    table = _aggregates(df, 'studytime', aggregates).table('studytime')
+    study_analysis = table[[
+        ('G1', 'mean'), ('G2', 'mean'), ('G3', 'mean'), ('Average_Grade', 'mean'), ('studytime', 'count')
+    ]].round(2)
+    study_analysis.columns = ['Avg_G1', 'Avg_G2', 'Avg_G3', 'Avg_Grade', 'Student_Count']
+    study_analysis.index.name = 'Study_Time_Level'
+    return study_analysis
+
+
+def top_correlations(corr, target, k=5):
+    """The ``k`` features most positively correlated with ``target``."""
+    return corr[target].drop(target).sort_values(ascending=False).head(k)
+
+
+def outlier_counts(stats):
+    """Boxplot outliers from a ``descriptive_stats`` table: G3 below the lower 1.5×IQR fence, absences above the upper fence."""
+    return {
+        'low_grade': int(stats.loc['G3', 'outliers_low']),
+        'high_absence': int(stats.loc['absences', 'outliers_high']),
+    }
+
+
+def min_max_normalize(df, columns):
+    """Scale ``columns`` to 0-1 in one pass over a 2D array; constant columns become 0."""
+    values = df[columns].to_numpy(dtype=np.float64)
+    if not len(values):
+        return pd.DataFrame(values, columns=columns, index=df.index)
+    low = np.nanmin(values, axis=0)
+    span = np.nanmax(values, axis=0) - low
+    normalized = (values - low) / np.where(span > 0, span, 1)
+    return pd.DataFrame(normalized, columns=columns, index=df.index)
+
+
+def gender_comparison(df):
+    """G3 summary statistics and pass rate for male and female students."""
+    comparison = {}
+    for sex in ['M', 'F']:
+        grades = df.loc[df['sex'] == sex, 'G3']
+        stats = grades.describe()
+        comparison[sex] = {
+            'count': stats['count'],
+            'mean': stats['mean'],
+            'median': stats['50%'],
+            'std': stats['std'],
+            'min': stats['min'],
+            'max': stats['max'],
+            'pass_rate': _share(grades >= PASS_GRADE),
+        }
+    comparison['mean_difference'] = comparison['F']['mean'] - comparison['M']['mean']
+    return comparison
+
+
+def performance_mix_by_gender(df):
+    """Percentage of each performance category within each gender."""
+    return pd.crosstab(df['sex'], df['Performance_Category'], normalize='index') * 100
+
+
+def build_report(df):
+    """Every Tab 1-5 result for one dataset, as plain Python/pandas objects."""
+    corr = compute_correlation(df)
+    stats = compute_statistics(df)
+    aggregates = GroupedAggregates(df)
+    return {
+        'overview': overview_metrics(df),
+        'summary_statistics': describe_table(stats),
+        'performance_categories': df['Performance_Category'].value_counts(),
+        'grade_period_means': grade_period_means(df),
+        'grade_by_studytime': grade_by(df, 'studytime', aggregates=aggregates),
+        'grade_by_school_sex': grade_by(df, ['school', 'sex'], aggregates=aggregates),
+        'grade_by_address_sex': grade_by(df, ['address', 'sex'], aggregates=aggregates),
+        'grade_by_medu': grade_by(df, 'Medu', aggregates=aggregates),
+        'grade_by_fedu': grade_by(df, 'Fedu', aggregates=aggregates),
+        'correlation': corr,
+        'top_correlations': {target: top_correlations(corr, target) for target in ['G1', 'G2', 'G3']},
+        'study_time_analysis': study_time_analysis(df, aggregates),
+        'categorical_summaries': {col: categorical_summary(df, col, aggregates) for col in CATEGORICAL_COLUMNS if col in df.columns},
+        'outliers': outlier_counts(stats),
+        'gender_comparison': gender_comparison(df),
+        'performance_mix_by_gender': performance_mix_by_gender(df),
+    }
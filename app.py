@@ -2,19 +2,38 @@ import io
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
+
+from data_loader import content_hash, read_bytes
+from downsampling import downsample
+from figure_pool import FigureRenderer
+from histograms import histograms
+from kde import column_densities
+from outliers import TREATMENTS, treat_outliers
+from schema import read_student_csv
+
+# Scatter pairs drawn by default, and subplots per row of the scatter grid
+MAX_SCATTER_PAIRS = 12
+SCATTER_GRID_COLUMNS = 4
 
 # Title of the app
 st.title('Exploratory Data Analysis with Streamlit')
 
+# Figures come from a shared pool of Agg canvases and are recycled after st.pyplot
+if 'figure_renderer' not in st.session_state:
+    st.session_state.figure_renderer = FigureRenderer(st.pyplot)
+renderer = st.session_state.figure_renderer
+
 # File uploader
 uploaded_file = st.file_uploader("Upload CSV file here", type="csv")
 
 if uploaded_file is not None:
-    # 1. Load the data
-    df = pd.read_csv(uploaded_file, delimiter=';')
+    # 1. Load the data - documented attributes are parsed straight into compact
+    # dtypes (categorical, boolean, int8/uint8) and rows that don't fit are skipped.
+    df, rejected_rows = read_student_csv(uploaded_file)
+    dataset_key = content_hash(read_bytes(uploaded_file))
+    if rejected_rows:
+        st.warning(f'{rejected_rows} rows did not match the dataset schema and were skipped.')
 
     # 2. Basic Data Exploration - Check the first few rows of the dataset 
     # to get an initial sense of the data's structure.
@@ -38,25 +57,37 @@ if uploaded_file is not None:
     # like imputation or removal.
     st.subheader('Missing Values')
     st.write(df.isnull().sum())
-    df = df.fillna(df.mean())
+    df = df.fillna(df.mean(numeric_only=True))
 
     # 6. Data Visualization - Create visualizations to explore data distributions, relationships, and patterns.
-    # Plot histograms for each numerical feature
+    # Plot histograms for each numerical feature - every column binned in one pass (one bin
+    # per value for integer features), cached per uploaded file, and drawn from the counts
     st.subheader('Histograms')
     num_cols = df.select_dtypes(include=[np.number]).columns
+    column_histograms = histograms(df, num_cols, fingerprint=dataset_key)
     for col in num_cols:
-        fig, ax = plt.subplots()
-        df[col].hist(ax=ax, bins=20)
-        ax.set_title(f'Histogram of {col}')
-        st.pyplot(fig)
-
-    # Plot density plots
+        hist = column_histograms[col]
+        with renderer.subplots() as (fig, ax):
+            if hist is not None:
+                ax.hist(hist.edges[:-1], bins=hist.edges, weights=hist.counts)
+            ax.grid(True)
+            ax.set_title(f'Histogram of {col}')
+
+    # Plot density plots - binned KDE of every column in one pass, cached per uploaded file
     st.subheader('Density Plots')
+    densities = column_densities(df, num_cols, fingerprint=dataset_key)
     for col in num_cols:
-        fig, ax = plt.subplots()
-        sns.kdeplot(df[col], ax=ax, fill=True)
-        ax.set_title(f'Density Plot of {col}')
-        st.pyplot(fig)
+        if densities[col] is None:
+            st.write(f"Skipping density plot of {col} as it has no spread.")
+            continue
+        x, density = densities[col]
+        with renderer.subplots() as (fig, ax):
+            ax.fill_between(x, density, alpha=0.25)
+            ax.plot(x, density)
+            ax.set_ylim(bottom=0)
+            ax.set_xlabel(col)
+            ax.set_ylabel('Density')
+            ax.set_title(f'Density Plot of {col}')
 
   
 
@@ -69,10 +100,9 @@ if uploaded_file is not None:
         try:
             # Ensure that the column is numeric and doesn't contain lists/arrays
             if pd.api.types.is_numeric_dtype(df[col]) and df[col].apply(lambda x: isinstance(x, (int, float))).all():
-                fig, ax = plt.subplots()
-                sns.boxplot(x=df[col], ax=ax)
-                ax.set_title(f'Box and Whisker Plot of {col}')
-                st.pyplot(fig)
+                with renderer.subplots() as (fig, ax):
+                    sns.boxplot(x=df[col], ax=ax)
+                    ax.set_title(f'Box and Whisker Plot of {col}')
             else:
                 st.write(f"Skipping column {col} as it doesn't contain simple numeric data.")
         except ValueError as e:
@@ -81,78 +111,112 @@ if uploaded_file is not None:
 
     # Plot correlations heatmap
     st.subheader('Correlation Heatmap')
-    corr = df.corr()
-    fig, ax = plt.subplots()
-    sns.heatmap(corr, annot=True, cmap='coolwarm', ax=ax)
-    st.pyplot(fig)
+    corr = df.corr(numeric_only=True)
+    with renderer.subplots() as (fig, ax):
+        sns.heatmap(corr, annot=True, cmap='coolwarm', ax=ax)
 
 
     # Scatter Plot
     st.subheader('Scatter Plots')
     num_cols = df.select_dtypes(include=[np.number]).columns
 
-    # Create scatter plots for all pairs of numerical features
-    for i, col1 in enumerate(num_cols):
-        for col2 in num_cols[i+1:]:
-            fig, ax = plt.subplots()
-            ax.scatter(df[col1], df[col2])
-            ax.set_xlabel(col1)
-            ax.set_ylabel(col2)
-            ax.set_title(f'Scatter Plot of {col1} vs {col2}')
-            st.pyplot(fig)
-
-
-    # 7. Identifying and Handling Outliers
+    # Rank every pair of numerical features by correlation strength (constant columns last)
+    pair_corr = corr.loc[num_cols, num_cols].to_numpy()
+    first, second = np.triu_indices(len(num_cols), k=1)
+    strength = np.nan_to_num(np.abs(pair_corr[first, second]), nan=-1.0)
+    ranked = np.argsort(-strength, kind='stable')
+
+    if len(ranked):
+        if len(ranked) > 1:
+            max_pairs = st.slider('Scatter pairs to show (strongest correlations first)', 1, len(ranked),
+                                  min(MAX_SCATTER_PAIRS, len(ranked)))
+        else:
+            max_pairs = 1
+        shown = ranked[:max_pairs]
+
+        # All pairs share one figure; large datasets are drawn from a density-preserving sample
+        n_grid_cols = min(SCATTER_GRID_COLUMNS, len(shown))
+        n_grid_rows = -(-len(shown) // n_grid_cols)
+        grid_size = (4 * n_grid_cols, 3.5 * n_grid_rows)
+        with renderer.subplots(n_grid_rows, n_grid_cols, figsize=grid_size, squeeze=False) as (fig, axes):
+            for ax, pair in zip(axes.flat, shown):
+                col1, col2 = num_cols[first[pair]], num_cols[second[pair]]
+                points = downsample(df, col1, col2)
+                ax.scatter(points[col1], points[col2], s=6, alpha=0.5, rasterized=True)
+                ax.set_xlabel(col1)
+                ax.set_ylabel(col2)
+                ax.set_title(f'{col1} vs {col2} (r = {pair_corr[first[pair], second[pair]]:.2f})', fontsize=10)
+            for ax in axes.flat[len(shown):]:
+                ax.set_visible(False)
+            fig.tight_layout()
+        st.caption(f'Showing {len(shown)} of {len(ranked)} pairs.')
+
+
+    # 7. Identifying and Handling Outliers - one pipeline over a single numeric array: column
+    # statistics are computed once and each selected treatment runs as whole-array operations
     st.subheader('Outlier Detection')
+    treatments = st.multiselect('Outlier treatments', list(TREATMENTS), default=list(TREATMENTS),
+                                format_func=TREATMENTS.get)
+    chain = st.checkbox('Chain the treatments into one frame', value=False)
+    treated = treat_outliers(df, treatments, chain=chain)
+    frames = treated['frames']
 
     # Z-Score method
     st.subheader('Outlier Detection using Z-Score')
-    z_scores = np.abs(stats.zscore(df.select_dtypes(include=[np.number])))
-    outliers_zscore = (z_scores > 3).sum(axis=0)
     st.write('Number of outliers detected using Z-Score:')
-    st.write(outliers_zscore)
+    st.write(treated['outlier_counts'])
 
-    
     # Handling Outliers
     st.subheader('Handling Outliers')
 
-    # Remove outliers
-    st.write('Removing Outliers...')
-    df_no_outliers = df.copy()
-    df_no_outliers = df_no_outliers[~((z_scores > 3).any(axis=1))]
+    if 'chained' in frames:
+        st.write('Applying in order: ' + '; '.join(TREATMENTS[t] for t in TREATMENTS if t in treatments))
+        st.write('Data shape before treatment:', df.shape)
+        st.write('Data shape after treatment:', frames['chained'].shape)
+        st.write('Data after treatment:')
+        st.write(frames['chained'].head())
 
-    st.write('Data shape before removing outliers:', df.shape)
-    st.write('Data shape after removing outliers:', df_no_outliers.shape)
+    # Remove outliers
+    if 'zscore' in frames:
+        st.write('Removing Outliers...')
+        st.write('Data shape before removing outliers:', df.shape)
+        st.write('Data shape after removing outliers:', frames['zscore'].shape)
 
     # Transforming Data (example: log transformation)
-    st.write('Applying log transformation...')
-    df_transformed = df.copy()
-    num_cols = df_transformed.select_dtypes(include=[np.number]).columns
-    for col in num_cols:
-        df_transformed[col] = np.log1p(df_transformed[col])
-    st.write('Data after log transformation:')
-    st.write(df_transformed.head())
+    if 'log1p' in frames:
+        st.write('Applying log transformation...')
+        st.write('Data after log transformation:')
+        st.write(frames['log1p'].head())
 
     # Winsorizing
-    st.write('Winsorizing...')
-    from scipy.stats.mstats import winsorize
-    df_winsorized = df.copy()
-    for col in num_cols:
-        df_winsorized[col] = winsorize(df_winsorized[col], limits=[0.05, 0.05])
-    st.write('Data after winsorizing:')
-    st.write(df_winsorized.head())
+    if 'winsorize' in frames:
+        st.write('Winsorizing...')
+        st.write('Data after winsorizing:')
+        st.write(frames['winsorize'].head())
+
+    st.write('Time per step (ms):')
+    st.write(pd.Series(treated['timings'], name='ms') * 1000)
+
+    # The summary describes the winsorized data (or the chained result, or the data as loaded)
+    df_summary = frames.get('chained', frames.get('winsorize', df))
 
 
 
     # 3. Data Summary - Generate descriptive statistics for the data, including mean, median, 
     # standard deviation, and quartiles, to understand the central tendency and spread of the data.
     st.subheader('Summary Statistics')
-    st.write(df_winsorized.describe())
+    st.write(df_summary.describe())
 
     #4. Data Information - check the data types of each column, 
     # the number of non-null values, and memory usage.
     st.subheader('Data Info')
     buffer = io.StringIO()
-    df_winsorized.info(buf=buffer) #writes the DataFrame's information to the buffer.
+    df_summary.info(buf=buffer) #writes the DataFrame's information to the buffer.
     s = buffer.getvalue()
     st.text(s) #displays the string content in Streamlit.
+
+    # Figure memory for this session (raster buffers at Streamlit's render resolution)
+    figure_memory = renderer.memory_stats()
+    st.caption(f"Figures rendered this session: {figure_memory['figures_rendered']} "
+               f"({figure_memory['bytes_rendered'] / 1024 ** 2:.0f} MB of raster data), "
+               f"peak held at once: {figure_memory['peak_live_bytes'] / 1024 ** 2:.1f} MB")
@@ -0,0 +1,150 @@
+"""Headless batch reports for a directory of student CSV files.
+
+Runs the same computations as the dashboard (analysis.py) over every CSV
+in a directory using a process pool and writes one JSON and/or HTML
+report per file, plus an index of all runs.
+
+Usage:
+    python batch_report.py data/ reports/ --format both --workers 8
+"""
+import argparse
+import glob
+import html
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from analysis import build_report
+from data_loader import parse_dataset
+
+
+def to_jsonable(value):
+    """Convert report values (pandas/NumPy objects) into JSON-serializable ones."""
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, pd.DataFrame):
+        return {str(index): to_jsonable(row.to_dict()) for index, row in value.iterrows()}
+    if isinstance(value, pd.Series):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (np.integer, np.bool_)):
+        return value.item()
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    return value
+
+
+def to_html(name, report):
+    """Render a report as a standalone HTML page of tables."""
+    sections = []
+    for key, value in report.items():
+        title = html.escape(key.replace('_', ' ').title())
+        if isinstance(value, pd.DataFrame):
+            body = value.to_html(float_format=lambda x: f"{x:.3f}", border=0)
+        elif isinstance(value, pd.Series):
+            body = value.to_frame().to_html(float_format=lambda x: f"{x:.3f}", border=0)
+        elif isinstance(value, dict) and all(isinstance(v, (pd.Series, pd.DataFrame)) for v in value.values()):
+            body = ''.join(
+                f"<h3>{html.escape(str(k))}</h3>"
+                + (v.to_frame() if isinstance(v, pd.Series) else v).to_html(float_format=lambda x: f"{x:.3f}", border=0)
+                for k, v in value.items()
+            )
+        else:
+            body = f"<pre>{html.escape(json.dumps(to_jsonable(value), indent=2))}</pre>"
+        sections.append(f"<h2>{title}</h2>\n{body}")
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Student Performance Report - {html.escape(name)}</title>
+<style>
+    body {{ font-family: sans-serif; margin: 2rem; color: #333; }}
+    table {{ border-collapse: collapse; margin-bottom: 1rem; }}
+    th, td {{ padding: 0.25rem 0.75rem; text-align: right; border-bottom: 1px solid #ddd; }}
+    h2 {{ border-left: 4px solid #1f77b4; padding-left: 0.5rem; }}
+</style>
+</head>
+<body>
+<h1>Student Performance Report - {html.escape(name)}</h1>
+{chr(10).join(sections)}
+</body>
+</html>
+"""
+
+
+def process_file(path, output_dir, formats):
+    """Build and write the report for one CSV file. Runs in a worker process."""
+    started = time.perf_counter()
+    name = os.path.splitext(os.path.basename(path))[0]
+    with open(path, 'rb') as f:
+        df, rejected_rows = parse_dataset(f.read())
+
+    report = build_report(df)
+    outputs = []
+    if 'json' in formats:
+        json_path = os.path.join(output_dir, f"{name}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'file': path, 'rows': len(df), 'rejected_rows': rejected_rows, **to_jsonable(report)}, f, indent=2)
+        outputs.append(json_path)
+    if 'html' in formats:
+        html_path = os.path.join(output_dir, f"{name}.html")
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(to_html(name, report))
+        outputs.append(html_path)
+
+    return {
+        'file': path,
+        'rows': len(df),
+        'rejected_rows': rejected_rows,
+        'outputs': outputs,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+
+
+def run(input_dir, output_dir, formats=('json', 'html'), workers=None, pattern='*.csv'):
+    """Report on every file matching ``pattern`` in ``input_dir``; returns the run index."""
+    paths = sorted(glob.glob(os.path.join(input_dir, pattern)))
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(process_file, path, output_dir, formats): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({'file': futures[future], 'error': f"{type(e).__name__}: {e}"})
+
+    results.sort(key=lambda r: r['file'])
+    with open(os.path.join(output_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate student performance reports for a directory of CSV files.")
+    parser.add_argument('input_dir', help="Directory containing semicolon-delimited student CSV files")
+    parser.add_argument('output_dir', help="Directory to write the reports to")
+    parser.add_argument('--format', choices=['json', 'html', 'both'], default='both', help="Report format (default: both)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: number of CPUs)")
+    parser.add_argument('--pattern', default='*.csv', help="File name pattern inside input_dir (default: *.csv)")
+    args = parser.parse_args(argv)
+
+    formats = ('json', 'html') if args.format == 'both' else (args.format,)
+    results = run(args.input_dir, args.output_dir, formats, args.workers, args.pattern)
+
+    failed = [r for r in results if 'error' in r]
+    for r in results:
+        status = f"ERROR {r['error']}" if 'error' in r else f"{r['rows']} rows in {r['seconds']}s"
+        print(f"{r['file']}: {status}")
+    print(f"{len(results) - len(failed)} reports written to {args.output_dir}, {len(failed)} failed")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""Benchmarks for the dashboard's computational hot paths.
+
+Generates synthetic student datasets with the student.txt schema at
+several sizes and times each stage separately: CSV parsing, derived
+columns, filter masks, the Overview metrics, correlation, grouped
+aggregates, the grade cube, quantiles, histograms, density estimates,
+outlier treatment, Plotly figure construction and the app.py EDA script
+end to end. Every stage is timed on the same data and the results are
+written to a JSON report. Passing an earlier report with --compare flags
+stages that got slower.
+
+Usage:
+    python benchmark.py --sizes 1000,100000,1000000,10000000 --output benchmark.json
+    python benchmark.py --sizes 1000,100000 --compare benchmark.json
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import logging
+import os
+import platform
+import runpy
+import statistics
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from analysis import BOXPLOT_FEATURES
+from correlation import compute_correlation
+from cube import GradeCube
+from data_loader import add_derived_columns
+from descriptive_stats import compute_statistics
+from filter_engine import FilterEngine
+from grouping import GroupedAggregates
+from histograms import compute_histograms
+from kde import estimate_densities
+from metrics_engine import IncrementalMetrics, MetricsKernel
+from outliers import treat_outliers
+from schema import BOOLEAN_COLUMNS, CATEGORICAL_COLUMNS, INTEGER_COLUMNS, read_student_csv
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000, 10_000_000]
+
+# app.py renders a histogram, density and box plot per numeric column (the box plots after a
+# per-value type check) plus the scatter grid, so it only runs (once) up to this size
+APP_MAX_ROWS = 10_000
+
+# Column order of student-mat.csv
+CSV_COLUMNS = ['school', 'sex', 'age', 'address', 'famsize', 'Pstatus', 'Medu', 'Fedu', 'Mjob', 'Fjob',
+               'reason', 'guardian', 'traveltime', 'studytime', 'failures', 'schoolsup', 'famsup', 'paid',
+               'activities', 'nursery', 'higher', 'internet', 'romantic', 'famrel', 'freetime', 'goout',
+               'Dalc', 'Walc', 'health', 'absences', 'G1', 'G2', 'G3']
+
+# A sidebar state that narrows several filters, and the next Absences slider step
+SELECTION = {
+    'isin': {'school': ['GP', 'MS'], 'sex': ['F', 'M'], 'address': ['R', 'U'], 'internet': [True, False]},
+    'between': {'age': (16, 20), 'Medu': (1, 4), 'Fedu': (0, 4), 'studytime': (1, 4), 'failures': (0, 2),
+                'absences': (0, 30)},
+}
+NEXT_SELECTION = {'isin': SELECTION['isin'], 'between': {**SELECTION['between'], 'absences': (0, 29)}}
+
+# The same state with Age and Absences left at their full range, which the grade cube can answer
+CUBE_SELECTION = {'isin': SELECTION['isin'], 'between': {**SELECTION['between'], 'age': (15, 22), 'absences': (0, 93)}}
+
+
+def synthetic_students(n, seed=0):
+    """``n`` random students as raw CSV columns, within the documented domains.
+
+    Grades are correlated across periods and with study time and past
+    failures, and a few students score 0 in G3, as in the real data.
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    for col, categories in CATEGORICAL_COLUMNS.items():
+        data[col] = np.asarray(categories)[rng.integers(0, len(categories), n)]
+    for col in BOOLEAN_COLUMNS:
+        data[col] = np.where(rng.random(n) < 0.6, 'yes', 'no')
+    for col, (_, low, high) in INTEGER_COLUMNS.items():
+        data[col] = rng.integers(low, high + 1, n)
+
+    data['failures'] = np.minimum(rng.geometric(0.75, n) - 1, 4)
+    data['absences'] = np.minimum(rng.negative_binomial(1, 0.15, n), 93)
+    ability = rng.normal(10.5, 3.0, n) + 0.6 * data['studytime'] - 1.5 * data['failures']
+    data['G1'] = np.clip(np.rint(ability + rng.normal(0, 1.5, n)), 0, 20).astype(np.int64)
+    data['G2'] = np.clip(np.rint(data['G1'] + rng.normal(0, 1.5, n)), 0, 20).astype(np.int64)
+    g3 = np.clip(np.rint(data['G2'] + rng.normal(0, 1.2, n)), 0, 20).astype(np.int64)
+    data['G3'] = np.where(rng.random(n) < 0.04, 0, g3)
+    return pd.DataFrame(data)[CSV_COLUMNS]
+
+
+def synthetic_csv(n, seed=0):
+    """Semicolon-delimited CSV bytes for ``synthetic_students(n, seed)``."""
+    return synthetic_students(n, seed).to_csv(sep=';', index=False).encode()
+
+
+@contextlib.contextmanager
+def _bare_streamlit(upload=None):
+    # Run a Streamlit script outside a server: the uploader returns ``upload`` and log noise is muted
+    import streamlit as st
+
+    file_uploader = st.file_uploader
+    st.file_uploader = lambda *args, **kwargs: None if upload is None else io.BytesIO(upload)
+    logging.disable(logging.WARNING)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+        st.file_uploader = file_uploader
+
+
+def load_dashboard():
+    """Namespace of student_performance.py, run without an upload so only its functions are defined."""
+    with _bare_streamlit():
+        return runpy.run_path(os.path.join(BASE_DIR, 'student_performance.py'), run_name='student_performance')
+
+
+def run_app_script(data):
+    """Run app.py end to end on uploaded CSV bytes."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    with _bare_streamlit(data):
+        runpy.run_path(os.path.join(BASE_DIR, 'app.py'), run_name='app')
+    plt.close('all')
+
+
+def time_stage(fn, repeat, setup=None):
+    """Wall-clock seconds of ``repeat`` calls to ``fn`` (given ``setup()``'s result when set)."""
+    runs = []
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        started = time.perf_counter()
+        fn(*args)
+        runs.append(time.perf_counter() - started)
+    return runs
+
+
+def benchmark_size(n, repeat=3, seed=0, app_max_rows=APP_MAX_ROWS, dashboard=None, log=print):
+    """Time every stage on an ``n``-row synthetic dataset; returns one result dict per stage."""
+    results = []
+
+    def record(stage, fn, setup=None, stage_repeat=repeat):
+        runs = time_stage(fn, stage_repeat, setup)
+        results.append({'rows': n, 'stage': stage, 'best': min(runs), 'median': statistics.median(runs),
+                        'runs': runs})
+        log(f"{n:>10} {stage:<18} {min(runs) * 1000:12.2f} ms")
+
+    started = time.perf_counter()
+    data = synthetic_csv(n, seed)
+    log(f"{n:>10} {'(generate)':<18} {(time.perf_counter() - started) * 1000:12.2f} ms, {len(data) / 1024 ** 2:.1f} MB")
+
+    record('csv_parse', lambda: read_student_csv(data))
+    df, _ = read_student_csv(data)
+    record('derived_columns', lambda: add_derived_columns(df))
+    key = f"benchmark:{n}"
+
+    record('filter_index', lambda: FilterEngine(df, key))
+    engine = FilterEngine(df, key)
+    record('filter_mask', lambda fresh: fresh.mask(**SELECTION), setup=lambda: FilterEngine(df, key))
+    mask = engine.mask(**SELECTION)
+    record('filter_apply', lambda: df[mask])
+    filtered_df = df[mask]
+
+    record('metrics_kernel', lambda: MetricsKernel(df))
+    kernel = MetricsKernel(df)
+    record('metrics_full', lambda: kernel.metrics(kernel.totals(mask)))
+    next_mask = engine.mask(**NEXT_SELECTION)
+
+    def primed():
+        metrics = IncrementalMetrics(kernel)
+        metrics.update(mask)
+        return metrics
+    record('metrics_delta', lambda metrics: metrics.update(next_mask), setup=primed)
+
+    record('correlation', lambda: compute_correlation(filtered_df))
+    record('groupby', lambda: GroupedAggregates(filtered_df).compute_all())
+    record('cube_build', lambda: GradeCube(df))
+    cube = GradeCube(df)
+
+    def cube_query():
+        view = cube.view(**CUBE_SELECTION)
+        for by in ['studytime', ['school', 'sex'], ['address', 'sex'], 'Medu', 'Fedu']:
+            view.stat(by, 'Average_Grade')
+    record('cube_query', cube_query)
+    record('quantiles', lambda: compute_statistics(filtered_df))
+    record('histograms', lambda: compute_histograms(filtered_df, by='sex'))
+    num_cols = filtered_df.select_dtypes(include=[np.number]).columns
+    record('kde', lambda: estimate_densities(filtered_df, num_cols))
+    record('outliers', lambda: treat_outliers(filtered_df))
+
+    # Dashboard figure builders, each call under a fresh key so no service cache is hit
+    if dashboard is None:
+        dashboard = load_dashboard()
+    calls = iter(range(sys.maxsize))
+
+    def figures():
+        figure_key = f"{key}:figures:{next(calls)}"
+        dashboard['build_performance_figures'](figure_key, filtered_df)
+        dashboard['build_correlation_figures'](figure_key, filtered_df)
+        dashboard['build_key_question_figures'](figure_key, filtered_df)
+        dashboard['build_box_figure'](filtered_df, figure_key, BOXPLOT_FEATURES)
+        dashboard['build_study_scatter_figure'](filtered_df, figure_key)
+    record('figures', figures)
+
+    if n <= app_max_rows:
+        record('app_eda', lambda: run_app_script(data), stage_repeat=1)
+    else:
+        results.append({'rows': n, 'stage': 'app_eda', 'skipped': f"more than {app_max_rows} rows"})
+        log(f"{n:>10} {'app_eda':<18} {'skipped':>12}")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Stages whose best time exceeds the baseline report's by more than ``tolerance`` (a ratio)."""
+    previous = {(r['rows'], r['stage']): r['best'] for r in baseline['results'] if 'best' in r}
+    slower = []
+    for r in results:
+        before = previous.get((r['rows'], r['stage']))
+        if 'best' in r and before and r['best'] > before * tolerance:
+            slower.append({'rows': r['rows'], 'stage': r['stage'], 'before': before, 'after': r['best'],
+                           'ratio': r['best'] / before})
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the dashboard's hot paths on synthetic student data.")
+    parser.add_argument('--sizes', default=','.join(str(n) for n in DEFAULT_SIZES),
+                        help="Comma-separated dataset sizes in rows (default: 1k, 100k, 1M, 10M)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per stage; the report keeps all of them (default: 3)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the synthetic data (default: 0)")
+    parser.add_argument('--app-max-rows', type=int, default=APP_MAX_ROWS,
+                        help=f"Largest size the app.py stage runs on (default: {APP_MAX_ROWS})")
+    parser.add_argument('--output', default='benchmark.json', help="JSON report path (default: benchmark.json)")
+    parser.add_argument('--compare', help="Earlier JSON report to compare against")
+    parser.add_argument('--tolerance', type=float, default=1.2,
+                        help="Slowdown ratio reported as a regression with --compare (default: 1.2)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    dashboard = load_dashboard()
+    results = []
+    for n in sizes:
+        results.extend(benchmark_size(n, args.repeat, args.seed, args.app_max_rows, dashboard))
+
+    report = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'results': results,
+    }
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            slower = compare(results, json.load(f), args.tolerance)
+        report['regressions'] = slower
+        for r in slower:
+            print(f"SLOWER {r['rows']} rows {r['stage']}: {r['before'] * 1000:.2f} ms -> {r['after'] * 1000:.2f} ms ({r['ratio']:.2f}x)")
+        status = 1 if slower else 0
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"{len(results)} stage timings written to {args.output}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Correlation matrix shared by every dashboard tab.
+
+The Pearson matrix over all numeric columns is computed once per filtered
+view and cached under the filter-state fingerprint, so the heatmap, the
+feature-importance chart, the Key Questions answers and the insight
+boxes all read from the same result.
+"""
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+
+# Number of filter states whose correlation matrix is kept in memory
+MAX_CACHED_MATRICES = 16
+
+_corr_cache = LRUCache(MAX_CACHED_MATRICES)
+
+
+def compute_correlation(df):
+    """Pearson correlation matrix of the numeric columns of ``df``."""
+    numeric_df = df.select_dtypes(include=[np.number])
+    values = numeric_df.to_numpy(dtype=np.float64)
+    if np.isnan(values).any():
+        # Pairwise-complete observations, as DataFrame.corr does
+        return numeric_df.corr()
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        matrix = np.corrcoef(values, rowvar=False)
+    matrix = np.atleast_2d(matrix)
+    return pd.DataFrame(matrix, index=numeric_df.columns, columns=numeric_df.columns)
+
+
+def correlation_matrix(df, fingerprint=None):
+    """Correlation matrix for a filtered view, cached by its fingerprint.
+
+    ``fingerprint`` identifies the filter state (see
+    ``filter_engine.mask_fingerprint``); without one the matrix is computed
+    and not cached. The cached frame is shared (see ``cache_utils``).
+    """
+    if fingerprint is None:
+        return compute_correlation(df)
+
+    return _corr_cache.get_or_compute(fingerprint, lambda: compute_correlation(df))
+
+
+def strong_correlation_pairs(corr, threshold=0.5, top_k=None, sign=None):
+    """Feature pairs whose absolute correlation exceeds ``threshold``.
+
+    Reads the upper triangle of ``corr`` (diagonal excluded) in one
+    vectorized pass and returns a DataFrame with ``feature_1``,
+    ``feature_2`` and ``correlation`` sorted by absolute correlation,
+    strongest first. ``sign`` (1 or -1) keeps only positive or negative
+    correlations; ``top_k`` limits the result to the k strongest pairs.
+    """
+    columns = np.asarray(corr.columns)
+    rows, cols = np.triu_indices(len(columns), k=1)
+    values = corr.to_numpy()[rows, cols]
+    strength = np.abs(values) if sign is None else sign * values
+
+    with np.errstate(invalid='ignore'):
+        keep = np.flatnonzero(strength > threshold)
+    if top_k is not None and top_k < len(keep):
+        keep = keep[np.argpartition(-strength[keep], top_k - 1)[:top_k]]
+    keep = keep[np.argsort(-strength[keep], kind='stable')]
+
+    return pd.DataFrame({
+        'feature_1': columns[rows[keep]],
+        'feature_2': columns[cols[keep]],
+        'correlation': values[keep],
+    })
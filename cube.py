@@ -0,0 +1,195 @@
+"""Precomputed grade cube over the low-cardinality filter dimensions.
+
+At ingest every row is assigned to one cell of the school × sex × address
+× Medu × Fedu × studytime × failures × internet grid (12,800 cells for the
+documented value ranges), and each cell stores the row count plus the
+count, sum and sum of squares of G1, G2, G3 and Average_Grade. A sidebar
+selection over these dimensions then becomes boolean masks over the cell
+axes. Group sizes, means and SDs for any group-by come from summing the
+selected cells, so they cost the same for 400 rows or 10 million.
+
+A cube is built once per dataset and cached by its content hash. Rows
+with a missing dimension value are left out; the sidebar filters always
+exclude them too.
+"""
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+from grouping import factorize
+
+DIMENSIONS = ['school', 'sex', 'address', 'Medu', 'Fedu', 'studytime', 'failures', 'internet']
+
+MEASURES = ['G1', 'G2', 'G3', 'Average_Grade']
+
+CUBE_STATISTICS = ['count', 'sum', 'mean', 'std']
+
+# Number of datasets whose cube is kept in memory
+MAX_CACHED_CUBES = 8
+
+_cube_cache = LRUCache(MAX_CACHED_CUBES)
+
+
+class GradeCube:
+    """Sufficient statistics of ``MEASURES`` per cell of the ``DIMENSIONS`` grid.
+
+    ``view`` answers a sidebar selection with an object offering the same
+    ``size``/``table``/``stat`` accessors as ``grouping.GroupedAggregates``,
+    so the ``analysis`` functions accept either.
+    """
+
+    def __init__(self, df, dimensions=DIMENSIONS, measures=MEASURES):
+        self.dimensions = [col for col in dimensions if col in df.columns]
+        self.measures = [col for col in measures if col in df.columns]
+        self.labels = {}
+        codes = []
+        for col in self.dimensions:
+            col_codes, self.labels[col] = factorize(df[col])
+            codes.append(col_codes)
+        self.shape = tuple(len(self.labels[col]) for col in self.dimensions)
+        self.n_rows = len(df)
+
+        complete = np.logical_and.reduce([c >= 0 for c in codes]) if codes else np.ones(len(df), dtype=bool)
+        cells = np.ravel_multi_index([c[complete] for c in codes], self.shape) if codes else np.zeros(int(complete.sum()), dtype=np.int64)
+        n_cells = int(np.prod(self.shape))
+
+        # Layout of the last axis: rows, then (count, sum, sum of squares) per measure
+        slots = [np.bincount(cells, minlength=n_cells)]
+        for col in self.measures:
+            values = df[col].to_numpy(dtype=np.float64)[complete]
+            missing = np.isnan(values)
+            filled = np.where(missing, 0.0, values)
+            slots.append(np.bincount(cells, weights=~missing, minlength=n_cells))
+            slots.append(np.bincount(cells, weights=filled, minlength=n_cells))
+            slots.append(np.bincount(cells, weights=filled * filled, minlength=n_cells))
+        self.cells = np.column_stack(slots).astype(np.float64).reshape(self.shape + (len(slots),))
+
+        # Extents of the other numeric columns, so a range filter covering all their values counts as no filter
+        self._extents = {}
+        for col in df.select_dtypes(include=[np.number]).columns.difference(self.dimensions):
+            values = df[col].to_numpy()
+            if len(values) and not (values.dtype.kind == 'f' and np.isnan(values).any()):
+                self._extents[col] = (values.min(), values.max())
+
+    def _selection(self, col, isin, between):
+        # Boolean mask over the labels of one dimension
+        labels = self.labels[col]
+        mask = np.ones(len(labels), dtype=bool)
+        if col in isin:
+            mask &= labels.isin(list(isin[col]))
+        if col in between:
+            low, high = between[col]
+            values = labels.to_numpy()
+            mask &= (values >= low) & (values <= high)
+        return mask
+
+    def view(self, isin=None, between=None):
+        """Cells matching a sidebar selection, in the form taken by ``FilterEngine.mask``.
+
+        Returns None when the selection restricts a column the cube can't
+        answer for (a non-dimension column, unless a range filter covers
+        every value it holds).
+        """
+        isin = isin or {}
+        between = between or {}
+        if any(col not in self.labels for col in isin):
+            return None
+        for col, (low, high) in between.items():
+            if col not in self.labels:
+                extent = self._extents.get(col)
+                if extent is None or not (low <= extent[0] and high >= extent[1]):
+                    return None
+        masks = [self._selection(col, isin, between) for col in self.dimensions]
+        return CubeView(self, masks)
+
+
+class CubeView:
+    """Group sizes, counts, sums, means and SDs of one selection of a ``GradeCube``."""
+
+    def __init__(self, cube, masks):
+        self._cube = cube
+        self._masks = masks
+        self._results = {}
+
+    def _result(self, by):
+        # (size Series over every label combination, stats table over observed groups)
+        result = self._results.get(by)
+        if result is not None:
+            return result
+
+        cube = self._cube
+        axes = [cube.dimensions.index(col) for col in by]
+        cells = cube.cells
+        # Sum the selected cells over every dimension not grouped by, last axis first so indexes stay valid
+        for axis in sorted(set(range(len(cube.dimensions))) - set(axes), reverse=True):
+            cells = np.compress(self._masks[axis], cells, axis=axis).sum(axis=axis)
+        # Remaining axes are in dimension order; zero unselected labels and move them into ``by`` order
+        for position, axis in enumerate(sorted(axes)):
+            shape = [1] * cells.ndim
+            shape[position] = -1
+            cells = cells * self._masks[axis].reshape(shape)
+        cells = np.moveaxis(cells, list(range(len(axes))), [axes.index(axis) for axis in sorted(axes)])
+
+        # Categorical dimensions list every category; other dimensions only the values present (as in a filtered frame)
+        labels = []
+        for position, col in enumerate(by):
+            col_labels = cube.labels[col]
+            if not isinstance(col_labels, pd.CategoricalIndex):
+                other_axes = tuple(a for a in range(cells.ndim) if a != position)
+                present = cells[..., 0].sum(axis=other_axes[:-1]) > 0
+                cells = np.compress(present, cells, axis=position)
+                col_labels = col_labels[present]
+            labels.append(col_labels)
+        cells = cells.reshape(-1, cells.shape[-1])
+
+        if len(by) == 1:
+            index = labels[0].rename(by[0])
+        else:
+            index = pd.MultiIndex.from_product(labels, names=list(by))
+        rows = cells[:, 0].astype(np.int64)
+        size = pd.Series(rows, index=index)
+
+        observed = rows > 0
+        data = {}
+        for i, value in enumerate(cube.measures):
+            count, total, squares = (cells[observed, 1 + 3 * i + j] for j in range(3))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = total / count
+                variance = np.clip(squares - total * mean, 0, None) / (count - 1)
+            data[(value, 'count')] = count.astype(np.int64)
+            data[(value, 'sum')] = total
+            data[(value, 'mean')] = mean
+            data[(value, 'std')] = np.where(count > 1, np.sqrt(variance), np.nan)
+        table = pd.DataFrame(data, index=index[observed])
+
+        result = (size, table)
+        self._results[by] = result
+        return result
+
+    @staticmethod
+    def _key(by):
+        return (by,) if isinstance(by, str) else tuple(by)
+
+    def size(self, by):
+        """Rows per group, including groups with no rows (as ``value_counts`` on a categorical)."""
+        return self._result(self._key(by))[0]
+
+    def table(self, by):
+        """Statistics per observed group; columns are ``(measure, statistic)`` pairs."""
+        return self._result(self._key(by))[1]
+
+    def stat(self, by, value, statistic='mean'):
+        """One statistic of one measure per observed group, as a Series named ``value``."""
+        return self.table(by)[(value, statistic)].rename(value)
+
+
+def grade_cube(df, dataset_key=None):
+    """Cube for a dataset, cached by its content hash (shared, see ``cache_utils``)."""
+    if dataset_key is None:
+        return GradeCube(df)
+
+    return _cube_cache.get_or_compute(dataset_key, lambda: GradeCube(df))
+
+
+def clear_cache():
+    _cube_cache.clear()
@@ -0,0 +1,89 @@
+"""Dataset loading for the Student Performance dashboard.
+
+Uploaded CSV files are parsed once and cached under a hash of their raw
+bytes, so Streamlit reruns (every widget interaction) and repeat uploads
+of the same file skip parsing and the derived-column step entirely.
+Parsed frames are also written to an on-disk columnar cache (see
+disk_cache.py), so returning users skip CSV parsing after a restart.
+"""
+import hashlib
+
+import disk_cache
+from cache_utils import LRUCache
+from performance_bands import categorize_grades
+from schema import read_student_csv
+
+# Number of parsed datasets kept in memory (least recently used is dropped first)
+MAX_CACHED_DATASETS = 8
+
+# Bytes read at a time when hashing a file without loading it whole
+HASH_BLOCK_BYTES = 1 << 20
+
+_dataset_cache = LRUCache(MAX_CACHED_DATASETS)
+
+
+def read_bytes(source):
+    """Return the raw bytes of an uploaded file, file-like object or bytes."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if hasattr(source, 'getvalue'):
+        return source.getvalue()
+    source.seek(0)
+    return source.read()
+
+
+def content_hash(data):
+    """Stable fingerprint of the uploaded file contents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def stream_hash(source, block_bytes=HASH_BLOCK_BYTES):
+    """``content_hash`` of a file-like object, read block by block and rewound."""
+    digest = hashlib.blake2b(digest_size=16)
+    source.seek(0)
+    for block in iter(lambda: source.read(block_bytes), b''):
+        digest.update(block)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def add_derived_columns(df):
+    """Add the Average_Grade and Performance_Category columns in place."""
+    df['Average_Grade'] = ((df['G1'] + df['G2'] + df['G3']) / 3).round(2)
+    df['Performance_Category'] = categorize_grades(df['G3'])
+    return df
+
+
+def parse_dataset(data):
+    """Parse the student CSV with the column schema and add derived columns.
+
+    Returns ``(df, rejected_rows)``.
+    """
+    df, rejected_rows = read_student_csv(data)
+    return add_derived_columns(df), rejected_rows
+
+
+def _load_or_parse(key, data):
+    entry = disk_cache.load(key)
+    if entry is None:
+        entry = parse_dataset(data)
+        disk_cache.store(key, *entry)
+    return entry
+
+
+def load_dataset(source):
+    """Load an uploaded dataset, reusing the cached frame for identical bytes.
+
+    Returns ``(dataset_key, df, rejected_rows)`` where ``dataset_key`` is the
+    content hash and ``rejected_rows`` counts rows that didn't fit the schema.
+    The frame is shared (see ``cache_utils``); filtering it with a mask
+    returns a copy.
+    """
+    data = read_bytes(source)
+    key = content_hash(data)
+    entry = _dataset_cache.get_or_compute(key, lambda: _load_or_parse(key, data))
+    return (key,) + entry
+
+
+def clear_cache():
+    _dataset_cache.clear()
@@ -0,0 +1,133 @@
+"""Descriptive statistics shared by the summary tables, boxplots and insights.
+
+Count, mean, standard deviation, min/max, quartiles, the 1.5×IQR fences,
+whisker ends and outlier counts for every numeric column are computed in
+one vectorized pass over a 2D array and cached per filter-state
+fingerprint. The ``describe()`` tables, the boxplots (drawn from
+precomputed statistics) and the Key Questions insights all read from the
+same result.
+"""
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+
+# Number of filter states whose statistics are kept in memory
+MAX_CACHED_STATISTICS = 16
+
+DESCRIBE_ROWS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+_stats_cache = LRUCache(MAX_CACHED_STATISTICS)
+
+
+def box_statistics(values):
+    """Boxplot statistics for each column of a 2D array, ignoring NaN.
+
+    Returns a dict of arrays: the ``describe()`` statistics plus ``iqr``,
+    ``lower_fence``/``upper_fence`` (1.5×IQR beyond the quartiles),
+    ``lower_whisker``/``upper_whisker`` (the most extreme values inside the
+    fences) and ``outliers_low``/``outliers_high`` (counts beyond them).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    observed = ~np.isnan(values)
+    count = observed.sum(axis=0)
+    if len(values):
+        with np.errstate(invalid='ignore'):
+            q1, median, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+    else:
+        q1 = median = q3 = np.full(values.shape[1], np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(values, axis=0) / count
+        std = np.sqrt(np.nansum((values - mean) ** 2, axis=0) / (count - 1))
+    std = np.where(count > 1, std, np.nan)
+
+    iqr = q3 - q1
+    lower_fence = q1 - 1.5 * iqr
+    upper_fence = q3 + 1.5 * iqr
+    with np.errstate(invalid='ignore'):
+        below = values < lower_fence
+        above = values > upper_fence
+    has_data = count > 0
+    return {
+        'count': count.astype(np.float64),
+        'mean': mean,
+        'std': std,
+        'min': np.where(has_data, np.min(np.where(observed, values, np.inf), axis=0, initial=np.inf), np.nan),
+        '25%': q1,
+        '50%': median,
+        '75%': q3,
+        'max': np.where(has_data, np.max(np.where(observed, values, -np.inf), axis=0, initial=-np.inf), np.nan),
+        'iqr': iqr,
+        'lower_fence': lower_fence,
+        'upper_fence': upper_fence,
+        'lower_whisker': np.where(has_data, np.min(np.where(observed & ~below, values, np.inf), axis=0, initial=np.inf), np.nan),
+        'upper_whisker': np.where(has_data, np.max(np.where(observed & ~above, values, -np.inf), axis=0, initial=-np.inf), np.nan),
+        'outliers_low': below.sum(axis=0),
+        'outliers_high': above.sum(axis=0),
+    }
+
+
+def compute_statistics(df):
+    """Statistics table (one row per numeric column of ``df``)."""
+    numeric_df = df.select_dtypes(include=[np.number])
+    return pd.DataFrame(box_statistics(numeric_df.to_numpy(dtype=np.float64)), index=numeric_df.columns)
+
+
+def descriptive_statistics(df, fingerprint=None):
+    """Statistics table for a filtered view, cached by its fingerprint.
+
+    Without a fingerprint the table is computed and not cached. The cached
+    frame is shared (see ``cache_utils``).
+    """
+    if fingerprint is None:
+        return compute_statistics(df)
+
+    return _stats_cache.get_or_compute(fingerprint, lambda: compute_statistics(df))
+
+
+def describe_table(stats):
+    """The statistics in the layout of ``DataFrame.describe()``."""
+    return stats[DESCRIBE_ROWS].T
+
+
+def _scale(column_stats, normalize):
+    # Offset and span of the min-max scaling (identity without normalize)
+    if not normalize:
+        return 0.0, 1.0
+    span = column_stats['max'] - column_stats['min']
+    return column_stats['min'], span if span > 0 else 1.0
+
+
+def box_trace_args(column_stats, normalize=False):
+    """Precomputed ``go.Box`` arguments for one row of the statistics table.
+
+    With ``normalize`` the statistics are min-max scaled to 0-1, matching
+    ``analysis.min_max_normalize`` (a constant column maps to 0).
+    """
+    low, span = _scale(column_stats, normalize)
+    return {
+        'q1': [(column_stats['25%'] - low) / span],
+        'median': [(column_stats['50%'] - low) / span],
+        'q3': [(column_stats['75%'] - low) / span],
+        'lowerfence': [(column_stats['lower_whisker'] - low) / span],
+        'upperfence': [(column_stats['upper_whisker'] - low) / span],
+        'mean': [(column_stats['mean'] - low) / span],
+        'sd': [column_stats['std'] / span],
+    }
+
+
+def outlier_values(df, column, column_stats, normalize=False):
+    """Distinct values of ``column`` beyond its fences, with how many students have each.
+
+    Returns counts indexed by value (scaled like ``box_trace_args`` with ``normalize``).
+    """
+    values = df[column]
+    outside = (values < column_stats['lower_fence']) | (values > column_stats['upper_fence'])
+    counts = values[outside].value_counts().sort_index()
+    low, span = _scale(column_stats, normalize)
+    counts.index = (counts.index.to_numpy(dtype=np.float64) - low) / span
+    return counts
+
+
+def clear_cache():
+    _stats_cache.clear()
@@ -0,0 +1,117 @@
+"""On-disk columnar cache of parsed uploads.
+
+Each parsed and typed dataset is written as an uncompressed Feather (Arrow
+IPC) file named after the content hash of the uploaded CSV. Later sessions
+memory-map that file instead of parsing the CSV again. The directory is
+capped in size and the least recently used files are evicted first (file
+modification time is refreshed on every read).
+
+Requires pyarrow; without it the cache is silently disabled.
+"""
+import json
+import os
+import tempfile
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+    feather = None
+
+CACHE_DIR = os.environ.get(
+    'STUDENT_DASHBOARD_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.dataset_cache')
+)
+MAX_CACHE_BYTES = int(os.environ.get('STUDENT_DASHBOARD_CACHE_BYTES', 2 * 1024 ** 3))
+
+# Bump when the schema or derived columns change so stale files are not reused
+CACHE_FORMAT_VERSION = 1
+
+_METADATA_KEY = b'student_dashboard'
+
+
+def enabled():
+    return feather is not None and MAX_CACHE_BYTES > 0
+
+
+def cache_path(key):
+    return os.path.join(CACHE_DIR, f"{key}.v{CACHE_FORMAT_VERSION}.feather")
+
+
+def load(key):
+    """Return ``(df, rejected_rows)`` for a cached upload, or None on a miss."""
+    if not enabled():
+        return None
+    path = cache_path(key)
+    try:
+        table = feather.read_table(path, memory_map=True)
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, pa.ArrowException):
+        _remove(path)
+        return None
+
+    metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b'{}'))
+    df = table.to_pandas(split_blocks=True)
+    return df, metadata.get('rejected_rows', 0)
+
+
+def store(key, df, rejected_rows=0):
+    """Write a parsed dataset to the cache and evict old files over the size cap."""
+    if not enabled():
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_METADATA_KEY] = json.dumps({'rejected_rows': int(rejected_rows)}).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        # Write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        os.close(fd)
+        try:
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, cache_path(key))
+        finally:
+            _remove(tmp_path)
+    except (OSError, pa.ArrowException):
+        return
+    evict()
+
+
+def evict(max_bytes=None):
+    """Delete least recently used cache files until the directory fits ``max_bytes``."""
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    try:
+        entries = [entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith('.feather')]
+    except OSError:
+        return
+    files = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        if _remove(path):
+            total -= size
+
+
+def _remove(path):
+    # Cache failures are never fatal: a file still mapped by another session (Windows) or a
+    # read-only cache directory just leaves the file in place
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,71 @@
+"""Server-side point reduction for large scatter plots.
+
+Above ``SCATTER_POINT_LIMIT`` rows a scatter is drawn from a
+density-preserving sample: every occupied grid cell keeps at least one
+point, so outliers stay visible, and the rest of the budget follows each
+cell's row count. Zooming to a window re-samples only the rows inside it.
+"""
+import os
+
+import numpy as np
+
+SCATTER_POINT_LIMIT = int(os.environ.get('STUDENT_DASHBOARD_SCATTER_POINTS', 5000))
+
+# Upper bound on grid cells per axis; also capped so at most half the budget goes to the one-per-cell minimum
+GRID_SIZE = 64
+
+
+def _grid_codes(values, size):
+    # Equal-width cell index per value; NaN falls into the first cell
+    low, high = np.nanmin(values), np.nanmax(values)
+    if not high > low:
+        return np.zeros(len(values), dtype=np.int64)
+    codes = np.floor((values - low) / (high - low) * size)
+    return np.clip(np.nan_to_num(codes), 0, size - 1).astype(np.int64)
+
+
+def in_window(df, x, y, x_range=None, y_range=None):
+    """Rows of ``df`` whose ``x`` and ``y`` values fall inside the given (inclusive) ranges."""
+    mask = np.ones(len(df), dtype=bool)
+    for col, value_range in [(x, x_range), (y, y_range)]:
+        if value_range is not None:
+            values = df[col].to_numpy()
+            mask &= (values >= value_range[0]) & (values <= value_range[1])
+    return df if mask.all() else df[mask]
+
+
+def downsample(df, x, y, max_points=None, seed=0):
+    """Density-preserving sample of at most ``max_points`` rows (all rows if there are fewer).
+
+    The sample is deterministic for a given frame and keeps the original row order.
+    """
+    max_points = SCATTER_POINT_LIMIT if max_points is None else max_points
+    n = len(df)
+    if n <= max_points:
+        return df
+
+    size = max(1, min(GRID_SIZE, int(np.sqrt(max_points / 2))))
+    cells = (_grid_codes(df[x].to_numpy(dtype=np.float64), size) * size
+             + _grid_codes(df[y].to_numpy(dtype=np.float64), size))
+    counts = np.bincount(cells, minlength=size * size)
+
+    # One point per occupied cell, the rest of the budget proportional to cell counts
+    occupied = int((counts > 0).sum())
+    budget = max(max_points - occupied, 0)
+    extra = np.floor((counts - 1).clip(min=0) * budget / max(n - occupied, 1))
+    quota = np.where(counts > 0, 1 + extra, 0).astype(np.int64)
+
+    # Rank rows in a random order within each cell and keep the first ``quota``
+    rng = np.random.default_rng(seed)
+    order = np.lexsort((rng.random(n), cells))
+    sorted_cells = cells[order]
+    cell_start = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.arange(n) - cell_start[sorted_cells]
+    keep = np.sort(order[rank < quota[sorted_cells]])
+    return df.iloc[keep]
+
+
+def reduce_scatter(df, x, y, x_range=None, y_range=None, max_points=None):
+    """Rows to draw for an ``x`` vs ``y`` scatter and the number of rows they stand for."""
+    window = in_window(df, x, y, x_range, y_range)
+    return downsample(window, x, y, max_points), len(window)
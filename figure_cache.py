@@ -0,0 +1,39 @@
+"""Memoized Plotly figures shared across reruns and sessions.
+
+A figure is keyed on the function that builds it, that function's
+parameters (the chart's widget choices) and the fingerprint of the frame
+it plots. A rerun that changes neither the filters nor a chart's widgets
+gets the cached figure back instead of rebuilding it. The cache is bounded
+and evicts the least recently used figure.
+"""
+from cache_utils import LRUCache
+
+MAX_CACHED_FIGURES = 128
+
+_figure_cache = LRUCache(MAX_CACHED_FIGURES)
+
+
+def _freeze(value):
+    # Widget values arrive as lists; make them usable in a dict key
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def cached_figure(build, df, fingerprint, **params):
+    """Return ``build(df, **params)``, reusing the figure built for the same frame and parameters.
+
+    ``fingerprint`` must identify the contents of ``df`` (the filter engine's
+    fingerprint for the filtered frame). Cached figures are shared (see
+    ``cache_utils``).
+    """
+    key = (build.__module__, build.__qualname__, fingerprint, _freeze(params))
+    return _figure_cache.get_or_compute(key, lambda: build(df, **params))
+
+
+def clear_cache():
+    _figure_cache.clear()
@@ -0,0 +1,105 @@
+"""Matplotlib figure lifecycle for Streamlit pages.
+
+Figures made with ``plt.subplots`` are registered with pyplot and stay in
+memory until ``plt.close``; app.py never closed them, so a long-running
+server grew with every session. Here figures are created directly on
+Agg canvases, outside pyplot, and handed out from a process-wide pool.
+``FigureRenderer.subplots`` renders the figure once the drawing block
+finishes, then clears it and returns it to the pool, so the next chart
+reuses the same canvas. Each session's renderer counts the figures it
+rendered and the raster memory they held.
+"""
+import contextlib
+import threading
+
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Idle figures kept for reuse across all sessions
+MAX_POOLED_FIGURES = 8
+
+# Resolution Streamlit renders figures at (``st.pyplot`` default)
+RENDER_DPI = 200
+
+
+class FigurePool:
+    """Thread-safe pool of cleared Agg figures."""
+
+    def __init__(self, max_figures=MAX_POOLED_FIGURES):
+        self.max_figures = max_figures
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self, figsize=None):
+        with self._lock:
+            fig = self._idle.pop() if self._idle else None
+        if fig is None:
+            fig = Figure()
+            FigureCanvasAgg(fig)
+        fig.set_size_inches(figsize or rcParams['figure.figsize'])
+        return fig
+
+    def release(self, fig):
+        """Clear ``fig`` and keep it for reuse (dropped if the pool is full)."""
+        fig.clear()
+        with self._lock:
+            if len(self._idle) < self.max_figures:
+                self._idle.append(fig)
+
+    def __len__(self):
+        return len(self._idle)
+
+
+_shared_pool = FigurePool()
+
+
+def raster_bytes(fig, dpi=RENDER_DPI):
+    """RGBA buffer size of ``fig`` rendered at ``dpi``."""
+    width, height = fig.get_size_inches()
+    return int(width * dpi) * int(height * dpi) * 4
+
+
+class FigureRenderer:
+    """Pooled figures for one session, rendered with ``render`` (e.g. ``st.pyplot``)."""
+
+    def __init__(self, render, pool=None):
+        self.render = render
+        self.pool = _shared_pool if pool is None else pool
+        self.figures_rendered = 0
+        self.bytes_rendered = 0
+        self.live_figures = 0
+        self.live_bytes = 0
+        self.peak_live_bytes = 0
+
+    @contextlib.contextmanager
+    def subplots(self, nrows=1, ncols=1, figsize=None, **kwargs):
+        """``(fig, axes)`` like ``plt.subplots``; rendered and recycled when the block exits.
+
+        The figure is not rendered if the block raises.
+        """
+        fig = self.pool.acquire(figsize)
+        size = raster_bytes(fig)
+        self.live_figures += 1
+        self.live_bytes += size
+        self.peak_live_bytes = max(self.peak_live_bytes, self.live_bytes)
+        try:
+            yield fig, fig.subplots(nrows, ncols, **kwargs)
+            self.render(fig)
+            self.figures_rendered += 1
+            self.bytes_rendered += size
+        finally:
+            self.live_figures -= 1
+            self.live_bytes -= size
+            self.pool.release(fig)
+
+    def memory_stats(self):
+        """Figure counters for this session (byte counts are RGBA buffers at ``RENDER_DPI``)."""
+        return {
+            'figures_rendered': self.figures_rendered,
+            'bytes_rendered': self.bytes_rendered,
+            'live_figures': self.live_figures,
+            'live_bytes': self.live_bytes,
+            'peak_live_bytes': self.peak_live_bytes,
+            'pooled_figures': len(self.pool),
+        }
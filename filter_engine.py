@@ -0,0 +1,105 @@
+"""Precomputed filter masks for the dashboard sidebar.
+
+Low-cardinality columns get one boolean bitmap per distinct value and the
+continuous range columns get a sorted index, both built once per dataset.
+Each sidebar filter keeps its last selection and mask, so a rerun where
+one widget changed only re-evaluates that predicate and ANDs the cached
+masks together.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# Columns filtered by multiselect or by a slider over a handful of values
+BITMAP_COLUMNS = ['school', 'sex', 'address', 'internet', 'Medu', 'Fedu', 'studytime', 'failures']
+
+# Columns filtered by a range slider over many distinct values
+SORTED_COLUMNS = ['age', 'absences']
+
+
+class FilterEngine:
+    def __init__(self, df, dataset_key=None, bitmap_columns=BITMAP_COLUMNS, sorted_columns=SORTED_COLUMNS):
+        self.df = df
+        self.dataset_key = dataset_key
+        self.n_rows = len(df)
+        self.bitmaps = {}
+        self.sorted_index = {}
+        self.last_mask = None
+        self.fingerprint = None
+        self._filter_cache = {}
+
+        for col in bitmap_columns:
+            if col in df.columns:
+                codes, uniques = pd.factorize(df[col], sort=True)
+                self.bitmaps[col] = {value: codes == code for code, value in enumerate(uniques)}
+
+        for col in sorted_columns:
+            if col in df.columns:
+                values = df[col].to_numpy()
+                order = np.argsort(values, kind='stable')
+                self.sorted_index[col] = (values[order], order)
+
+    def _isin_mask(self, col, values):
+        bitmaps = self.bitmaps.get(col)
+        if bitmaps is None:
+            return self.df[col].isin(values).to_numpy()
+        mask = np.zeros(self.n_rows, dtype=bool)
+        for value in set(values):
+            bitmap = bitmaps.get(value)
+            if bitmap is not None:
+                mask |= bitmap
+        return mask
+
+    def _between_mask(self, col, low, high):
+        if col in self.sorted_index:
+            sorted_values, order = self.sorted_index[col]
+            start = np.searchsorted(sorted_values, low, side='left')
+            stop = np.searchsorted(sorted_values, high, side='right')
+            mask = np.zeros(self.n_rows, dtype=bool)
+            mask[order[start:stop]] = True
+            return mask
+        if col in self.bitmaps:
+            return self._isin_mask(col, [v for v in self.bitmaps[col] if low <= v <= high])
+        values = self.df[col]
+        return ((values >= low) & (values <= high)).to_numpy()
+
+    def _cached_mask(self, name, selection, build):
+        cached = self._filter_cache.get(name)
+        if cached is not None and cached[0] == selection:
+            return cached[1]
+        mask = build()
+        self._filter_cache[name] = (selection, mask)
+        return mask
+
+    def mask(self, isin=None, between=None):
+        """Combined boolean mask for the given sidebar selections.
+
+        ``isin`` maps a column to the list of allowed values (multiselect
+        filters); ``between`` maps a column to an inclusive ``(low, high)``
+        range (slider filters).
+        """
+        masks = []
+        for col, values in (isin or {}).items():
+            selection = tuple(sorted(values, key=str))
+            masks.append(self._cached_mask(('isin', col), selection, lambda: self._isin_mask(col, values)))
+        for col, (low, high) in (between or {}).items():
+            masks.append(self._cached_mask(('between', col), (low, high), lambda: self._between_mask(col, low, high)))
+
+        if masks:
+            combined = np.logical_and.reduce(masks)
+        else:
+            combined = np.ones(self.n_rows, dtype=bool)
+        self.last_mask = combined
+        self.fingerprint = mask_fingerprint(self.dataset_key, combined)
+        return combined
+
+    def apply(self, isin=None, between=None):
+        """Filtered copy of the dataset for the given selections."""
+        return self.df[self.mask(isin=isin, between=between)]
+
+
+def mask_fingerprint(dataset_key, mask):
+    """Key identifying a filtered view: the dataset hash plus a hash of the row mask."""
+    digest = hashlib.blake2b(np.packbits(mask).tobytes(), digest_size=12).hexdigest()
+    return f"{dataset_key}:{digest}"
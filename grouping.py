@@ -0,0 +1,247 @@
+"""Grouped aggregation over factorized codes.
+
+Every grouping column (categoricals, yes/no flags and the 8-bit ordinal
+scales) is reduced to integer codes once. For the small-range integer
+value columns (grades, study time, failures, absences) a single
+``np.bincount`` builds a group × value count table, from which count, sum,
+mean, SD, min and max follow exactly. Other value columns (Average_Grade)
+use bincount sums and ``reduceat`` over rows sorted by code; their sums
+are added in a different order than pandas', so a mean can differ from
+``groupby`` in the last bit and, rounded to two decimals, on a tie. Pairs of grouping columns
+(such as school × sex) combine the stored codes instead of grouping
+again. One engine is cached per filter state, with every single
+column precomputed, so switching the categorical analysis selectbox only
+reads tables.
+"""
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+
+# Columns summarized for every group
+VALUE_COLUMNS = ['Average_Grade', 'G1', 'G2', 'G3', 'studytime', 'failures', 'absences']
+
+STATISTICS = ['count', 'sum', 'mean', 'std', 'min', 'max']
+
+# Integer value columns spanning at most this many values are summarized from a count table
+MAX_COUNT_TABLE_RANGE = 256
+
+# Number of filter states whose engine is kept in memory
+MAX_CACHED_ENGINES = 16
+
+_engine_cache = LRUCache(MAX_CACHED_ENGINES)
+
+
+def factorize(series):
+    """Integer codes (-1 for missing) and the matching group labels."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(dtype=np.int64), pd.CategoricalIndex(series.cat.categories, dtype=series.dtype)
+    codes, labels = pd.factorize(series, sort=True)
+    return codes.astype(np.int64), pd.Index(labels, dtype=series.dtype)
+
+
+class _ValueColumn:
+    """One value column prepared once for every grouping."""
+
+    def __init__(self, values):
+        missing = np.isnan(values)
+        self.missing = missing if missing.any() else None
+        self.filled = values if self.missing is None else np.where(missing, 0.0, values)
+        observed = values if self.missing is None else values[~missing]
+        self.values = values
+        # Offsets from the minimum for small-range integer columns, else None
+        self.offsets = None
+        self.low = observed.min() if len(observed) else 0.0
+        self.span = int(observed.max() - self.low) + 1 if len(observed) else 0
+        if len(observed) and self.span <= MAX_COUNT_TABLE_RANGE and np.array_equal(observed, np.round(observed)):
+            self.offsets = (self.filled - self.low).astype(np.int64)
+
+
+def _integer_statistics(codes, n_groups, column):
+    # Every statistic of a small-range integer column from its (group, value) count table
+    keys = codes * column.span + column.offsets
+    if column.missing is not None:
+        keys = keys[~column.missing]
+    table = np.bincount(keys, minlength=n_groups * column.span).reshape(n_groups, column.span)
+    values = column.low + np.arange(column.span, dtype=np.float64)
+    count = table.sum(axis=1).astype(np.float64)
+    total = table @ values
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        m2 = (table * (values - mean[:, None]) ** 2).sum(axis=1)
+        std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+    occupied = table > 0
+    has_values = count > 0
+    low = column.low + np.argmax(occupied, axis=1)
+    high = column.low + column.span - 1 - np.argmax(occupied[:, ::-1], axis=1)
+    return count, total, mean, std, np.where(has_values, low, np.nan), np.where(has_values, high, np.nan)
+
+
+def _group_extremes_by_sorting(codes, n_groups, column, order, size):
+    # Per-group min/max from runs of rows sorted by group code
+    present = np.flatnonzero(size)
+    low = np.full(n_groups, np.nan)
+    high = np.full(n_groups, np.nan)
+    if not len(present):
+        return low, high
+    starts = (np.cumsum(size) - size)[present]
+    ordered = column.values[order]
+    if column.missing is None:
+        low[present] = np.minimum.reduceat(ordered, starts)
+        high[present] = np.maximum.reduceat(ordered, starts)
+    else:
+        missing = column.missing[order]
+        low[present] = np.minimum.reduceat(np.where(missing, np.inf, ordered), starts)
+        high[present] = np.maximum.reduceat(np.where(missing, -np.inf, ordered), starts)
+    return np.where(np.isinf(low), np.nan, low), np.where(np.isinf(high), np.nan, high)
+
+
+def _float_statistics(codes, n_groups, column, size, order):
+    # Sums by bincount, squared deviations from the group means, min/max from runs sorted by group
+    if column.missing is None:
+        count = size.astype(np.float64)
+    else:
+        count = np.bincount(codes, weights=~column.missing, minlength=n_groups)
+    total = np.bincount(codes, weights=column.filled, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        deviation = column.values - mean[codes]
+        if column.missing is not None:
+            deviation[column.missing] = 0.0
+        m2 = np.bincount(codes, weights=deviation * deviation, minlength=n_groups)
+        std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+    low, high = _group_extremes_by_sorting(codes, n_groups, column, order(), size)
+    return count, total, mean, std, low, high
+
+
+def _aggregate(codes, n_groups, columns):
+    """Statistics of every prepared value column for each code in ``0..n_groups-1``.
+
+    Rows with a negative code (missing group) are ignored, as are missing
+    values. Returns ``(size, stats)`` where ``size`` counts rows per group
+    and ``stats`` maps each statistic to an ``(n_groups, n_values)`` array.
+    """
+    if (codes < 0).any():
+        # Missing group labels: give them their own code and drop it afterwards
+        size, stats = _aggregate(np.where(codes < 0, n_groups, codes), n_groups + 1, columns)
+        return size[:n_groups], {name: values[:n_groups] for name, values in stats.items()}
+
+    size = np.bincount(codes, minlength=n_groups)
+    stats = {name: np.empty((n_groups, len(columns))) for name in STATISTICS}
+    sorted_order = []
+
+    def order():
+        # Rows sorted by group, computed on first use (radix sort on the small integer codes)
+        if not sorted_order:
+            sort_dtype = np.int16 if n_groups <= np.iinfo(np.int16).max else np.int64
+            sorted_order.append(np.argsort(codes.astype(sort_dtype), kind='stable'))
+        return sorted_order[0]
+
+    for i, column in enumerate(columns):
+        if column.offsets is not None:
+            results = _integer_statistics(codes, n_groups, column)
+        else:
+            results = _float_statistics(codes, n_groups, column, size, order)
+        for name, values in zip(STATISTICS, results):
+            stats[name][:, i] = values
+    return size, stats
+
+
+class GroupedAggregates:
+    """Per-group statistics of ``VALUE_COLUMNS`` for the grouping columns of one frame.
+
+    ``group_columns`` defaults to every categorical, boolean and uint8
+    column. Results are computed on first use and kept; call
+    ``compute_all`` to precompute every single-column grouping.
+    """
+
+    def __init__(self, df, group_columns=None, value_columns=VALUE_COLUMNS):
+        if group_columns is None:
+            group_columns = list(df.select_dtypes(include=['category', 'bool', 'uint8']).columns)
+        self.value_columns = [col for col in value_columns if col in df.columns]
+        self._value_dtypes = df[self.value_columns].dtypes
+        self._columns = [_ValueColumn(df[col].to_numpy(dtype=np.float64)) for col in self.value_columns]
+        self._n_rows = len(df)
+        self._codes = {}
+        self._labels = {}
+        for col in group_columns:
+            self._codes[col], self._labels[col] = factorize(df[col])
+        self._results = {}
+
+    @property
+    def group_columns(self):
+        return list(self._codes)
+
+    def compute_all(self):
+        for col in self._codes:
+            self._result((col,))
+        return self
+
+    def _result(self, by):
+        # (size Series over every label combination, stats table over observed groups)
+        result = self._results.get(by)
+        if result is not None:
+            return result
+
+        codes = np.zeros(self._n_rows, dtype=np.int64)
+        n_groups = 1
+        for col in by:
+            col_codes, col_labels = self._codes[col], self._labels[col]
+            codes = np.where((codes >= 0) & (col_codes >= 0), codes * len(col_labels) + col_codes, -1)
+            n_groups *= len(col_labels)
+        size, stats = _aggregate(codes, n_groups, self._columns)
+
+        if len(by) == 1:
+            index = self._labels[by[0]].rename(by[0])
+        else:
+            index = pd.MultiIndex.from_product([self._labels[col] for col in by], names=list(by))
+        size = pd.Series(size, index=index)
+
+        observed = size.to_numpy() > 0
+        data = {}
+        for i, (value, dtype) in enumerate(self._value_dtypes.items()):
+            for name in STATISTICS:
+                column = stats[name][observed, i]
+                # Counts as integers, and min/max in the column's integer dtype when defined
+                if name == 'count':
+                    column = column.astype(np.int64)
+                elif name in ('min', 'max') and pd.api.types.is_integer_dtype(dtype) and not np.isnan(column).any():
+                    column = column.astype(dtype)
+                data[(value, name)] = column
+        table = pd.DataFrame(data, index=index[observed])
+
+        result = (size, table)
+        self._results[by] = result
+        return result
+
+    @staticmethod
+    def _key(by):
+        return (by,) if isinstance(by, str) else tuple(by)
+
+    def size(self, by):
+        """Rows per group, including groups with no rows (as ``value_counts`` on a categorical)."""
+        return self._result(self._key(by))[0]
+
+    def table(self, by):
+        """Statistics per observed group; columns are ``(value column, statistic)`` pairs."""
+        return self._result(self._key(by))[1]
+
+    def stat(self, by, value, statistic='mean'):
+        """One statistic of one value column per observed group, as a Series named ``value``."""
+        return self.table(by)[(value, statistic)].rename(value)
+
+
+def grouped_aggregates(df, fingerprint=None):
+    """Engine over every grouping column of a filtered view, cached by its fingerprint.
+
+    The cached engine (shared, see ``cache_utils``) has every single-column
+    grouping precomputed.
+    """
+    if fingerprint is None:
+        return GroupedAggregates(df)
+
+    return _engine_cache.get_or_compute(fingerprint, lambda: GroupedAggregates(df).compute_all())
+
+
+def clear_cache():
+    _engine_cache.clear()
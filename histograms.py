@@ -0,0 +1,154 @@
+"""Pre-binned histograms for every numeric column.
+
+Integer columns (grades, absences, the ordinal scales) get one bin per
+value, others equal-width bins as in ``np.histogram``. All columns,
+optionally split by a grouping column, are counted with one
+``np.bincount``, so charts receive counts instead of rows.
+"""
+import numpy as np
+
+from cache_utils import LRUCache
+from grouping import factorize
+
+DEFAULT_BINS = 20
+
+# Integer columns spanning at most this many distinct values get one bin per value
+MAX_EXACT_BINS = 100
+
+# Rows counted per pass, bounding the temporary arrays
+CHUNK_ROWS = 1 << 20
+
+# Number of (dataset, grouping) results kept in memory
+MAX_CACHED_HISTOGRAMS = 32
+
+_histogram_cache = LRUCache(MAX_CACHED_HISTOGRAMS)
+
+
+class Histogram:
+    """Bin edges and counts of one column; ``counts`` has one row per group when grouped."""
+
+    def __init__(self, edges, counts, groups=None, exact=False):
+        self.edges = edges
+        self.counts = counts
+        self.groups = groups
+        self.exact = exact
+
+    @property
+    def centers(self):
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    @property
+    def widths(self):
+        return np.diff(self.edges)
+
+
+def _is_integer_valued(values):
+    # Integer dtype, or floats that are all whole numbers (ignoring NaN)
+    if values.dtype.kind in 'iub':
+        return True
+    observed = values[~np.isnan(values)]
+    return bool(np.array_equal(observed, np.round(observed)))
+
+
+def bin_edges(low, high, integer, bins=DEFAULT_BINS):
+    """Edges for values in ``[low, high]``: unit bins around each integer when ``integer`` and the span allows."""
+    if integer and high - low + 1 <= MAX_EXACT_BINS:
+        return np.arange(low - 0.5, high + 1.0, 1.0)
+    if not high > low:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+
+def compute_histograms(df, columns=None, bins=DEFAULT_BINS, by=None):
+    """``{column: Histogram}`` for ``columns`` of ``df`` (default: every numeric column).
+
+    With ``by`` the counts are split by that column's groups (``groups``
+    holds their labels). Missing values, and rows with a missing group,
+    are not counted; a column with no values gets None.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns
+    columns = list(columns)
+
+    extents = df[columns].agg(['min', 'max'])
+    edges, exact = [], []
+    for col in columns:
+        low, high = extents.at['min', col], extents.at['max', col]
+        if np.isnan(low):
+            edges.append(None)
+            exact.append(True)
+            continue
+        integer = _is_integer_valued(df[col].to_numpy())
+        edges.append(bin_edges(float(low), float(high), integer, bins))
+        exact.append(integer and len(edges[-1]) - 1 == high - low + 1)
+    present = np.array([e is not None for e in edges])
+    placeholder = np.array([0.0, 1.0])
+    edges_or_placeholder = [e if e is not None else placeholder for e in edges]
+    n_bins = np.array([len(e) - 1 for e in edges_or_placeholder])
+    offsets = np.concatenate(([0], np.cumsum(n_bins)[:-1]))
+    total_bins = int(n_bins.sum())
+    first_edge = np.array([e[0] for e in edges_or_placeholder])
+    bin_width = np.array([(e[-1] - e[0]) / (len(e) - 1) for e in edges_or_placeholder])
+    # Integers binned one per value land exactly; equal-width bins are checked against their edges
+    exact = np.array(exact)
+    inexact = np.flatnonzero(~exact)
+    flat_edges = np.concatenate([edges_or_placeholder[j] for j in inexact]) if len(inexact) else None
+    edge_offsets = np.concatenate(([0], np.cumsum(n_bins[inexact] + 1)[:-1]))
+
+    if by is None:
+        codes, groups, n_groups = None, None, 1
+    else:
+        codes, groups = factorize(df[by])
+        n_groups = len(groups)
+
+    counts = np.zeros(n_groups * total_bins, dtype=np.int64)
+    for start in range(0, len(df), CHUNK_ROWS):
+        values = df[columns].iloc[start:start + CHUNK_ROWS].to_numpy(dtype=np.float64)
+        keep = ~np.isnan(values)
+        keep &= present
+        if codes is not None:
+            chunk_codes = codes[start:start + CHUNK_ROWS]
+            keep &= (chunk_codes >= 0)[:, None]
+
+        position = values - first_edge
+        position /= bin_width
+        np.floor(position, out=position)
+        np.clip(position, 0, n_bins - 1, out=position)
+        position[~keep] = 0
+        index = position.astype(np.int64)
+
+        if len(inexact):
+            # Correct rounding at bin boundaries against the actual edges, as np.histogram does
+            sub_values, sub_index = values[:, inexact], index[:, inexact]
+            edge_at = edge_offsets + sub_index
+            sub_index -= (sub_values < flat_edges[edge_at]) & (sub_index > 0)
+            sub_index += (sub_values >= flat_edges[edge_at + 1]) & (sub_index < n_bins[inexact] - 1)
+            index[:, inexact] = sub_index
+
+        index += offsets
+        if codes is not None:
+            index += (chunk_codes * total_bins)[:, None]
+        counts += np.bincount(index[keep], minlength=n_groups * total_bins)
+
+    counts = counts.reshape(n_groups, total_bins)
+    result = {}
+    for j, col in enumerate(columns):
+        if not present[j]:
+            result[col] = None
+            continue
+        col_counts = counts[:, offsets[j]:offsets[j] + n_bins[j]]
+        result[col] = Histogram(edges[j], col_counts if by is not None else col_counts[0], groups, bool(exact[j]))
+    return result
+
+
+def histograms(df, columns=None, bins=DEFAULT_BINS, by=None, fingerprint=None):
+    """``compute_histograms`` cached by a fingerprint of ``df`` (shared, see ``cache_utils``)."""
+    if fingerprint is None:
+        return compute_histograms(df, columns, bins, by)
+
+    key = (fingerprint, None if columns is None else tuple(columns), bins, by)
+    return _histogram_cache.get_or_compute(key, lambda: compute_histograms(df, columns, bins, by))
+
+
+def clear_cache():
+    _histogram_cache.clear()
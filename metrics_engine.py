@@ -0,0 +1,150 @@
+"""Overview metrics from a per-dataset NumPy kernel, updated incrementally.
+
+Every Tab 1 tile is a ratio of running totals: students, grade and
+absence sums, students passing, students with failures, and students per
+school and gender. ``MetricsKernel`` stores each row's contribution to
+those totals once per dataset, as one contiguous matrix in the smallest
+integer dtype that holds them. All totals for a mask then come from a
+single pass of chunked matrix-vector products (float32 BLAS, with chunks
+short enough that every partial sum is an exact integer). The totals of
+the whole dataset, which the tiles compare against, are computed when
+the kernel is built.
+
+``IncrementalMetrics`` keeps one session's totals for the last mask it
+saw. When the sidebar selection changes, only the rows whose mask bit
+flipped are added or subtracted, so dragging the Age or Absences slider
+touches the few students entering or leaving the view instead of
+rescanning the whole table. Integer sums are exact, so repeated updates
+never drift; a column with fractional values, or a change touching more
+than half of the rows, is recomputed from scratch instead.
+"""
+import numpy as np
+
+from cache_utils import LRUCache
+
+PASS_GRADE = 10
+
+SCHOOLS = ['GP', 'MS']
+
+SEXES = ['F', 'M']
+
+# Columns averaged by the tiles
+MEAN_COLUMNS = ['G3', 'studytime', 'absences']
+
+# Number of datasets whose kernel is kept in memory
+MAX_CACHED_KERNELS = 8
+
+# Largest integer float32 represents exactly; chunk sums stay below it
+_FLOAT32_EXACT = 2 ** 24
+
+_kernel_cache = LRUCache(MAX_CACHED_KERNELS)
+
+
+class MetricsKernel:
+    """Per-row contributions to the Overview totals of one dataset, plus its baseline metrics."""
+
+    def __init__(self, df):
+        self.n_rows = len(df)
+        contributions = {
+            'passing': (df['G3'] >= PASS_GRADE).to_numpy(),
+            'with_failures': (df['failures'] > 0).to_numpy(),
+        }
+        for school in SCHOOLS:
+            contributions[f'school_{school}'] = (df['school'] == school).to_numpy()
+        for sex in SEXES:
+            contributions[f'sex_{sex}'] = (df['sex'] == sex).to_numpy()
+        for col in MEAN_COLUMNS:
+            values = df[col].to_numpy()
+            if values.dtype.kind == 'f':
+                observed = ~np.isnan(values)
+                # Columns without missing values are counted by the row total
+                if not observed.all():
+                    contributions[f'{col}_count'] = observed
+                values = np.where(observed, values, 0.0)
+            contributions[f'{col}_sum'] = values
+        self.names = list(contributions)
+
+        # Integer contributions are stored in the narrowest dtype and summed exactly
+        self.exact = all(values.dtype.kind in 'iub' for values in contributions.values())
+        if self.exact:
+            largest = max(int(np.abs(values.astype(np.int64)).max(initial=0)) for values in contributions.values())
+            dtype = np.min_scalar_type(-largest - 1)
+            self._chunk = max(1, _FLOAT32_EXACT // max(largest, 1))
+        else:
+            dtype = np.float64
+            self._chunk = max(1, self.n_rows)
+        self._matrix = np.empty((len(self.names), self.n_rows), dtype=dtype)
+        for i, values in enumerate(contributions.values()):
+            self._matrix[i] = values
+
+        self.baseline = self.metrics(self.totals(np.ones(self.n_rows, dtype=bool)))
+
+    def totals(self, rows):
+        """``[rows, *names]`` totals for a boolean mask or an array of row positions."""
+        if rows.dtype == bool:
+            selected = np.count_nonzero(rows)
+            work = np.float32 if self.exact else np.float64
+            sums = np.zeros(len(self.names))
+            for start in range(0, self.n_rows, self._chunk):
+                stop = start + self._chunk
+                sums += self._matrix[:, start:stop].astype(work) @ rows[start:stop].astype(work)
+        else:
+            selected = len(rows)
+            sums = self._matrix[:, rows].sum(axis=1, dtype=np.int64 if self.exact else np.float64)
+        return np.concatenate(([selected], sums)).astype(np.float64)
+
+    def metrics(self, totals):
+        """Totals in the layout of ``analysis.overview_metrics``."""
+        rows = totals[0]
+        named = dict(zip(self.names, totals[1:]))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = {col: named[f'{col}_sum'] / named.get(f'{col}_count', rows) for col in MEAN_COLUMNS}
+            shares = {name: named[name] / rows * 100 for name in ['passing', 'with_failures']}
+        return {
+            'total_students': int(rows),
+            'avg_final_grade': means['G3'],
+            'avg_study_time': means['studytime'],
+            'pass_rate': shares['passing'],
+            'school_counts': {school: int(named[f'school_{school}']) for school in SCHOOLS},
+            'gender_counts': {sex: int(named[f'sex_{sex}']) for sex in SEXES},
+            'avg_absences': means['absences'],
+            'failure_rate': shares['with_failures'],
+        }
+
+
+def metrics_kernel(df, dataset_key=None):
+    """Kernel for a dataset, cached by its content hash (shared, see ``cache_utils``)."""
+    if dataset_key is None:
+        return MetricsKernel(df)
+
+    return _kernel_cache.get_or_compute(dataset_key, lambda: MetricsKernel(df))
+
+
+class IncrementalMetrics:
+    """``analysis.overview_metrics`` for successive masks over one dataset.
+
+    Keep one per session, next to its ``FilterEngine``: it remembers the
+    last mask and its totals.
+    """
+
+    def __init__(self, kernel, dataset_key=None):
+        self.kernel = kernel
+        self.dataset_key = dataset_key
+        self.last_mask = None
+        self._totals = None
+
+    def update(self, mask):
+        """Metrics for the rows selected by ``mask``, applying only the change since the last call."""
+        kernel = self.kernel
+        if self._totals is None or not kernel.exact:
+            self._totals = kernel.totals(mask)
+        else:
+            changed = np.flatnonzero(mask != self.last_mask)
+            if len(changed) > kernel.n_rows // 2:
+                self._totals = kernel.totals(mask)
+            elif len(changed):
+                entered = changed[mask[changed]]
+                left = changed[~mask[changed]]
+                self._totals = self._totals + kernel.totals(entered) - kernel.totals(left)
+        self.last_mask = mask
+        return kernel.metrics(self._totals)
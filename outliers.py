@@ -0,0 +1,149 @@
+"""Outlier treatment pipeline for the numeric columns of a frame.
+
+The numeric columns are read once into a column-major float array and
+their means and standard deviations are computed once. Z-score removal,
+``log1p`` and winsorizing (with ``scipy.stats.mstats.winsorize``'s rank
+rules) then run as whole-array operations, each on the original data or,
+on request, chained. Every step is timed.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+# Treatments with their labels, in the order a chained run applies them
+TREATMENTS = {
+    'zscore': 'Remove rows with a z-score beyond the threshold',
+    'log1p': 'Log transform (log1p)',
+    'winsorize': 'Winsorize (clip the lowest and highest percentiles)',
+}
+
+# |z| above which a value counts as an outlier
+ZSCORE_THRESHOLD = 3
+
+# Share of values clipped at the bottom and at the top when winsorizing
+WINSORIZE_LIMITS = (0.05, 0.05)
+
+
+def column_statistics(values):
+    """Mean and population standard deviation of each column (as ``scipy.stats.zscore``)."""
+    mean = values.mean(axis=0)
+    std = values.std(axis=0)
+    return mean, std
+
+
+def zscore_outliers(values, mean, std, threshold=ZSCORE_THRESHOLD):
+    """Boolean array marking values whose |z| exceeds ``threshold`` (never for constant columns)."""
+    z = values - mean
+    np.abs(z, out=z)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z /= std
+    return z > threshold
+
+
+def winsorize_bounds(values, limits=WINSORIZE_LIMITS):
+    """Per-column clipping bounds matching ``mstats.winsorize(column, limits)``.
+
+    The lowest ``int(low * n)`` values are raised to the next one and the
+    highest ``int(high * n)`` lowered to the one before them.
+    """
+    n = len(values)
+    low_rank = int(limits[0] * n)
+    high_rank = n - int(limits[1] * n) - 1
+    ordered = np.partition(values, [low_rank, high_rank], axis=0)
+    return ordered[low_rank], ordered[high_rank]
+
+
+def _drop_rows(values, rows):
+    # Column by column, so the kept rows stay column-major
+    kept = np.empty((len(values) - int(rows.sum()), values.shape[1]), order='F')
+    for j in range(values.shape[1]):
+        np.compress(~rows, values[:, j], out=kept[:, j])
+    return kept
+
+
+def _log1p(values, out=None):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.log1p(values, out=out)
+
+
+def _frame(df, num_cols, values, keep_dtypes):
+    # ``df`` with its numeric columns replaced by those of ``values``
+    if keep_dtypes:
+        columns = {col: values[:, j].astype(df[col].dtype, copy=False) for j, col in enumerate(num_cols)}
+    else:
+        columns = {col: values[:, j] for j, col in enumerate(num_cols)}
+    return df.assign(**columns)
+
+
+def treat_outliers(df, treatments=TREATMENTS, chain=False, threshold=ZSCORE_THRESHOLD, limits=WINSORIZE_LIMITS):
+    """Apply the selected ``treatments`` to the numeric columns of ``df``.
+
+    Returns a dict with ``frames`` (one treated frame per treatment, each
+    built from ``df``; with ``chain`` a single ``'chained'`` frame with the
+    treatments applied in ``TREATMENTS`` order), the z-score outliers per
+    column (``outlier_counts``), the rows flagged in any column
+    (``outlier_rows``) and the seconds each step took (``timings``).
+    """
+    timings = {}
+
+    def timed(step, fn):
+        started = time.perf_counter()
+        result = fn()
+        timings[step] = time.perf_counter() - started
+        return result
+
+    num_cols = df.select_dtypes(include=[np.number]).columns
+
+    def read():
+        values = np.empty((len(df), len(num_cols)), order='F')
+        for j, col in enumerate(num_cols):
+            values[:, j] = df[col].to_numpy(dtype=np.float64)
+        return values
+    values = timed('read', read)
+    mean, std = timed('statistics', lambda: column_statistics(values))
+
+    def detect():
+        outliers = zscore_outliers(values, mean, std, threshold)
+        return outliers.sum(axis=0), outliers.any(axis=1)
+    counts, outlier_rows = timed('detect', detect)
+
+    frames = {}
+    if chain:
+        remove_rows = 'zscore' in treatments and outlier_rows.any()
+        if remove_rows:
+            values = timed('zscore', lambda: _drop_rows(values, outlier_rows))
+        winsorize = 'winsorize' in treatments and len(values)
+        if winsorize:
+            # log1p is increasing, so bounds taken before it map through it
+            low, high = timed('winsorize_bounds', lambda: winsorize_bounds(values, limits))
+        if 'log1p' in treatments:
+            timed('log1p', lambda: _log1p(values, out=values))
+            if winsorize:
+                low, high = _log1p(low), _log1p(high)
+        if winsorize:
+            timed('winsorize', lambda: np.clip(values, low, high, out=values))
+        if treatments:
+            treated = df[~outlier_rows] if remove_rows else df
+            frames['chained'] = timed('assemble', lambda: _frame(treated, num_cols, values, 'log1p' not in treatments))
+    else:
+        # Removing rows leaves the values alone, and the winsorize bounds are taken before
+        # log1p writes its own array, so the read buffer can be clipped in place
+        if 'zscore' in treatments:
+            frames['zscore'] = timed('zscore', lambda: df[~outlier_rows])
+        if 'winsorize' in treatments and len(values):
+            low, high = timed('winsorize_bounds', lambda: winsorize_bounds(values, limits))
+        if 'log1p' in treatments:
+            logged = timed('log1p', lambda: _log1p(values))
+            frames['log1p'] = timed('assemble_log1p', lambda: _frame(df, num_cols, logged, keep_dtypes=False))
+        if 'winsorize' in treatments:
+            if len(values):
+                timed('winsorize', lambda: np.clip(values, low, high, out=values))
+            frames['winsorize'] = timed('assemble_winsorize', lambda: _frame(df, num_cols, values, keep_dtypes=True))
+
+    return {
+        'frames': frames,
+        'outlier_counts': pd.Series(counts, index=num_cols),
+        'outlier_rows': int(outlier_rows.sum()),
+        'timings': timings,
+    }
@@ -0,0 +1,44 @@
+"""Performance band assignment for the derived Performance_Category column.
+
+Grades are binned in a single ``pd.cut`` pass and stored as an ordered
+categorical (one small integer code per student instead of a Python string).
+"""
+import numpy as np
+import pandas as pd
+
+# Lower bound (inclusive) of each band; anything below the lowest bound
+# falls into LOWEST_BAND.
+DEFAULT_THRESHOLDS = {
+    'Excellent': 16,
+    'Good': 14,
+    'Average': 10,
+}
+LOWEST_BAND = 'Needs Improvement'
+
+
+def band_labels(thresholds=None, lowest_band=LOWEST_BAND):
+    """Band names ordered from lowest to highest grade."""
+    thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+    return [lowest_band] + sorted(thresholds, key=thresholds.get)
+
+
+def categorize_grades(grades, thresholds=None, lowest_band=LOWEST_BAND):
+    """Assign each grade to its performance band.
+
+    ``thresholds`` maps band name to its inclusive lower bound, e.g. the
+    default ``{'Excellent': 16, 'Good': 14, 'Average': 10}``. Returns an
+    ordered categorical Series aligned with ``grades``; missing grades stay NaN.
+    """
+    thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+    bounds = sorted(thresholds.values())
+    if len(set(bounds)) != len(bounds):
+        raise ValueError("Band thresholds must be distinct")
+
+    bins = [-np.inf] + bounds + [np.inf]
+    return pd.cut(
+        pd.Series(grades),
+        bins=bins,
+        labels=band_labels(thresholds, lowest_band),
+        right=False,
+        ordered=True,
+    )
@@ -0,0 +1,122 @@
+"""Closed-form least-squares trendlines.
+
+Replaces Plotly Express ``trendline="ols"`` (a statsmodels fit per trace on
+every rerun) with simple linear regression from per-group sums: means,
+centred sums of squares and cross-products, accumulated with
+``np.bincount`` in one vectorized pass per sum. Fits are cached per
+(x, y, group column, filter fingerprint).
+
+Confidence bands use the t distribution from scipy when it is installed,
+and a series approximation of it otherwise.
+"""
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+
+try:
+    from scipy.special import stdtrit
+except ImportError:
+    stdtrit = None
+
+MAX_CACHED_FITS = 64
+
+_fit_cache = LRUCache(MAX_CACHED_FITS)
+
+
+def t_quantile(p, dof):
+    """Quantile ``p`` of Student's t distribution with ``dof`` degrees of freedom."""
+    if stdtrit is not None:
+        return stdtrit(dof, p)
+    # Cornish-Fisher expansion around the normal quantile (Abramowitz & Stegun 26.7.5)
+    z = NormalDist().inv_cdf(p)
+    dof = np.asarray(dof, dtype=np.float64)
+    return (z
+            + (z ** 3 + z) / (4 * dof)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3))
+
+
+def fit_lines(x, y, groups=None):
+    """Ordinary least-squares fit of ``y`` on ``x``, separately for each group.
+
+    Returns one row per group (a single row labelled None without groups)
+    with the count, means, slope, intercept, R², residual standard error
+    and the x extent. Rows where x or y is missing are ignored.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if groups is None:
+        codes, labels = np.zeros(len(x), dtype=np.int64), pd.Index([None], dtype=object)
+    else:
+        codes, labels = pd.factorize(groups, sort=True)
+
+    valid = ~(np.isnan(x) | np.isnan(y)) & (codes >= 0)
+    x, y, codes = x[valid], y[valid], codes[valid]
+    k = len(labels)
+
+    n = np.bincount(codes, minlength=k).astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = np.bincount(codes, weights=x, minlength=k) / n
+        y_mean = np.bincount(codes, weights=y, minlength=k) / n
+        dx = x - x_mean[codes]
+        dy = y - y_mean[codes]
+        sxx = np.bincount(codes, weights=dx * dx, minlength=k)
+        sxy = np.bincount(codes, weights=dx * dy, minlength=k)
+        syy = np.bincount(codes, weights=dy * dy, minlength=k)
+
+        slope = np.where(sxx > 0, sxy / sxx, np.nan)
+        intercept = y_mean - slope * x_mean
+        r_squared = np.where(syy > 0, sxy ** 2 / (sxx * syy), np.nan)
+        residual_ss = np.clip(syy - slope * sxy, 0, None)
+        residual_se = np.where(n > 2, np.sqrt(residual_ss / (n - 2)), np.nan)
+
+    extent = pd.DataFrame({'x': x, 'code': codes}).groupby('code')['x'].agg(['min', 'max']).reindex(range(k))
+    return pd.DataFrame({
+        'n': n.astype(np.int64),
+        'x_mean': x_mean,
+        'y_mean': y_mean,
+        'sxx': sxx,
+        'slope': slope,
+        'intercept': intercept,
+        'r_squared': r_squared,
+        'residual_se': residual_se,
+        'x_min': extent['min'].to_numpy(),
+        'x_max': extent['max'].to_numpy(),
+    }, index=labels)
+
+
+def trendlines(df, x, y, by=None, fingerprint=None):
+    """``fit_lines`` for two columns of ``df``, optionally per ``by`` group.
+
+    With a ``fingerprint`` identifying the contents of ``df`` the fits are
+    cached and shared between reruns and sessions.
+    """
+    def compute():
+        return fit_lines(df[x].to_numpy(), df[y].to_numpy(), None if by is None else df[by].to_numpy())
+
+    if fingerprint is None:
+        return compute()
+    return _fit_cache.get_or_compute((fingerprint, x, y, by), compute)
+
+
+def confidence_band(fit, xs, level=0.95):
+    """Fitted values and the confidence band for the mean response at ``xs``.
+
+    ``fit`` is one row of ``fit_lines``. Returns ``(fitted, lower, upper)``;
+    the band is NaN when the group has fewer than three points.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    fitted = fit['intercept'] + fit['slope'] * xs
+    if not fit['n'] > 2 or not fit['sxx'] > 0:
+        nan = np.full_like(xs, np.nan)
+        return fitted, nan, nan
+    t = t_quantile(0.5 + level / 2, fit['n'] - 2)
+    half_width = t * fit['residual_se'] * np.sqrt(1 / fit['n'] + (xs - fit['x_mean']) ** 2 / fit['sxx'])
+    return fitted, fitted - half_width, fitted + half_width
+
+
+def clear_cache():
+    _fit_cache.clear()
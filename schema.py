@@ -0,0 +1,112 @@
+"""Column schema for the student performance dataset (see student.txt).
+
+Every documented attribute is parsed into a compact dtype: nominal and
+binary attributes become categoricals, the yes/no flags become booleans
+and the bounded numeric attributes become 8-bit integers. Rows whose
+values fall outside the documented domain are rejected at parse time.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+# Nominal and binary attributes with their documented values
+CATEGORICAL_COLUMNS = {
+    'school': ['GP', 'MS'],
+    'sex': ['F', 'M'],
+    'address': ['R', 'U'],
+    'famsize': ['GT3', 'LE3'],
+    'Pstatus': ['A', 'T'],
+    'Mjob': ['at_home', 'health', 'other', 'services', 'teacher'],
+    'Fjob': ['at_home', 'health', 'other', 'services', 'teacher'],
+    'reason': ['course', 'home', 'other', 'reputation'],
+    'guardian': ['father', 'mother', 'other'],
+}
+
+# yes/no attributes
+BOOLEAN_COLUMNS = ['schoolsup', 'famsup', 'paid', 'activities', 'nursery', 'higher', 'internet', 'romantic']
+
+# Numeric attributes: (dtype, min, max). Ordinal scales are stored unsigned;
+# age, absences and grades are signed so differences such as G3 - G1 can't wrap.
+INTEGER_COLUMNS = {
+    'age': ('int8', 15, 22),
+    'Medu': ('uint8', 0, 4),
+    'Fedu': ('uint8', 0, 4),
+    'traveltime': ('uint8', 1, 4),
+    'studytime': ('uint8', 1, 4),
+    'failures': ('uint8', 0, 4),
+    'famrel': ('uint8', 1, 5),
+    'freetime': ('uint8', 1, 5),
+    'goout': ('uint8', 1, 5),
+    'Dalc': ('uint8', 1, 5),
+    'Walc': ('uint8', 1, 5),
+    'health': ('uint8', 1, 5),
+    'absences': ('int8', 0, 93),
+    'G1': ('int8', 0, 20),
+    'G2': ('int8', 0, 20),
+    'G3': ('int8', 0, 20),
+}
+
+
+def parse_options():
+    """Keyword arguments for ``pd.read_csv`` that apply the schema while parsing."""
+    return {
+        'delimiter': ';',
+        'dtype': {col: 'category' for col in CATEGORICAL_COLUMNS},
+        'true_values': ['yes'],
+        'false_values': ['no'],
+    }
+
+
+def valid_rows(df):
+    """Boolean mask of rows whose documented attributes are all in range."""
+    valid = np.ones(len(df), dtype=bool)
+
+    for col, categories in CATEGORICAL_COLUMNS.items():
+        if col in df.columns:
+            valid &= df[col].isin(categories).to_numpy()
+
+    for col in BOOLEAN_COLUMNS:
+        if col in df.columns and not pd.api.types.is_bool_dtype(df[col]):
+            valid &= df[col].map(lambda x: isinstance(x, (bool, np.bool_))).to_numpy()
+
+    for col, (_, low, high) in INTEGER_COLUMNS.items():
+        if col in df.columns:
+            values = pd.to_numeric(df[col], errors='coerce')
+            valid &= (values.between(low, high) & (values % 1 == 0)).to_numpy()
+
+    return valid
+
+
+def apply_schema(df):
+    """Drop rows that don't fit the schema and cast columns to compact dtypes.
+
+    Columns not documented in student.txt are left as parsed. Returns
+    ``(typed_df, rejected_rows)``.
+    """
+    valid = valid_rows(df)
+    rejected_rows = int((~valid).sum())
+    if rejected_rows:
+        df = df[valid].reset_index(drop=True)
+
+    for col, categories in CATEGORICAL_COLUMNS.items():
+        if col in df.columns:
+            df[col] = pd.Categorical(df[col], categories=categories)
+
+    for col in BOOLEAN_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(bool)
+
+    for col, (dtype, _, _) in INTEGER_COLUMNS.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col]).astype(dtype)
+
+    return df, rejected_rows
+
+
+def read_student_csv(source):
+    """Parse a semicolon-delimited student CSV (bytes or file-like) with the schema applied."""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    df = pd.read_csv(source, **parse_options())
+    return apply_schema(df)
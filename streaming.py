@@ -0,0 +1,204 @@
+"""Chunked ingestion for student CSV files too large to load as one frame.
+
+The file is read in chunks with the column schema and derived columns
+applied to each chunk, and running aggregates are merged as it goes:
+counts, means and variances (Chan et al. pairwise update), min/max,
+missing values, category counts and a co-moment matrix for correlations.
+Low-cardinality numeric columns (every documented attribute) also keep
+exact value counts, so quartiles and threshold counts such as the pass
+rate are exact without holding the rows.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from cache_utils import LRUCache
+from data_loader import add_derived_columns, stream_hash
+from schema import apply_schema, parse_options
+
+# Uploads at least this large start in streaming mode (the checkbox can turn it off); the
+# default stays below Streamlit's 200 MB server.maxUploadSize, raise that for larger files
+STREAMING_THRESHOLD_BYTES = int(os.environ.get('STUDENT_DASHBOARD_STREAMING_BYTES', 100 * 1024 ** 2))
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Numeric columns with more distinct values than this stop tracking value counts
+MAX_TRACKED_VALUES = 1000
+
+MAX_CACHED_SUMMARIES = 4
+
+_summary_cache = LRUCache(MAX_CACHED_SUMMARIES)
+
+
+def _quantile_from_counts(values, counts, q):
+    """Linear-interpolated quantile (as ``Series.quantile``) from sorted value counts."""
+    total = counts.sum()
+    if total == 0:
+        return np.nan
+    cumulative = np.cumsum(counts)
+    position = q * (total - 1)
+    lower = int(np.floor(position))
+    upper = int(np.ceil(position))
+    low_value = values[np.searchsorted(cumulative, lower, side='right')]
+    high_value = values[np.searchsorted(cumulative, upper, side='right')]
+    return low_value + (high_value - low_value) * (position - lower)
+
+
+class RunningStats:
+    """Aggregates merged chunk by chunk over a stream of DataFrames."""
+
+    def __init__(self):
+        self.n_rows = 0
+        self.rejected_rows = 0
+        self.columns = None
+        self.numeric_columns = None
+        self.missing = None
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.min = None
+        self.max = None
+        # Co-moments over rows complete in every numeric column
+        self.complete_rows = 0
+        self.complete_mean = None
+        self.comoment = None
+        self.category_counts = {}
+        self.value_counts = {}
+
+    def _start(self, chunk):
+        self.columns = list(chunk.columns)
+        self.numeric_columns = list(chunk.select_dtypes(include=[np.number]).columns)
+        k = len(self.numeric_columns)
+        self.missing = pd.Series(0, index=self.columns, dtype=np.int64)
+        self.count = np.zeros(k, dtype=np.int64)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+        self.complete_mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+        self.value_counts = {col: pd.Series(dtype=np.int64) for col in self.numeric_columns}
+
+    def update(self, chunk):
+        if self.columns is None:
+            self._start(chunk)
+        self.n_rows += len(chunk)
+        self.missing = self.missing.add(chunk.isnull().sum(), fill_value=0).astype(np.int64)
+
+        numeric = chunk.reindex(columns=self.numeric_columns)
+        values = numeric.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        self._update_moments(values)
+        self._update_comoment(values)
+
+        for col in self.numeric_columns:
+            counts = self.value_counts.get(col)
+            if counts is not None:
+                merged = counts.add(numeric[col].value_counts(), fill_value=0)
+                self.value_counts[col] = merged if len(merged) <= MAX_TRACKED_VALUES else None
+
+        for col in chunk.columns.difference(self.numeric_columns, sort=False):
+            counts = chunk[col].value_counts()
+            previous = self.category_counts.get(col)
+            self.category_counts[col] = counts if previous is None else previous.add(counts, fill_value=0)
+
+    def _update_moments(self, values):
+        observed = ~np.isnan(values)
+        n_b = observed.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_b = np.nansum(values, axis=0) / n_b
+            m2_b = np.nansum((values - mean_b) ** 2, axis=0)
+        has_data = n_b > 0
+        mean_b = np.where(has_data, mean_b, 0.0)
+        m2_b = np.where(has_data, m2_b, 0.0)
+
+        n_a = self.count
+        n = n_a + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean_b - self.mean
+            self.mean = np.where(n > 0, self.mean + delta * n_b / n, 0.0)
+            self.m2 = np.where(n > 0, self.m2 + m2_b + delta ** 2 * n_a * n_b / n, 0.0)
+        self.count = n
+        if values.size:
+            self.min = np.fmin(self.min, np.nanmin(np.where(observed, values, np.inf), axis=0))
+            self.max = np.fmax(self.max, np.nanmax(np.where(observed, values, -np.inf), axis=0))
+
+    def _update_comoment(self, values):
+        complete = values[~np.isnan(values).any(axis=1)]
+        n_b = len(complete)
+        if n_b == 0:
+            return
+        mean_b = complete.mean(axis=0)
+        centered = complete - mean_b
+        comoment_b = centered.T @ centered
+
+        n_a = self.complete_rows
+        n = n_a + n_b
+        delta = mean_b - self.complete_mean
+        self.comoment += comoment_b + np.outer(delta, delta) * n_a * n_b / n
+        self.complete_mean += delta * n_b / n
+        self.complete_rows = n
+
+    def variance(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.Series(np.where(self.count > 1, self.m2 / (self.count - 1), np.nan), index=self.numeric_columns)
+
+    def describe(self):
+        """Summary table in the layout of ``DataFrame.describe()``."""
+        table = pd.DataFrame({
+            'count': self.count.astype(np.float64),
+            'mean': np.where(self.count > 0, self.mean, np.nan),
+            'std': np.sqrt(self.variance().to_numpy()),
+            'min': np.where(self.count > 0, self.min, np.nan),
+            '25%': np.nan,
+            '50%': np.nan,
+            '75%': np.nan,
+            'max': np.where(self.count > 0, self.max, np.nan),
+        }, index=self.numeric_columns)
+        for col, counts in self.value_counts.items():
+            if counts is not None:
+                counts = counts.sort_index()
+                for q, label in [(0.25, '25%'), (0.5, '50%'), (0.75, '75%')]:
+                    table.loc[col, label] = _quantile_from_counts(counts.index.to_numpy(dtype=np.float64), counts.to_numpy(), q)
+        return table.T
+
+    def corr(self):
+        """Pearson correlation matrix over rows complete in every numeric column."""
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            matrix = self.comoment / np.outer(scale, scale)
+        np.fill_diagonal(matrix, np.where(scale > 0, 1.0, np.nan))
+        return pd.DataFrame(matrix, index=self.numeric_columns, columns=self.numeric_columns)
+
+    def column_mean(self, col):
+        return self.mean[self.numeric_columns.index(col)]
+
+    def count_where(self, col, predicate):
+        """Number of rows whose value in a tracked numeric column satisfies ``predicate``."""
+        counts = self.value_counts.get(col)
+        if counts is None:
+            raise ValueError(f"Value counts are not tracked for column {col!r}")
+        return int(counts[predicate(counts.index.to_numpy())].sum())
+
+    def category_count(self, col, value):
+        return int(self.category_counts.get(col, pd.Series(dtype=np.int64)).get(value, 0))
+
+
+def summarize_csv(source, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Stream a semicolon-delimited student CSV (path or file-like) into ``RunningStats``."""
+    stats = RunningStats()
+    for chunk in pd.read_csv(source, chunksize=chunk_rows, **parse_options()):
+        chunk, rejected_rows = apply_schema(chunk)
+        stats.rejected_rows += rejected_rows
+        stats.update(add_derived_columns(chunk))
+    return stats
+
+
+def load_summary(source, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Streaming summary of an uploaded file object, cached by its content hash.
+
+    The file is hashed block by block and handed to the chunked reader
+    as is, so no copy of its contents is made.
+    """
+    key = stream_hash(source)
+    return _summary_cache.get_or_compute(key, lambda: summarize_csv(source, chunk_rows))
@@ -1,12 +1,1394 @@
-import io
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+from analysis import (
+    CATEGORICAL_COLUMNS, categorical_summary, category_counts, gender_comparison, grade_by, grade_period_means,
+    min_max_normalize, outlier_counts, performance_mix_by_gender, study_time_analysis, top_correlations
+)
+from correlation import correlation_matrix, strong_correlation_pairs
+from cube import grade_cube
+from data_loader import load_dataset
+from descriptive_stats import box_trace_args, compute_statistics, describe_table, descriptive_statistics, outlier_values
+from downsampling import SCATTER_POINT_LIMIT, reduce_scatter
+from figure_cache import cached_figure
+from filter_engine import FilterEngine
+from grouping import grouped_aggregates
+from histograms import histograms
+from metrics_engine import IncrementalMetrics, metrics_kernel
+from regression import confidence_band, trendlines
+from streaming import STREAMING_THRESHOLD_BYTES, load_summary
+
+# ==================== TAB RENDERERS ====================
+# Each tab body is a function so only the selected tab runs on a rerun.
+# Figures that don't depend on in-tab widgets are built once per filter state;
+# figures driven by in-tab widgets go through figure_cache.cached_figure.
+
+def render_streaming_overview(summary):
+    st.header("📊 Dataset Overview (Large File Mode)")
+    
+    if summary.rejected_rows:
+        st.warning(f"⚠️ {summary.rejected_rows} rows were skipped because their values don't match the documented dataset attributes (see student.txt).")
+    
+    n_rows = summary.n_rows
+    if n_rows == 0:
+        st.info("The uploaded file contains no valid rows.")
+        return
+    
+    # Key Metrics Row 1
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("👥 Total Students", f"{n_rows}", help="Number of students in the dataset")
+    with col2:
+        st.metric("📝 Avg Final Grade (G3)", f"{summary.column_mean('G3'):.2f} / 20", help="Average final grade (G3)")
+    with col3:
+        st.metric("📚 Avg Study Time", f"{summary.column_mean('studytime'):.2f} / 4", help="Average weekly study time")
+    with col4:
+        pass_rate = summary.count_where('G3', lambda g: g >= 10) / n_rows * 100
+        st.metric("✅ Pass Rate", f"{pass_rate:.1f}%", help="Percentage of students with G3 >= 10")
+    
+    # Key Metrics Row 2
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(
+            "🏫 School Split",
+            f"GP: {summary.category_count('school', 'GP')}",
+            delta=f"MS: {summary.category_count('school', 'MS')}",
+            help="Distribution across schools"
+        )
+    with col2:
+        st.metric(
+            "👥 Gender Split",
+            f"F: {summary.category_count('sex', 'F')}",
+            delta=f"M: {summary.category_count('sex', 'M')}",
+            help="Gender distribution"
+        )
+    with col3:
+        st.metric("📅 Avg Absences", f"{summary.column_mean('absences'):.1f}", help="Average number of absences")
+    with col4:
+        failure_rate = summary.count_where('failures', lambda f: f > 0) / n_rows * 100
+        st.metric("❌ Students with Failures", f"{failure_rate:.1f}%", help="Percentage with past failures")
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader('📊 Activity D: Summary Statistics')
+        st.dataframe(summary.describe(), use_container_width=True)
+    with col2:
+        st.subheader('✅ Activity C.2: Missing Values')
+        missing_df = pd.DataFrame({
+            'Missing Values': summary.missing,
+            'Percentage': (summary.missing / n_rows * 100).round(2)
+        })
+        st.dataframe(missing_df, use_container_width=True, height=300)
+    
+    st.markdown("---")
+    
+    # Activity E: Correlation Heatmap
+    st.subheader("🔥 Activity E: Correlation Heatmap")
+    fig_corr = px.imshow(
+        summary.corr(),
+        text_auto='.2f',
+        aspect='auto',
+        title='Correlation Heatmap of Numeric Features',
+        color_continuous_scale='RdBu_r',
+        zmin=-1,
+        zmax=1
+    )
+    fig_corr.update_layout(height=700)
+    st.plotly_chart(fig_corr, use_container_width=True)
+
+
+def render_overview(filtered_df, filter_key, metrics, baseline):
+    st.header("📊 Dataset Overview")
+    
+    
+    # Key Metrics Row 1
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            "👥 Total Students",
+            f"{metrics['total_students']}",
+            delta=f"{metrics['total_students'] - baseline['total_students']} from total",
+            help="Number of students in filtered dataset"
+        )
+    
+    with col2:
+        avg_final = metrics['avg_final_grade']
+        st.metric(
+            "📝 Avg Final Grade (G3)",
+            f"{avg_final:.2f} / 20",
+            delta=f"{avg_final - baseline['avg_final_grade']:.2f} vs total",
+            help="Average final grade (G3)"
+        )
+    
+    with col3:
+        avg_study = metrics['avg_study_time']
+        st.metric(
+            "📚 Avg Study Time",
+            f"{avg_study:.2f} / 4",
+            delta=f"{avg_study - baseline['avg_study_time']:.2f} vs total",
+            help="Average weekly study time"
+        )
+    
+    with col4:
+        pass_rate = metrics['pass_rate']
+        st.metric(
+            "✅ Pass Rate",
+            f"{pass_rate:.1f}%",
+            help="Percentage of students with G3 >= 10"
+        )
+    
+    # Key Metrics Row 2
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            "🏫 School Split",
+            f"GP: {metrics['school_counts']['GP']}",
+            delta=f"MS: {metrics['school_counts']['MS']}",
+            help="Distribution across schools"
+        )
+    
+    with col2:
+        st.metric(
+            "👥 Gender Split",
+            f"F: {metrics['gender_counts']['F']}",
+            delta=f"M: {metrics['gender_counts']['M']}",
+            help="Gender distribution"
+        )
+    
+    with col3:
+        avg_absences = metrics['avg_absences']
+        st.metric(
+            "📅 Avg Absences",
+            f"{avg_absences:.1f}",
+            delta=f"{avg_absences - baseline['avg_absences']:.1f} vs total",
+            help="Average number of absences"
+        )
+    
+    with col4:
+        failure_rate = metrics['failure_rate']
+        st.metric(
+            "❌ Students with Failures",
+            f"{failure_rate:.1f}%",
+            help="Percentage with past failures"
+        )
+    
+    st.markdown("---")
+    
+    # Data Preview
+    st.subheader('📋 Activity B: Data Preview')
+    
+    # Display options
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        num_rows = st.slider("Number of rows to display:", 5, 50, 10)
+    with col2:
+        show_all_cols = st.checkbox("Show all columns", value=False)
+    
+    if show_all_cols:
+        st.dataframe(filtered_df.head(num_rows), use_container_width=True)
+    else:
+        display_cols = ['school', 'sex', 'age', 'address', 'studytime', 'failures', 
+                      'absences', 'G1', 'G2', 'G3', 'Average_Grade', 'Performance_Category']
+        st.dataframe(filtered_df[display_cols].head(num_rows), use_container_width=True)
+    
+    st.markdown("""
+    <div class='insight-box'>
+    <strong>📋 Dataset Insights:</strong>
+    <ul>
+        <li>Each row represents a <strong>unique student</strong> with academic and personal characteristics</li>
+        <li>Key features include <strong>demographics</strong> (age, sex, address), <strong>family background</strong> (parental education, jobs), and <strong>academic performance</strong> (G1, G2, G3 grades)</li>
+        <li>The data provides a comprehensive view of factors influencing student success</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Dataset Information and Missing Values
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader('🔍 Activity C.1: Dataset Information')
+    
+        # Create a summary dataframe
+        info_data = {
+            'Column': filtered_df.columns,
+            'Non-Null Count': [filtered_df[col].count() for col in filtered_df.columns],
+            'Dtype': [filtered_df[col].dtype for col in filtered_df.columns]
+        }
+        info_df = pd.DataFrame(info_data)
+    
+        st.dataframe(info_df, use_container_width=True, height=300)
+    
+        st.markdown(f"""
+        <div class='insight-box'>
+        <strong>🔍 Data Structure:</strong>
+        <ul>
+            <li><strong>Total Columns:</strong> {len(filtered_df.columns)}</li>
+            <li><strong>Total Rows:</strong> {len(filtered_df)}</li>
+            <li><strong>Numerical Features:</strong> {len(filtered_df.select_dtypes(include=[np.number]).columns)}</li>
+            <li><strong>Categorical Features:</strong> {len(filtered_df.select_dtypes(exclude=[np.number]).columns)}</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.subheader('✅ Activity C.2: Missing Values')
+    
+        missing_df = pd.DataFrame({
+            'Column': filtered_df.columns,
+            'Missing Values': filtered_df.isnull().sum(),
+            'Percentage': (filtered_df.isnull().sum() / len(filtered_df) * 100).round(2)
+        })
+    
+        st.dataframe(missing_df, use_container_width=True, height=300)
+    
+        missing_count = filtered_df.isnull().sum().sum()
+        st.markdown(f"""
+        <div class='insight-box'>
+        <strong>✅ Data Quality:</strong>
+        <ul>
+            <li><strong>Total Missing Values:</strong> {missing_count}</li>
+            <li><strong>Status:</strong> {"🎉 Excellent - No missing values!" if missing_count == 0 else "⚠️ Some missing values detected"}</li>
+            <li><strong>Reliability:</strong> {"High data integrity for analysis" if missing_count == 0 else "May need data cleaning"}</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Summary Statistics
+    st.subheader('📊 Activity D: Summary Statistics')
+    
+    stats = descriptive_statistics(filtered_df, filter_key)
+    st.dataframe(describe_table(stats), use_container_width=True)
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>📈 Statistical Overview:</strong>
+    <ul>
+        <li><strong>Grade Range:</strong> G3 scores range from {stats.loc['G3', 'min']:.0f} to {stats.loc['G3', 'max']:.0f} (out of 20)</li>
+        <li><strong>Average Performance:</strong> Mean final grade is {stats.loc['G3', 'mean']:.2f}/20</li>
+        <li><strong>Age Distribution:</strong> Students aged {stats.loc['age', 'min']:.0f}-{stats.loc['age', 'max']:.0f} years (median: {stats.loc['age', '50%']:.0f})</li>
+        <li><strong>Study Patterns:</strong> Average study time is {stats.loc['studytime', 'mean']:.2f}/4 scale</li>
+        <li><strong>Attendance:</strong> Mean absences: {stats.loc['absences', 'mean']:.1f} (range: {stats.loc['absences', 'min']:.0f}-{stats.loc['absences', 'max']:.0f})</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def build_performance_figures(filter_key, _filtered_df, _cube_view=None):
+    # Figures for the Performance Analysis tab, built once per filter state
+    filtered_df = _filtered_df
+    # Grouped means from the dataset's cube when the filters allow it, else from the filtered rows
+    aggregates = _cube_view if _cube_view is not None else grouped_aggregates(filtered_df, filter_key)
+    
+    # Performance Category Distribution
+    perf_dist = filtered_df['Performance_Category'].value_counts()
+    fig_perf_cat = px.pie(
+        values=perf_dist.values,
+        names=perf_dist.index,
+        title='Performance Category Distribution',
+        color_discrete_sequence=px.colors.sequential.RdBu,
+        hole=0.4
+    )
+    fig_perf_cat.update_traces(textposition='inside', textinfo='percent+label')
+    
+    # Grade Comparison: G1, G2, G3
+    grade_means = grade_period_means(filtered_df)
+    
+    fig_grade_prog = px.bar(
+        grade_means,
+        x='Grade Period',
+        y='Average Score',
+        title='Average Grades Across Periods',
+        color='Average Score',
+        color_continuous_scale='viridis',
+        text='Average Score'
+    )
+    fig_grade_prog.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    fig_grade_prog.update_layout(yaxis_range=[0, 20])
+    
+    # Study time by performance category
+    study_perf = grade_by(filtered_df, 'studytime', aggregates=aggregates)
+    fig_study_bar = px.bar(
+        study_perf,
+        x='studytime',
+        y='Average_Grade',
+        title='Average Grade by Study Time Level',
+        labels={'studytime': 'Study Time (1:<2h, 2:2-5h, 3:5-10h, 4:>10h)', 'Average_Grade': 'Avg Grade'},
+        color='Average_Grade',
+        color_continuous_scale='blues',
+        text='Average_Grade'
+    )
+    fig_study_bar.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    
+    # Failures impact
+    fig_failures = px.box(
+        filtered_df,
+        x='failures',
+        y='G3', 
+        color='failures',
+        title='Impact of Past Failures on Final Grade',
+        labels={'failures': 'Number of Past Failures', 'G3': 'Final Grade'},
+        color_discrete_sequence=px.colors.sequential.Reds
+    )
+    
+    # School comparison
+    school_perf = grade_by(filtered_df, ['school', 'sex'], aggregates=aggregates)
+    fig_school = px.bar(
+        school_perf,
+        x='school',
+        y='Average_Grade',
+        color='sex',
+        title='Average Grade by School and Gender',
+        labels={'school': 'School', 'Average_Grade': 'Average Grade'},
+        barmode='group',
+        text='Average_Grade'
+    )
+    fig_school.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    
+    # Address type impact
+    address_perf = grade_by(filtered_df, ['address', 'sex'], aggregates=aggregates)
+    fig_address = px.bar(
+        address_perf,
+        x='address',
+        y='Average_Grade',
+        color='sex',
+        title='Average Grade by Address Type and Gender',
+        labels={'address': 'Address (U=Urban, R=Rural)', 'Average_Grade': 'Average Grade'},
+        barmode='group',
+        text='Average_Grade'
+    )
+    fig_address.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    
+    # Parental education impact
+    medu_perf = grade_by(filtered_df, 'Medu', aggregates=aggregates)
+    fig_medu = px.line(
+        medu_perf,
+        x='Medu',
+        y='Average_Grade',
+        title="Mother's Education vs. Student Performance",
+        labels={'Medu': "Mother's Education Level", 'Average_Grade': 'Avg Grade'},
+        markers=True
+    )
+    
+    fedu_perf = grade_by(filtered_df, 'Fedu', aggregates=aggregates)
+    fig_fedu = px.line(
+        fedu_perf,
+        x='Fedu',
+        y='Average_Grade',
+        title="Father's Education vs. Student Performance",
+        labels={'Fedu': "Father's Education Level", 'Average_Grade': 'Avg Grade'},
+        markers=True
+    )
+    
+    return {
+        'perf_cat': fig_perf_cat,
+        'grade_prog': fig_grade_prog,
+        'study_bar': fig_study_bar,
+        'failures': fig_failures,
+        'school': fig_school,
+        'address': fig_address,
+        'medu': fig_medu,
+        'fedu': fig_fedu,
+        'high_absence': descriptive_statistics(filtered_df, filter_key).loc['absences', '75%'],
+    }
+
+
+def scatter_title(title, plotted, total):
+    # Note the sample size on downsampled scatters
+    return title if len(plotted) == total else f"{title} ({len(plotted):,} of {total:,} points)"
+
+
+def add_trendlines(fig, fits, level=0.95):
+    """Draw ``regression.fit_lines`` results onto a scatter in each group's marker color."""
+    colors = {trace.name: trace.marker.color for trace in fig.data if isinstance(trace.marker.color, str)}
+    for label, fit in fits.iterrows():
+        if not np.isfinite(fit['slope']):
+            continue
+        name = '' if label is None else str(label)
+        color = colors.get(name, px.colors.qualitative.Plotly[0])
+        xs = np.linspace(fit['x_min'], fit['x_max'], 50)
+        fitted, lower, upper = confidence_band(fit, xs, level)
+        if np.isfinite(lower).all():
+            fig.add_trace(go.Scatter(
+                x=np.concatenate([xs, xs[::-1]]),
+                y=np.concatenate([upper, lower[::-1]]),
+                fill='toself',
+                fillcolor=color,
+                opacity=0.2,
+                line=dict(width=0),
+                hoverinfo='skip',
+                legendgroup=name,
+                showlegend=False
+            ))
+        fig.add_trace(go.Scatter(
+            x=xs,
+            y=fitted,
+            mode='lines',
+            line=dict(color=color),
+            legendgroup=name,
+            showlegend=False,
+            hovertemplate=f"y = {fit['slope']:.3f}x + {fit['intercept']:.3f}<br>R² = {fit['r_squared']:.3f}<extra>{name or 'OLS'}</extra>"
+        ))
+    return fig
+
+
+def build_grade_progression_figure(filtered_df, x_range=None, y_range=None):
+    points, total = reduce_scatter(filtered_df, 'G1', 'G2', x_range, y_range)
+    fig_grades = px.scatter(
+        points,
+        x='G1',
+        y='G2',
+        size='G3',
+        color='G3',
+        title=scatter_title('Grade Progression Analysis', points, total),
+        hover_data=['school', 'sex', 'age', 'studytime', 'failures', 'absences', 'Average_Grade'],
+        labels={'G1': 'First Period Grade', 'G2': 'Second Period Grade', 'G3': 'Final Grade'},
+        color_continuous_scale='turbo'
+    )
+    fig_grades.add_trace(go.Scatter(
+        x=[0, 20],
+        y=[0, 20],
+        mode='lines',
+        name='Perfect Correlation',
+        line=dict(color='red', dash='dash')
+    ))
+    fig_grades.update_layout(height=500)
+    return fig_grades
+
+
+def build_study_scatter_figure(filtered_df, data_key, x_range=None, y_range=None):
+    points, total = reduce_scatter(filtered_df, 'studytime', 'Average_Grade', x_range, y_range)
+    fig_study = px.scatter(
+        points,
+        x='studytime',
+        y='Average_Grade',
+        color='sex',
+        title=scatter_title('Study Time Impact on Grades', points, total),
+        hover_data=['school', 'age', 'failures', 'absences'],
+        labels={'studytime': 'Study Time Level', 'Average_Grade': 'Average Grade'}
+    )
+    # Trendlines are fitted on every filtered student, not just the plotted sample
+    return add_trendlines(fig_study, trendlines(filtered_df, 'studytime', 'Average_Grade', by='sex', fingerprint=data_key))
+
+
+def build_absences_scatter_figure(filtered_df, data_key, x_range=None, y_range=None):
+    points, total = reduce_scatter(filtered_df, 'absences', 'Average_Grade', x_range, y_range)
+    fig_absences = px.scatter(
+        points,
+        x='absences',
+        y='Average_Grade',
+        color='Performance_Category',
+        title=scatter_title('Impact of Absences on Grades', points, total),
+        hover_data=['school', 'sex', 'age', 'studytime'],
+        labels={'absences': 'Number of Absences', 'Average_Grade': 'Average Grade'}
+    )
+    return add_trendlines(fig_absences, trendlines(filtered_df, 'absences', 'Average_Grade', by='Performance_Category',
+                                                   fingerprint=data_key))
+
+
+def scatter_zoom(filtered_df, x, y, key):
+    """Axis-range controls for a downsampled scatter; returns ``(x_range, y_range)``.
+
+    Only shown when the scatter is downsampled. A window that holds no more
+    than ``SCATTER_POINT_LIMIT`` students is drawn with every point.
+    """
+    if len(filtered_df) <= SCATTER_POINT_LIMIT:
+        return None, None
+
+    ranges = []
+    with st.expander(f"🔍 Zoom: {x} vs {y} (exact points for windows of up to {SCATTER_POINT_LIMIT:,} students)"):
+        for col in [x, y]:
+            values = filtered_df[col]
+            if pd.api.types.is_integer_dtype(values):
+                low, high = int(values.min()), int(values.max())
+            else:
+                low, high = float(values.min()), float(values.max())
+            if low == high:
+                ranges.append(None)
+                continue
+            selected = st.slider(f"{col} range:", low, high, (low, high), key=f"{key}_{col}_range")
+            ranges.append(None if selected == (low, high) else selected)
+    return tuple(ranges)
+
+
+def render_performance(filtered_df, filter_key, cube_view=None):
+    st.header("📈 Performance Analysis")
+    
+    # Shared correlation matrix and cached figures for this filter state
+    corr = correlation_matrix(filtered_df, filter_key)
+    figs = build_performance_figures(filter_key, filtered_df, cube_view)
+    
+    # Grade Distribution
+    st.subheader("📊 Grade Distribution Overview")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(figs['perf_cat'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(figs['grade_prog'], use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Activity G: Interactive Scatter Plots
+    st.subheader('🎯 Activity G: Interactive Performance Visualizations')
+    
+    # Grade Progression
+    st.write("**📈 Grade Progression: G1 vs G2 vs G3**")
+    x_range, y_range = scatter_zoom(filtered_df, 'G1', 'G2', key='grades')
+    fig_grades = cached_figure(build_grade_progression_figure, filtered_df, filter_key,
+                               x_range=x_range, y_range=y_range)
+    st.plotly_chart(fig_grades, use_container_width=True)
+    
+    corr_g1_g2 = corr.loc['G1', 'G2']
+    corr_g2_g3 = corr.loc['G2', 'G3']
+    corr_g1_g3 = corr.loc['G1', 'G3']
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>🎯 Grade Progression Insights:</strong>
+    <ul>
+        <li><strong>G1-G2 Correlation:</strong> {corr_g1_g2:.3f} - {"Strong" if abs(corr_g1_g2) > 0.7 else "Moderate"} consistency</li>
+        <li><strong>G2-G3 Correlation:</strong> {corr_g2_g3:.3f} - {"Strong" if abs(corr_g2_g3) > 0.7 else "Moderate"} final performance predictability</li>
+        <li><strong>G1-G3 Correlation:</strong> {corr_g1_g3:.3f} - Early grades {"strongly" if abs(corr_g1_g3) > 0.7 else "moderately"} predict final outcomes</li>
+        <li><strong>Key Insight:</strong> Students with strong G1 scores tend to maintain or improve performance</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Study Time vs Performance
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**📚 Study Time vs. Average Performance**")
+        x_range, y_range = scatter_zoom(filtered_df, 'studytime', 'Average_Grade', key='study')
+        fig_study = cached_figure(build_study_scatter_figure, filtered_df, filter_key, data_key=filter_key,
+                                  x_range=x_range, y_range=y_range)
+        st.plotly_chart(fig_study, use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(figs['study_bar'], use_container_width=True)
+    
+    correlation_study = corr.loc['studytime', 'Average_Grade']
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>📚 Study Time Analysis:</strong>
+    <ul>
+        <li><strong>Correlation:</strong> {correlation_study:.3f} - {"Positive" if correlation_study > 0 else "Negative"} relationship</li>
+        <li><strong>Trend:</strong> {"More study time generally leads to better grades" if correlation_study > 0.2 else "Weak relationship - study quality matters more than quantity"}</li>
+        <li><strong>Efficiency:</strong> Some high-performing students achieve excellent grades with moderate study time</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Absences vs Performance
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**📅 Absences vs. Performance**")
+        x_range, y_range = scatter_zoom(filtered_df, 'absences', 'Average_Grade', key='absences')
+        fig_absences = cached_figure(build_absences_scatter_figure, filtered_df, filter_key, data_key=filter_key,
+                                     x_range=x_range, y_range=y_range)
+        st.plotly_chart(fig_absences, use_container_width=True)
+    
+    with col2:
+        st.write("**❌ Past Failures vs. Final Grade**")
+        st.plotly_chart(figs['failures'], use_container_width=True)
+    
+    corr_absence = corr.loc['absences', 'Average_Grade']
+    high_absence = figs['high_absence']
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>📅 Attendance & Performance:</strong>
+    <ul>
+        <li><strong>Absence Correlation:</strong> {corr_absence:.3f} - {"Negative" if corr_absence < 0 else "Positive"} impact</li>
+        <li><strong>High Absence Threshold:</strong> >{high_absence:.0f} absences significantly impacts performance</li>
+        <li><strong>Failures Impact:</strong> Students with past failures show lower average final grades</li>
+        <li><strong>Intervention:</strong> Monitor students with >10 absences or any past failures</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Demographic Analysis
+    st.subheader("👥 Demographic Performance Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(figs['school'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(figs['address'], use_container_width=True)
+    
+    # Parental education impact
+    st.write("**👨‍👩‍👧 Parental Education Impact**")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(figs['medu'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(figs['fedu'], use_container_width=True)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def build_correlation_figures(filter_key, _filtered_df):
+    # Heatmap and feature-importance figures, built once per filter state
+    corr = correlation_matrix(_filtered_df, filter_key)
+    
+    # Interactive correlation heatmap with Plotly
+    fig_corr = px.imshow(
+        corr,
+        text_auto='.2f',
+        aspect='auto',
+        title='Correlation Heatmap of Numeric Features',
+        color_continuous_scale='RdBu_r',
+        zmin=-1,
+        zmax=1
+    )
+    fig_corr.update_layout(height=700)
+    
+    g3_correlations = corr['G3'].sort_values(ascending=False)
+    g3_correlations = g3_correlations[g3_correlations.index != 'G3']  # Remove G3 itself
+    
+    fig_importance = px.bar(
+        x=g3_correlations.values,
+        y=g3_correlations.index,
+        orientation='h',
+        title='Feature Correlations with Final Grade (G3)',
+        labels={'x': 'Correlation Coefficient', 'y': 'Feature'},
+        color=g3_correlations.values,
+        color_continuous_scale='RdYlGn',
+        color_continuous_midpoint=0
+    )
+    fig_importance.update_layout(height=600)
+    
+    return {'corr': fig_corr, 'importance': fig_importance}
+
+
+def build_pair_figure(filtered_df, features, color_by):
+    fig_pair = px.scatter_matrix(
+        filtered_df,
+        dimensions=features,
+        color=color_by,
+        title=f"Pair Plot: {', '.join(features)} (colored by {color_by})",
+        height=700
+    )
+    fig_pair.update_traces(diagonal_visible=False, showupperhalf=False)
+    return fig_pair
+
+
+def render_correlations(filtered_df, filter_key):
+    st.header("🔍 Correlations & Detailed Insights")
+    
+    # Activity E: Correlation Heatmap
+    st.subheader("🔥 Activity E: Correlation Heatmap")
+    
+    numeric_df = filtered_df.select_dtypes(include=[np.number])
+    corr = correlation_matrix(filtered_df, filter_key)
+    figs = build_correlation_figures(filter_key, filtered_df)
+    
+    st.plotly_chart(figs['corr'], use_container_width=True)
+    
+    st.markdown("### 🔍 Top Correlations")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        corr_threshold = st.slider("Minimum absolute correlation:", 0.1, 0.95, 0.5, 0.05)
+    with col2:
+        top_k = st.number_input("Pairs to show per direction:", min_value=1, max_value=50, value=5)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**🔴 Strongest Positive Correlations:**")
+        positive_corrs = strong_correlation_pairs(corr, threshold=corr_threshold, top_k=top_k, sign=1)
+        if not positive_corrs.empty:
+            for feat1, feat2, val in positive_corrs.itertuples(index=False):
+                st.write(f"- **{feat1}** ↔ **{feat2}**: {val:.3f}")
+        else:
+            st.write("No strong positive correlations found")
+    
+    with col2:
+        st.markdown("**🔵 Strongest Negative Correlations:**")
+        negative_corrs = strong_correlation_pairs(corr, threshold=corr_threshold, top_k=top_k, sign=-1)
+        if not negative_corrs.empty:
+            for feat1, feat2, val in negative_corrs.itertuples(index=False):
+                st.write(f"- **{feat1}** ↔ **{feat2}**: {val:.3f}")
+        else:
+            st.write("No strong negative correlations found")
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>📊 Correlation Analysis Insights:</strong>
+    <ul>
+        <li><strong>Academic Consistency:</strong> G1, G2, and G3 show very strong positive correlations (>0.8)</li>
+        <li><strong>Parental Education:</strong> Mother's and Father's education levels are correlated</li>
+        <li><strong>Behavioral Patterns:</strong> Daily and weekend alcohol consumption are correlated</li>
+        <li><strong>Performance Predictors:</strong> Early grades (G1) are strong predictors of final outcomes</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Pair Plot Section
+    st.subheader("🔗 Pair Plot Analysis")
+    
+    numeric_columns = [col for col in numeric_df.columns if col != 'Average_Grade']
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected_features = st.multiselect(
+            "Select features for pair plot (2-5 recommended):",
+            numeric_columns,
+            default=['G1', 'G2', 'G3', 'studytime'][:min(4, len(numeric_columns))]
+        )
+    
+    with col2:
+        color_by = st.selectbox(
+            "Color by:",
+            ['sex', 'school', 'address', 'Performance_Category'],
+            index=0
+        )
+    
+    if len(selected_features) >= 2:
+        fig_pair = cached_figure(build_pair_figure, filtered_df, filter_key,
+                                 features=selected_features, color_by=color_by)
+        st.plotly_chart(fig_pair, use_container_width=True)
+    
+        st.markdown("""
+        <div class='insight-box'>
+        <strong>🔗 Pair Plot Insights:</strong>
+        <ul>
+            <li><strong>Matrix View:</strong> Each cell shows relationship between two variables</li>
+            <li><strong>Color Patterns:</strong> Reveals how different groups perform across features</li>
+            <li><strong>Linear Relationships:</strong> Straight-line patterns indicate strong correlations</li>
+            <li><strong>Clusters:</strong> Grouped points suggest categorical differences in behavior</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.info("Please select at least 2 features to generate the pair plot.")
+    
+    st.markdown("---")
+    
+    # Feature Importance Analysis
+    st.subheader("⭐ Feature Importance for Final Grade (G3)")
+    
+    # Calculate correlations with G3
+    g3_correlations = corr['G3'].sort_values(ascending=False)
+    g3_correlations = g3_correlations[g3_correlations.index != 'G3']  # Remove G3 itself
+    
+    st.plotly_chart(figs['importance'], use_container_width=True)
+    
+    top_positive = g3_correlations.nlargest(5)
+    top_negative = g3_correlations.nsmallest(5)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**✅ Top Positive Predictors:**")
+        for feat, val in top_positive.items():
+            st.write(f"- **{feat}**: {val:.3f}")
+    
+    with col2:
+        st.markdown("**⚠️ Top Negative Predictors:**")
+        for feat, val in top_negative.items():
+            st.write(f"- **{feat}**: {val:.3f}")
+
+
+def add_stats_box(fig, df, column, column_stats, color, normalize=False):
+    """Box drawn from precomputed statistics, with one marker per distinct outlier value."""
+    fig.add_trace(go.Box(
+        name=column,
+        x=[column],
+        marker_color=color,
+        boxmean='sd',
+        legendgroup=column,
+        **box_trace_args(column_stats, normalize)
+    ))
+    outliers = outlier_values(df, column, column_stats, normalize)
+    if len(outliers):
+        fig.add_trace(go.Scatter(
+            x=[column] * len(outliers),
+            y=outliers.index,
+            customdata=outliers.to_numpy(),
+            mode='markers',
+            marker=dict(color=color, size=5),
+            legendgroup=column,
+            showlegend=False,
+            hovertemplate='%{y}<br>%{customdata} students<extra>' + column + '</extra>'
+        ))
+
+
+def build_box_figure(filtered_df, data_key, features, summary_only=False):
+    # Normalized boxplot; with summary_only the boxes come from precomputed statistics instead of every point
+    fig_box = go.Figure()
+    colors = px.colors.qualitative.Plotly
+
+    if summary_only:
+        stats = descriptive_statistics(filtered_df, data_key)
+        for i, col in enumerate(features):
+            add_stats_box(fig_box, filtered_df, col, stats.loc[col], colors[i % len(colors)], normalize=True)
+    else:
+        normalized = min_max_normalize(filtered_df, features)
+        for col in features:
+            fig_box.add_trace(go.Box(
+                y=normalized[col].to_numpy(),
+                name=col,
+                boxmean='sd'
+            ))
+
+    fig_box.update_layout(
+        title='Normalized Boxplot of Selected Features',
+        yaxis_title='Normalized Values (0-1)',
+        height=500,
+        showlegend=True
+    )
+    return fig_box
+
+
+def build_histogram_figure(filtered_df, data_key, feature):
+    # Bars from pre-binned counts per gender (one bin per value for integer features), with
+    # boxes from precomputed statistics in the top margin, so no raw rows reach the browser
+    hist = histograms(filtered_df, by='sex', fingerprint=data_key)[feature]
+    fig = go.Figure()
+    colors = px.colors.qualitative.Plotly
+    if hist is None:
+        return fig.update_layout(title=f'Distribution of {feature}')
+
+    for i, sex in enumerate(hist.groups):
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Bar(
+            x=hist.centers,
+            y=hist.counts[i],
+            width=hist.widths,
+            name=sex,
+            marker_color=color,
+            legendgroup=sex,
+            customdata=np.column_stack([hist.edges[:-1], hist.edges[1:]]),
+            hovertemplate=f'sex={sex}<br>{feature}=%{{customdata[0]:.4g}} - %{{customdata[1]:.4g}}<br>count=%{{y}}<extra></extra>'
+        ))
+        group_df = filtered_df.loc[filtered_df['sex'] == sex, [feature]]
+        group_stats = compute_statistics(group_df).loc[feature]
+        if not group_stats['count']:
+            continue
+        box_args = box_trace_args(group_stats)
+        fig.add_trace(go.Box(
+            y=[sex],
+            name=sex,
+            orientation='h',
+            marker_color=color,
+            legendgroup=sex,
+            showlegend=False,
+            yaxis='y2',
+            q1=box_args['q1'],
+            median=box_args['median'],
+            q3=box_args['q3'],
+            lowerfence=box_args['lowerfence'],
+            upperfence=box_args['upperfence']
+        ))
+        outliers = outlier_values(group_df, feature, group_stats)
+        if len(outliers):
+            fig.add_trace(go.Scatter(
+                x=outliers.index,
+                y=[sex] * len(outliers),
+                customdata=outliers.to_numpy(),
+                mode='markers',
+                marker=dict(color=color, size=5),
+                legendgroup=sex,
+                showlegend=False,
+                yaxis='y2',
+                hovertemplate='%{x}<br>%{customdata} students<extra>' + sex + '</extra>'
+            ))
+
+    fig.update_layout(
+        title=f'Distribution of {feature}',
+        barmode='relative',
+        bargap=0,
+        legend_title_text='sex',
+        xaxis=dict(title=feature),
+        yaxis=dict(title='count', domain=[0, 0.7326]),
+        yaxis2=dict(domain=[0.7426, 1], anchor='x', showticklabels=False, showgrid=False)
+    )
+    return fig
+
+
+def build_violin_figure(filtered_df, feature):
+    return px.violin(
+        filtered_df,
+        y=feature,
+        x='sex',
+        color='sex',
+        box=True,
+        title=f'Violin Plot: {feature} by Gender'
+    )
+
+
+def build_category_count_figure(filtered_df, data_key, column):
+    cat_counts = category_counts(filtered_df, column, grouped_aggregates(filtered_df, data_key))
+
+    fig_cat_count = px.bar(
+        cat_counts,
+        x=column,
+        y='count',
+        title=f'Distribution of {column}',
+        color='count',
+        color_continuous_scale='viridis',
+        text='count'
+    )
+    fig_cat_count.update_traces(textposition='outside')
+    return fig_cat_count
+
+
+def build_category_grade_figure(filtered_df, data_key, column):
+    cat_perf = grade_by(filtered_df, column, aggregates=grouped_aggregates(filtered_df, data_key))
+    cat_perf = cat_perf.sort_values('Average_Grade', ascending=False)
+
+    fig_cat_perf = px.bar(
+        cat_perf,
+        x=column,
+        y='Average_Grade',
+        title=f'Average Grade by {column}',
+        color='Average_Grade',
+        color_continuous_scale='RdYlGn',
+        text='Average_Grade'
+    )
+    fig_cat_perf.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    return fig_cat_perf
+
+
+def build_custom_scatter_figure(filtered_df, data_key, x, y, color, x_range=None, y_range=None):
+    points, total = reduce_scatter(filtered_df, x, y, x_range, y_range)
+    fig_custom = px.scatter(
+        points,
+        x=x,
+        y=y,
+        color=color,
+        size='G3',
+        title=scatter_title(f'Custom Analysis: {x} vs {y}', points, total),
+        hover_data=['school', 'sex', 'age', 'Average_Grade']
+    )
+    return add_trendlines(fig_custom, trendlines(filtered_df, x, y, by=color, fingerprint=data_key))
+
+
+def render_exploration(filtered_df, filter_key):
+    st.header("📋 Data Exploration")
+    
+    numeric_df = filtered_df.select_dtypes(include=[np.number])
+    
+    # Activity F: Boxplot
+    st.subheader("📦 Activity F: Boxplot Visualization")
+    
+    # Select features for boxplot
+    available_features = numeric_df.columns.tolist()
+    selected_box_features = st.multiselect(
+        "Select features to visualize (max 10):",
+        available_features,
+        default=['G1', 'G2', 'G3', 'studytime', 'absences', 'failures'][:min(6, len(available_features))]
+    )
+    
+    box_summary_only = st.checkbox(
+        "Precomputed box statistics (smaller chart)",
+        value=len(filtered_df) > SCATTER_POINT_LIMIT,
+        help="Send each box's quartiles, whiskers, mean, SD and distinct outlier values instead of every data point"
+    )
+    
+    if selected_box_features:
+        fig_box = cached_figure(build_box_figure, filtered_df, filter_key, data_key=filter_key,
+                                features=selected_box_features, summary_only=box_summary_only)
+        st.plotly_chart(fig_box, use_container_width=True)
+    
+        st.markdown("""
+        <div class='insight-box'>
+        <strong>📦 Boxplot Analysis:</strong>
+        <ul>
+            <li><strong>Box:</strong> Contains middle 50% of data (IQR)</li>
+            <li><strong>Line in Box:</strong> Median value</li>
+            <li><strong>Whiskers:</strong> Extend to 1.5×IQR</li>
+            <li><strong>Dots:</strong> Outliers beyond whiskers</li>
+            <li><strong>Insight:</strong> Grades show normal distribution; absences/failures are right-skewed</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Distribution Analysis
+    st.subheader("📊 Distribution Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Histogram
+        hist_feature = st.selectbox(
+            "Select feature for histogram:",
+            numeric_df.columns.tolist(),
+            index=numeric_df.columns.tolist().index('G3') if 'G3' in numeric_df.columns else 0
+        )
+    
+        fig_hist = cached_figure(build_histogram_figure, filtered_df, filter_key, data_key=filter_key, feature=hist_feature)
+        st.plotly_chart(fig_hist, use_container_width=True)
+    
+    with col2:
+        # Violin plot
+        violin_feature = st.selectbox(
+            "Select feature for violin plot:",
+            numeric_df.columns.tolist(),
+            index=numeric_df.columns.tolist().index('Average_Grade') if 'Average_Grade' in numeric_df.columns else 0
+        )
+    
+        fig_violin = cached_figure(build_violin_figure, filtered_df, filter_key, feature=violin_feature)
+        st.plotly_chart(fig_violin, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Categorical Analysis
+    st.subheader("🏷️ Categorical Feature Analysis")
+    
+    selected_cat = st.selectbox(
+        "Select categorical feature for detailed analysis:",
+        CATEGORICAL_COLUMNS,
+        index=0
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Count distribution
+        fig_cat_count = cached_figure(build_category_count_figure, filtered_df, filter_key, data_key=filter_key, column=selected_cat)
+        st.plotly_chart(fig_cat_count, use_container_width=True)
+    
+    with col2:
+        # Performance by category
+        fig_cat_perf = cached_figure(build_category_grade_figure, filtered_df, filter_key, data_key=filter_key, column=selected_cat)
+        st.plotly_chart(fig_cat_perf, use_container_width=True)
+    
+    # Summary statistics
+    st.write(f"**📈 Statistical Summary by {selected_cat}:**")
+    
+    summary_stats = categorical_summary(filtered_df, selected_cat, grouped_aggregates(filtered_df, filter_key))
+    
+    st.dataframe(summary_stats, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Advanced Filters and Custom Analysis
+    st.subheader("🔬 Custom Analysis Builder")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        x_axis = st.selectbox("X-axis:", numeric_df.columns.tolist(), index=0)
+    with col2:
+        y_axis = st.selectbox("Y-axis:", numeric_df.columns.tolist(), 
+                             index=1 if len(numeric_df.columns) > 1 else 0)
+    with col3:
+        color_var = st.selectbox("Color by:", 
+                                ['None', 'sex', 'school', 'address', 'Performance_Category'],
+                                index=1)
+    
+    color_param = None if color_var == 'None' else color_var
+    
+    x_range, y_range = scatter_zoom(filtered_df, x_axis, y_axis, key='custom')
+    fig_custom = cached_figure(build_custom_scatter_figure, filtered_df, filter_key, data_key=filter_key,
+                               x=x_axis, y=y_axis, color=color_param, x_range=x_range, y_range=y_range)
+    st.plotly_chart(fig_custom, use_container_width=True)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def build_key_question_figures(filter_key, _filtered_df):
+    # Figures for the Key Questions tab, built once per filter state
+    filtered_df = _filtered_df
+    corr = correlation_matrix(filtered_df, filter_key)
+    
+    # Question 2: study time correlation with each grade
+    corr_study = corr.loc['studytime', ['G1', 'G2', 'G3', 'Average_Grade']]
+    study_grade_data = pd.DataFrame({
+        'Grade Type': ['G1', 'G2', 'G3', 'Average'],
+        'Correlation': corr_study.values
+    })
+    
+    fig_q2 = px.bar(
+        study_grade_data,
+        x='Grade Type',
+        y='Correlation',
+        title='Study Time Correlation with Different Grade Types',
+        color='Correlation',
+        color_continuous_scale='RdYlGn',
+        color_continuous_midpoint=0,
+        text='Correlation'
+    )
+    fig_q2.update_traces(texttemplate='%{text:.3f}', textposition='outside')
+    
+    # Question 3: comprehensive boxplot for key metrics
+    key_metrics = ['G1', 'G2', 'G3', 'studytime', 'failures', 'absences', 'Medu', 'Fedu']
+    available_metrics = [m for m in key_metrics if m in filtered_df.columns]
+    
+    stats = descriptive_statistics(filtered_df, filter_key)
+    colors = px.colors.qualitative.Plotly
+    
+    fig_q3 = go.Figure()
+    
+    for i, col in enumerate(available_metrics):
+        add_stats_box(fig_q3, filtered_df, col, stats.loc[col], colors[i % len(colors)])
+    
+    fig_q3.update_layout(
+        title='Boxplot Distribution of Key Features',
+        yaxis_title='Values',
+        height=500,
+        showlegend=True
+    )
+    
+    # Question 4: final grade by gender
+    fig_q4 = go.Figure()
+    
+    fig_q4.add_trace(go.Box(
+        y=filtered_df[filtered_df['sex'] == 'M']['G3'],
+        name='Male',
+        marker_color='lightblue',
+        boxmean='sd'
+    ))
+    
+    fig_q4.add_trace(go.Box(
+        y=filtered_df[filtered_df['sex'] == 'F']['G3'],
+        name='Female',
+        marker_color='lightpink',
+        boxmean='sd'
+    ))
+    
+    fig_q4.update_layout(
+        title='Final Grade (G3) Distribution by Gender',
+        yaxis_title='Final Grade (G3)',
+        height=500
+    )
+    
+    # Performance category mix by gender
+    gender_perf_cat = performance_mix_by_gender(filtered_df)
+    
+    fig_gender_cat = px.bar(
+        gender_perf_cat.T,
+        title='Performance Category Distribution by Gender (%)',
+        labels={'value': 'Percentage', 'Performance_Category': 'Performance Category'},
+        barmode='group'
+    )
+    
+    return {'q2': fig_q2, 'q3': fig_q3, 'q4': fig_q4, 'gender_cat': fig_gender_cat}
+
+
+def render_key_questions(filtered_df, filter_key):
+    st.header("❓ Key Questions & Answers")
+    
+    st.markdown("""
+    This section addresses the key analytical questions from the lab exercise.
+    """)
+    
+    # Question 1
+    st.subheader("1️⃣ Which features have the highest correlation with final exam scores (G1, G2, G3)?")
+    
+    corr = correlation_matrix(filtered_df, filter_key)
+    figs = build_key_question_figures(filter_key, filtered_df)
+    g1_corr = top_correlations(corr, 'G1')
+    g2_corr = top_correlations(corr, 'G2')
+    g3_corr = top_correlations(corr, 'G3')
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**📝 G1 (First Period)**")
+        st.write("Top 5 Correlations:")
+        for feat, val in g1_corr.items():
+            st.write(f"- {feat}: **{val:.3f}**")
+    
+    with col2:
+        st.markdown("**📝 G2 (Second Period)**")
+        st.write("Top 5 Correlations:")
+        for feat, val in g2_corr.items():
+            st.write(f"- {feat}: **{val:.3f}**")
+    
+    with col3:
+        st.markdown("**📝 G3 (Final Grade)**")
+        st.write("Top 5 Correlations:")
+        for feat, val in g3_corr.items():
+            st.write(f"- {feat}: **{val:.3f}**")
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>💡 Answer:</strong>
+    <ul>
+        <li><strong>Strongest Predictors:</strong> G1 and G2 are the strongest predictors of G3 (correlation >0.8)</li>
+        <li><strong>Academic History:</strong> Previous grades show the highest correlation with final performance</li>
+        <li><strong>Other Factors:</strong> Parental education (Medu, Fedu) and past failures also show moderate correlations</li>
+        <li><strong>Key Insight:</strong> Early academic performance is the best predictor of final outcomes</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Question 2
+    st.subheader("2️⃣ How does study time correlate with exam performance?")
+    
+    corr_study_g1 = corr.loc['studytime', 'G1']
+    corr_study_g2 = corr.loc['studytime', 'G2']
+    corr_study_g3 = corr.loc['studytime', 'G3']
+    corr_study_avg = corr.loc['studytime', 'Average_Grade']
+    
+    st.plotly_chart(figs['q2'], use_container_width=True)
+    
+    # Detailed analysis by study time level
+    study_analysis = study_time_analysis(filtered_df, grouped_aggregates(filtered_df, filter_key))
+    
+    st.write("**Average Grades by Study Time Level:**")
+    st.dataframe(study_analysis, use_container_width=True)
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>💡 Answer:</strong>
+    <ul>
+        <li><strong>Overall Correlation:</strong> {corr_study_avg:.3f} - {"Positive but moderate" if 0.1 < corr_study_avg < 0.3 else "Strong positive" if corr_study_avg >= 0.3 else "Weak"} relationship</li>
+        <li><strong>Pattern:</strong> Study time shows {"consistent positive correlation" if corr_study_avg > 0.1 else "minimal correlation"} with all grade periods</li>
+        <li><strong>Quality vs Quantity:</strong> Some students achieve high grades with less study time, suggesting study efficiency matters</li>
+        <li><strong>Recommendation:</strong> Focus on effective study strategies rather than just increasing hours</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Question 3
+    st.subheader("3️⃣ What insights can you draw from the boxplot?")
+    
+    # Comprehensive boxplot for key metrics
+    st.plotly_chart(figs['q3'], use_container_width=True)
+    
+    # Calculate statistics
+    stats = descriptive_statistics(filtered_df, filter_key)
+    outliers = outlier_counts(stats)
+    grade_outliers = outliers['low_grade']
+    absence_outliers = outliers['high_absence']
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>💡 Answer - Key Boxplot Insights:</strong>
+    <ul>
+        <li><strong>Grade Distribution:</strong> G1, G2, G3 show relatively symmetric distributions around median of ~{stats.loc['G3', '50%']:.1f}</li>
+        <li><strong>Spread:</strong> Interquartile range indicates diverse student performance levels</li>
+        <li><strong>Outliers:</strong> {grade_outliers} students with exceptionally low grades; {absence_outliers} students with very high absences</li>
+        <li><strong>Study Time:</strong> Most students cluster around level 2 (2-5 hours weekly)</li>
+        <li><strong>Failures:</strong> Right-skewed distribution - most students have 0 failures, few with multiple</li>
+        <li><strong>Absences:</strong> Heavy right skew - most attend regularly, some chronic absentees</li>
+        <li><strong>Parental Education:</strong> Varies widely, showing diverse family backgrounds</li>
+        <li><strong>Actionable Insight:</strong> Focus intervention on outlier students (low performers, high absences)</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Question 4
+    st.subheader("4️⃣ How does gender impact the final exam score?")
+    
+    # Statistical comparison
+    gender_stats = gender_comparison(filtered_df)
+    male_stats = gender_stats['M']
+    female_stats = gender_stats['F']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**👨 Male Students (M)**")
+        st.write(f"- **Count:** {male_stats['count']:.0f}")
+        st.write(f"- **Mean:** {male_stats['mean']:.2f}")
+        st.write(f"- **Median:** {male_stats['median']:.2f}")
+        st.write(f"- **Std Dev:** {male_stats['std']:.2f}")
+        st.write(f"- **Min:** {male_stats['min']:.0f}")
+        st.write(f"- **Max:** {male_stats['max']:.0f}")
+    
+    with col2:
+        st.markdown("**👩 Female Students (F)**")
+        st.write(f"- **Count:** {female_stats['count']:.0f}")
+        st.write(f"- **Mean:** {female_stats['mean']:.2f}")
+        st.write(f"- **Median:** {female_stats['median']:.2f}")
+        st.write(f"- **Std Dev:** {female_stats['std']:.2f}")
+        st.write(f"- **Min:** {female_stats['min']:.0f}")
+        st.write(f"- **Max:** {female_stats['max']:.0f}")
+    
+    st.plotly_chart(figs['q4'], use_container_width=True)
+    
+    st.plotly_chart(figs['gender_cat'], use_container_width=True)
+    
+    diff = gender_stats['mean_difference']
+    
+    st.markdown(f"""
+    <div class='insight-box'>
+    <strong>💡 Answer - Gender Impact on Performance:</strong>
+    <ul>
+        <li><strong>Mean Difference:</strong> {"Females" if diff > 0 else "Males"} score {abs(diff):.2f} points higher on average</li>
+        <li><strong>Statistical Significance:</strong> {"Moderate" if abs(diff) > 1 else "Minimal"} gender difference in performance</li>
+        <li><strong>Distribution:</strong> Both genders show similar spread and distribution patterns</li>
+        <li><strong>Pass Rates:</strong> {"Females" if female_stats['pass_rate'] > male_stats['pass_rate'] else "Males"} have slightly higher pass rates</li>
+        <li><strong>Variability:</strong> {"Males" if male_stats['std'] > female_stats['std'] else "Females"} show slightly more variation in scores</li>
+        <li><strong>Conclusion:</strong> Gender has {"minimal" if abs(diff) < 1 else "moderate"} direct impact; individual factors matter more</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Summary and Recommendations
+    st.subheader("📌 Overall Summary & Recommendations")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class='insight-box'>
+        <strong>🎯 Key Findings:</strong>
+        <ul>
+            <li>Early grades (G1, G2) are strongest predictors of final performance</li>
+            <li>Study time shows positive but moderate correlation with grades</li>
+            <li>Past failures and absences negatively impact performance</li>
+            <li>Parental education influences student outcomes</li>
+            <li>Gender differences are minimal compared to individual factors</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class='insight-box'>
+        <strong>💼 Recommendations:</strong>
+        <ul>
+            <li>Implement early intervention for students with low G1 scores</li>
+            <li>Focus on study quality and efficiency training</li>
+            <li>Monitor and support students with high absence rates</li>
+            <li>Provide additional resources for students with past failures</li>
+            <li>Consider family background in support programs</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
 
 st.markdown("""
 <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@flaticon/flaticon-uicons/css/all/all.min.css">
@@ -135,25 +1517,23 @@ st.markdown("---")
 # File uploader
 st.subheader("📁 Upload Dataset")
 uploaded_file = st.file_uploader("Upload CSV file here:", type="csv", help="Upload the student performance dataset")
+large_file_mode = st.checkbox(
+    "⚡ Large file mode",
+    value=uploaded_file is not None and uploaded_file.size >= STREAMING_THRESHOLD_BYTES,
+    help=f"Summarize the file in chunks without loading it into memory. Filters and detailed charts are unavailable in this mode. Turned on for files of {STREAMING_THRESHOLD_BYTES // 1024 ** 2} MB or more; uncheck it to load them fully."
+)
 
-if uploaded_file is not None:
+if uploaded_file is not None and large_file_mode:
     
-    # Load dataset
-    df = pd.read_csv(uploaded_file, delimiter=';')
-    df['Average_Grade'] = ((df['G1'] + df['G2'] + df['G3']) / 3).round(2)
-    
-    # Performance categories
-    def categorize_performance(grade):
-        if grade >= 16:
-            return 'Excellent'
-        elif grade >= 14:
-            return 'Good'
-        elif grade >= 10:
-            return 'Average'
-        else:
-            return 'Needs Improvement'
+    # Streaming summary (running aggregates, the full frame is never built)
+    render_streaming_overview(load_summary(uploaded_file))
+
+elif uploaded_file is not None:
     
-    df['Performance_Category'] = df['G3'].apply(categorize_performance)
+    # Load dataset (parsed once per unique file, cached across reruns)
+    dataset_key, df, rejected_rows = load_dataset(uploaded_file)
+    if rejected_rows:
+        st.warning(f"⚠️ {rejected_rows} rows were skipped because their values don't match the documented dataset attributes (see student.txt).")
     
     # Sidebar Configuration
     st.sidebar.markdown("## Dashboard Controls")
@@ -263,19 +1643,33 @@ if uploaded_file is not None:
         help="Filter by internet access at home"
     )
     
-    # Apply Filters
-    filtered_df = df[
-        (df['school'].isin(school_filter)) &
-        (df['sex'].isin(sex_filter)) &
-        (df['age'] >= age_filter[0]) & (df['age'] <= age_filter[1]) &
-        (df['address'].isin(address_filter)) &
-        (df['Medu'] >= medu_filter[0]) & (df['Medu'] <= medu_filter[1]) &
-        (df['Fedu'] >= fedu_filter[0]) & (df['Fedu'] <= fedu_filter[1]) &
-        (df['studytime'] >= studytime_filter[0]) & (df['studytime'] <= studytime_filter[1]) &
-        (df['failures'] >= failures_filter[0]) & (df['failures'] <= failures_filter[1]) &
-        (df['absences'] >= absences_filter[0]) & (df['absences'] <= absences_filter[1]) &
-        (df['internet'].isin(internet_filter))
-    ]
+    # Apply Filters (per-value bitmaps, sorted indexes and Overview totals are built once per dataset)
+    filter_engine = st.session_state.get('filter_engine')
+    if filter_engine is None or filter_engine.dataset_key != dataset_key:
+        filter_engine = FilterEngine(df, dataset_key)
+        st.session_state['filter_engine'] = filter_engine
+        st.session_state['overview_metrics'] = IncrementalMetrics(metrics_kernel(df, dataset_key), dataset_key)
+    
+    isin_filters = {
+        'school': school_filter,
+        'sex': sex_filter,
+        'address': address_filter,
+        'internet': internet_filter,
+    }
+    between_filters = {
+        'age': age_filter,
+        'Medu': medu_filter,
+        'Fedu': fedu_filter,
+        'studytime': studytime_filter,
+        'failures': failures_filter,
+        'absences': absences_filter,
+    }
+    filtered_df = filter_engine.apply(isin=isin_filters, between=between_filters)
+    
+    filter_key = filter_engine.fingerprint
+    
+    # Cell statistics built once per dataset; None when the age or absences range excludes students
+    cube_view = grade_cube(df, dataset_key).view(isin=isin_filters, between=between_filters)
     
     st.sidebar.markdown("---")
     st.sidebar.metric("📊 Filtered Records", f"{len(filtered_df)} / {len(df)}")
@@ -285,1051 +1679,36 @@ if uploaded_file is not None:
     if st.sidebar.button("🔄 Reset All Filters", use_container_width=True):
         st.rerun()
     
-    # Main Content Tabs
+    # Main Content Tabs (switching tabs reruns the script and only the open tab is rendered)
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📊 Overview", 
         "📈 Performance Analysis", 
         "🔍 Correlations & Insights",
         "📋 Data Exploration",
         "❓ Key Questions"
-    ])
+    ], key="main_tabs", on_change="rerun")
     
-    # ==================== TAB 1: OVERVIEW ====================
-    with tab1:
-        st.header("📊 Dataset Overview")
-        
-        # Key Metrics Row 1
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "👥 Total Students",
-                f"{len(filtered_df)}",
-                delta=f"{len(filtered_df) - len(df)} from total",
-                help="Number of students in filtered dataset"
-            )
-        
-        with col2:
-            avg_final = filtered_df['G3'].mean()
-            st.metric(
-                "📝 Avg Final Grade (G3)",
-                f"{avg_final:.2f} / 20",
-                delta=f"{avg_final - df['G3'].mean():.2f} vs total",
-                help="Average final grade (G3)"
-            )
-        
-        with col3:
-            avg_study = filtered_df['studytime'].mean()
-            st.metric(
-                "📚 Avg Study Time",
-                f"{avg_study:.2f} / 4",
-                delta=f"{avg_study - df['studytime'].mean():.2f} vs total",
-                help="Average weekly study time"
-            )
-        
-        with col4:
-            pass_rate = (filtered_df['G3'] >= 10).sum() / len(filtered_df) * 100
-            st.metric(
-                "✅ Pass Rate",
-                f"{pass_rate:.1f}%",
-                help="Percentage of students with G3 >= 10"
-            )
-        
-        # Key Metrics Row 2
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "🏫 School Split",
-                f"GP: {(filtered_df['school'] == 'GP').sum()}",
-                delta=f"MS: {(filtered_df['school'] == 'MS').sum()}",
-                help="Distribution across schools"
-            )
-        
-        with col2:
-            st.metric(
-                "👥 Gender Split",
-                f"F: {(filtered_df['sex'] == 'F').sum()}",
-                delta=f"M: {(filtered_df['sex'] == 'M').sum()}",
-                help="Gender distribution"
-            )
-        
-        with col3:
-            avg_absences = filtered_df['absences'].mean()
-            st.metric(
-                "📅 Avg Absences",
-                f"{avg_absences:.1f}",
-                delta=f"{avg_absences - df['absences'].mean():.1f} vs total",
-                help="Average number of absences"
-            )
-        
-        with col4:
-            failure_rate = (filtered_df['failures'] > 0).sum() / len(filtered_df) * 100
-            st.metric(
-                "❌ Students with Failures",
-                f"{failure_rate:.1f}%",
-                help="Percentage with past failures"
-            )
-        
-        st.markdown("---")
-        
-        # Data Preview
-        st.subheader('📋 Activity B: Data Preview')
-        
-        # Display options
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            num_rows = st.slider("Number of rows to display:", 5, 50, 10)
-        with col2:
-            show_all_cols = st.checkbox("Show all columns", value=False)
-        
-        if show_all_cols:
-            st.dataframe(filtered_df.head(num_rows), use_container_width=True)
-        else:
-            display_cols = ['school', 'sex', 'age', 'address', 'studytime', 'failures', 
-                          'absences', 'G1', 'G2', 'G3', 'Average_Grade', 'Performance_Category']
-            st.dataframe(filtered_df[display_cols].head(num_rows), use_container_width=True)
-        
-        st.markdown("""
-        <div class='insight-box'>
-        <strong>📋 Dataset Insights:</strong>
-        <ul>
-            <li>Each row represents a <strong>unique student</strong> with academic and personal characteristics</li>
-            <li>Key features include <strong>demographics</strong> (age, sex, address), <strong>family background</strong> (parental education, jobs), and <strong>academic performance</strong> (G1, G2, G3 grades)</li>
-            <li>The data provides a comprehensive view of factors influencing student success</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Dataset Information and Missing Values
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader('🔍 Activity C.1: Dataset Information')
-            
-            # Create a summary dataframe
-            info_data = {
-                'Column': filtered_df.columns,
-                'Non-Null Count': [filtered_df[col].count() for col in filtered_df.columns],
-                'Dtype': [filtered_df[col].dtype for col in filtered_df.columns]
-            }
-            info_df = pd.DataFrame(info_data)
-            
-            st.dataframe(info_df, use_container_width=True, height=300)
-            
-            st.markdown(f"""
-            <div class='insight-box'>
-            <strong>🔍 Data Structure:</strong>
-            <ul>
-                <li><strong>Total Columns:</strong> {len(filtered_df.columns)}</li>
-                <li><strong>Total Rows:</strong> {len(filtered_df)}</li>
-                <li><strong>Numerical Features:</strong> {len(filtered_df.select_dtypes(include=[np.number]).columns)}</li>
-                <li><strong>Categorical Features:</strong> {len(filtered_df.select_dtypes(exclude=[np.number]).columns)}</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.subheader('✅ Activity C.2: Missing Values')
-            
-            missing_df = pd.DataFrame({
-                'Column': filtered_df.columns,
-                'Missing Values': filtered_df.isnull().sum(),
-                'Percentage': (filtered_df.isnull().sum() / len(filtered_df) * 100).round(2)
-            })
-            
-            st.dataframe(missing_df, use_container_width=True, height=300)
-            
-            missing_count = filtered_df.isnull().sum().sum()
-            st.markdown(f"""
-            <div class='insight-box'>
-            <strong>✅ Data Quality:</strong>
-            <ul>
-                <li><strong>Total Missing Values:</strong> {missing_count}</li>
-                <li><strong>Status:</strong> {"🎉 Excellent - No missing values!" if missing_count == 0 else "⚠️ Some missing values detected"}</li>
-                <li><strong>Reliability:</strong> {"High data integrity for analysis" if missing_count == 0 else "May need data cleaning"}</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Summary Statistics
-        st.subheader('📊 Activity D: Summary Statistics')
-        
-        st.dataframe(filtered_df.describe(), use_container_width=True)
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>📈 Statistical Overview:</strong>
-        <ul>
-            <li><strong>Grade Range:</strong> G3 scores range from {filtered_df['G3'].min():.0f} to {filtered_df['G3'].max():.0f} (out of 20)</li>
-            <li><strong>Average Performance:</strong> Mean final grade is {filtered_df['G3'].mean():.2f}/20</li>
-            <li><strong>Age Distribution:</strong> Students aged {filtered_df['age'].min()}-{filtered_df['age'].max()} years (median: {filtered_df['age'].median():.0f})</li>
-            <li><strong>Study Patterns:</strong> Average study time is {filtered_df['studytime'].mean():.2f}/4 scale</li>
-            <li><strong>Attendance:</strong> Mean absences: {filtered_df['absences'].mean():.1f} (range: {filtered_df['absences'].min()}-{filtered_df['absences'].max()})</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
+    if tab1.open:
+        with tab1:
+            # Tile totals are updated from the rows that entered or left the selection since the last update
+            overview = st.session_state['overview_metrics']
+            render_overview(filtered_df, filter_key, overview.update(filter_engine.last_mask), overview.kernel.baseline)
     
-    # ==================== TAB 2: PERFORMANCE ANALYSIS ====================
-    with tab2:
-        st.header("📈 Performance Analysis")
-        
-        # Grade Distribution
-        st.subheader("📊 Grade Distribution Overview")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Performance Category Distribution
-            perf_dist = filtered_df['Performance_Category'].value_counts()
-            fig_perf_cat = px.pie(
-                values=perf_dist.values,
-                names=perf_dist.index,
-                title='Performance Category Distribution',
-                color_discrete_sequence=px.colors.sequential.RdBu,
-                hole=0.4
-            )
-            fig_perf_cat.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig_perf_cat, use_container_width=True)
-        
-        with col2:
-            # Grade Comparison: G1, G2, G3
-            grade_means = pd.DataFrame({
-                'Grade Period': ['G1', 'G2', 'G3'],
-                'Average Score': [
-                    filtered_df['G1'].mean(),
-                    filtered_df['G2'].mean(),
-                    filtered_df['G3'].mean()
-                ]
-            })
-            
-            fig_grade_prog = px.bar(
-                grade_means,
-                x='Grade Period',
-                y='Average Score',
-                title='Average Grades Across Periods',
-                color='Average Score',
-                color_continuous_scale='viridis',
-                text='Average Score'
-            )
-            fig_grade_prog.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-            fig_grade_prog.update_layout(yaxis_range=[0, 20])
-            st.plotly_chart(fig_grade_prog, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Activity G: Interactive Scatter Plots
-        st.subheader('🎯 Activity G: Interactive Performance Visualizations')
-        
-        # Grade Progression
-        st.write("**📈 Grade Progression: G1 vs G2 vs G3**")
-        fig_grades = px.scatter(
-            filtered_df,
-            x='G1',
-            y='G2',
-            size='G3',
-            color='G3',
-            title='Grade Progression Analysis',
-            hover_data=['school', 'sex', 'age', 'studytime', 'failures', 'absences', 'Average_Grade'],
-            labels={'G1': 'First Period Grade', 'G2': 'Second Period Grade', 'G3': 'Final Grade'},
-            color_continuous_scale='turbo'
-        )
-        fig_grades.add_trace(go.Scatter(
-            x=[0, 20],
-            y=[0, 20],
-            mode='lines',
-            name='Perfect Correlation',
-            line=dict(color='red', dash='dash')
-        ))
-        fig_grades.update_layout(height=500)
-        st.plotly_chart(fig_grades, use_container_width=True)
-        
-        corr_g1_g2 = filtered_df['G1'].corr(filtered_df['G2'])
-        corr_g2_g3 = filtered_df['G2'].corr(filtered_df['G3'])
-        corr_g1_g3 = filtered_df['G1'].corr(filtered_df['G3'])
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>🎯 Grade Progression Insights:</strong>
-        <ul>
-            <li><strong>G1-G2 Correlation:</strong> {corr_g1_g2:.3f} - {"Strong" if abs(corr_g1_g2) > 0.7 else "Moderate"} consistency</li>
-            <li><strong>G2-G3 Correlation:</strong> {corr_g2_g3:.3f} - {"Strong" if abs(corr_g2_g3) > 0.7 else "Moderate"} final performance predictability</li>
-            <li><strong>G1-G3 Correlation:</strong> {corr_g1_g3:.3f} - Early grades {"strongly" if abs(corr_g1_g3) > 0.7 else "moderately"} predict final outcomes</li>
-            <li><strong>Key Insight:</strong> Students with strong G1 scores tend to maintain or improve performance</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Study Time vs Performance
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("**📚 Study Time vs. Average Performance**")
-            fig_study = px.scatter(
-                filtered_df,
-                x='studytime',
-                y='Average_Grade',
-                color='sex',
-                title='Study Time Impact on Grades',
-                hover_data=['school', 'age', 'failures', 'absences'],
-                labels={'studytime': 'Study Time Level', 'Average_Grade': 'Average Grade'},
-                trendline="ols"
-            )
-            st.plotly_chart(fig_study, use_container_width=True)
-        
-        with col2:
-            # Study time by performance category
-            study_perf = filtered_df.groupby('studytime')['Average_Grade'].mean().reset_index()
-            fig_study_bar = px.bar(
-                study_perf,
-                x='studytime',
-                y='Average_Grade',
-                title='Average Grade by Study Time Level',
-                labels={'studytime': 'Study Time (1:<2h, 2:2-5h, 3:5-10h, 4:>10h)', 'Average_Grade': 'Avg Grade'},
-                color='Average_Grade',
-                color_continuous_scale='blues',
-                text='Average_Grade'
-            )
-            fig_study_bar.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-            st.plotly_chart(fig_study_bar, use_container_width=True)
-        
-        correlation_study = filtered_df['studytime'].corr(filtered_df['Average_Grade'])
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>📚 Study Time Analysis:</strong>
-        <ul>
-            <li><strong>Correlation:</strong> {correlation_study:.3f} - {"Positive" if correlation_study > 0 else "Negative"} relationship</li>
-            <li><strong>Trend:</strong> {"More study time generally leads to better grades" if correlation_study > 0.2 else "Weak relationship - study quality matters more than quantity"}</li>
-            <li><strong>Efficiency:</strong> Some high-performing students achieve excellent grades with moderate study time</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Absences vs Performance
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("**📅 Absences vs. Performance**")
-            fig_absences = px.scatter(
-                filtered_df,
-                x='absences',
-                y='Average_Grade',
-                color='Performance_Category',
-                title='Impact of Absences on Grades',
-                hover_data=['school', 'sex', 'age', 'studytime'],
-                labels={'absences': 'Number of Absences', 'Average_Grade': 'Average Grade'},
-                trendline="ols"
-            )
-            st.plotly_chart(fig_absences, use_container_width=True)
-        
-        with col2:
-            # Failures impact
-            st.write("**❌ Past Failures vs. Final Grade**")
-            fig_failures = px.box(
-                filtered_df,
-                x='failures',
-                y='G3', 
-                color='failures',
-                title='Impact of Past Failures on Final Grade',
-                labels={'failures': 'Number of Past Failures', 'G3': 'Final Grade'},
-                color_discrete_sequence=px.colors.sequential.Reds
-            )
-
-            st.plotly_chart(fig_failures, use_container_width=True)
-        
-        corr_absence = filtered_df['absences'].corr(filtered_df['Average_Grade'])
-        high_absence = filtered_df['absences'].quantile(0.75)
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>📅 Attendance & Performance:</strong>
-        <ul>
-            <li><strong>Absence Correlation:</strong> {corr_absence:.3f} - {"Negative" if corr_absence < 0 else "Positive"} impact</li>
-            <li><strong>High Absence Threshold:</strong> >{high_absence:.0f} absences significantly impacts performance</li>
-            <li><strong>Failures Impact:</strong> Students with past failures show lower average final grades</li>
-            <li><strong>Intervention:</strong> Monitor students with >10 absences or any past failures</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Demographic Analysis
-        st.subheader("👥 Demographic Performance Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # School comparison
-            school_perf = filtered_df.groupby(['school', 'sex'])['Average_Grade'].mean().reset_index()
-            fig_school = px.bar(
-                school_perf,
-                x='school',
-                y='Average_Grade',
-                color='sex',
-                title='Average Grade by School and Gender',
-                labels={'school': 'School', 'Average_Grade': 'Average Grade'},
-                barmode='group',
-                text='Average_Grade'
-            )
-            fig_school.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-            st.plotly_chart(fig_school, use_container_width=True)
-        
-        with col2:
-            # Address type impact
-            address_perf = filtered_df.groupby(['address', 'sex'])['Average_Grade'].mean().reset_index()
-            fig_address = px.bar(
-                address_perf,
-                x='address',
-                y='Average_Grade',
-                color='sex',
-                title='Average Grade by Address Type and Gender',
-                labels={'address': 'Address (U=Urban, R=Rural)', 'Average_Grade': 'Average Grade'},
-                barmode='group',
-                text='Average_Grade'
-            )
-            fig_address.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-            st.plotly_chart(fig_address, use_container_width=True)
-        
-        # Parental education impact
-        st.write("**👨‍👩‍👧 Parental Education Impact**")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            medu_perf = filtered_df.groupby('Medu')['Average_Grade'].mean().reset_index()
-            fig_medu = px.line(
-                medu_perf,
-                x='Medu',
-                y='Average_Grade',
-                title="Mother's Education vs. Student Performance",
-                labels={'Medu': "Mother's Education Level", 'Average_Grade': 'Avg Grade'},
-                markers=True
-            )
-            st.plotly_chart(fig_medu, use_container_width=True)
-        
-        with col2:
-            fedu_perf = filtered_df.groupby('Fedu')['Average_Grade'].mean().reset_index()
-            fig_fedu = px.line(
-                fedu_perf,
-                x='Fedu',
-                y='Average_Grade',
-                title="Father's Education vs. Student Performance",
-                labels={'Fedu': "Father's Education Level", 'Average_Grade': 'Avg Grade'},
-                markers=True
-            )
-            st.plotly_chart(fig_fedu, use_container_width=True)
-    
-    # ==================== TAB 3: CORRELATIONS & INSIGHTS ====================
-    with tab3:
-        st.header("🔍 Correlations & Detailed Insights")
-        
-        # Activity E: Correlation Heatmap
-        st.subheader("🔥 Activity E: Correlation Heatmap")
-        
-        numeric_df = filtered_df.select_dtypes(include=[np.number])
-        corr = numeric_df.corr()
-        
-        # Interactive correlation heatmap with Plotly
-        fig_corr = px.imshow(
-            corr,
-            text_auto='.2f',
-            aspect='auto',
-            title='Correlation Heatmap of Numeric Features',
-            color_continuous_scale='RdBu_r',
-            zmin=-1,
-            zmax=1
-        )
-        fig_corr.update_layout(height=700)
-        st.plotly_chart(fig_corr, use_container_width=True)
-        
-        # Find strong correlations
-        strong_corr_pairs = []
-        for i in range(len(corr.columns)):
-            for j in range(i+1, len(corr.columns)):
-                corr_val = corr.iloc[i, j]
-                if abs(corr_val) > 0.5:
-                    strong_corr_pairs.append((corr.columns[i], corr.columns[j], corr_val))
-        
-        strong_corr_pairs.sort(key=lambda x: abs(x[2]), reverse=True)
-        
-        st.markdown("### 🔍 Top Correlations")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**🔴 Strongest Positive Correlations:**")
-            positive_corrs = [x for x in strong_corr_pairs if x[2] > 0][:5]
-            for feat1, feat2, val in positive_corrs:
-                st.write(f"- **{feat1}** ↔ **{feat2}**: {val:.3f}")
-        
-        with col2:
-            st.markdown("**🔵 Strongest Negative Correlations:**")
-            negative_corrs = [x for x in strong_corr_pairs if x[2] < 0][:5]
-            if negative_corrs:
-                for feat1, feat2, val in negative_corrs:
-                    st.write(f"- **{feat1}** ↔ **{feat2}**: {val:.3f}")
-            else:
-                st.write("No strong negative correlations found")
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>📊 Correlation Analysis Insights:</strong>
-        <ul>
-            <li><strong>Academic Consistency:</strong> G1, G2, and G3 show very strong positive correlations (>0.8)</li>
-            <li><strong>Parental Education:</strong> Mother's and Father's education levels are correlated</li>
-            <li><strong>Behavioral Patterns:</strong> Daily and weekend alcohol consumption are correlated</li>
-            <li><strong>Performance Predictors:</strong> Early grades (G1) are strong predictors of final outcomes</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Pair Plot Section
-        st.subheader("🔗 Pair Plot Analysis")
-        
-        numeric_columns = [col for col in numeric_df.columns if col != 'Average_Grade']
-        
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            selected_features = st.multiselect(
-                "Select features for pair plot (2-5 recommended):",
-                numeric_columns,
-                default=['G1', 'G2', 'G3', 'studytime'][:min(4, len(numeric_columns))]
-            )
-        
-        with col2:
-            color_by = st.selectbox(
-                "Color by:",
-                ['sex', 'school', 'address', 'Performance_Category'],
-                index=0
-            )
-        
-        if len(selected_features) >= 2:
-            fig_pair = px.scatter_matrix(
-                filtered_df,
-                dimensions=selected_features,
-                color=color_by,
-                title=f"Pair Plot: {', '.join(selected_features)} (colored by {color_by})",
-                height=700
-            )
-            fig_pair.update_traces(diagonal_visible=False, showupperhalf=False)
-            st.plotly_chart(fig_pair, use_container_width=True)
-            
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>🔗 Pair Plot Insights:</strong>
-            <ul>
-                <li><strong>Matrix View:</strong> Each cell shows relationship between two variables</li>
-                <li><strong>Color Patterns:</strong> Reveals how different groups perform across features</li>
-                <li><strong>Linear Relationships:</strong> Straight-line patterns indicate strong correlations</li>
-                <li><strong>Clusters:</strong> Grouped points suggest categorical differences in behavior</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.info("Please select at least 2 features to generate the pair plot.")
-        
-        st.markdown("---")
-        
-        # Feature Importance Analysis
-        st.subheader("⭐ Feature Importance for Final Grade (G3)")
-        
-        # Calculate correlations with G3
-        g3_correlations = numeric_df.corr()['G3'].sort_values(ascending=False)
-        g3_correlations = g3_correlations[g3_correlations.index != 'G3']  # Remove G3 itself
-        
-        fig_importance = px.bar(
-            x=g3_correlations.values,
-            y=g3_correlations.index,
-            orientation='h',
-            title='Feature Correlations with Final Grade (G3)',
-            labels={'x': 'Correlation Coefficient', 'y': 'Feature'},
-            color=g3_correlations.values,
-            color_continuous_scale='RdYlGn',
-            color_continuous_midpoint=0
-        )
-        fig_importance.update_layout(height=600)
-        st.plotly_chart(fig_importance, use_container_width=True)
-        
-        top_positive = g3_correlations.nlargest(5)
-        top_negative = g3_correlations.nsmallest(5)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**✅ Top Positive Predictors:**")
-            for feat, val in top_positive.items():
-                st.write(f"- **{feat}**: {val:.3f}")
-        
-        with col2:
-            st.markdown("**⚠️ Top Negative Predictors:**")
-            for feat, val in top_negative.items():
-                st.write(f"- **{feat}**: {val:.3f}")
-    
-    # ==================== TAB 4: DATA EXPLORATION ====================
-    with tab4:
-        st.header("📋 Data Exploration")
-        
-        # Activity F: Boxplot
-        st.subheader("📦 Activity F: Boxplot Visualization")
-        
-        # Select features for boxplot
-        available_features = numeric_df.columns.tolist()
-        selected_box_features = st.multiselect(
-            "Select features to visualize (max 10):",
-            available_features,
-            default=['G1', 'G2', 'G3', 'studytime', 'absences', 'failures'][:min(6, len(available_features))]
-        )
-        
-        if selected_box_features:
-            # Create normalized boxplot
-            fig_box = go.Figure()
-            
-            for col in selected_box_features:
-                if filtered_df[col].max() != filtered_df[col].min():
-                    normalized = (filtered_df[col] - filtered_df[col].min()) / (filtered_df[col].max() - filtered_df[col].min())
-                else:
-                    normalized = filtered_df[col] * 0
-                
-                fig_box.add_trace(go.Box(
-                    y=normalized,
-                    name=col,
-                    boxmean='sd'
-                ))
-            
-            fig_box.update_layout(
-                title='Normalized Boxplot of Selected Features',
-                yaxis_title='Normalized Values (0-1)',
-                height=500,
-                showlegend=True
-            )
-            st.plotly_chart(fig_box, use_container_width=True)
-            
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>📦 Boxplot Analysis:</strong>
-            <ul>
-                <li><strong>Box:</strong> Contains middle 50% of data (IQR)</li>
-                <li><strong>Line in Box:</strong> Median value</li>
-                <li><strong>Whiskers:</strong> Extend to 1.5×IQR</li>
-                <li><strong>Dots:</strong> Outliers beyond whiskers</li>
-                <li><strong>Insight:</strong> Grades show normal distribution; absences/failures are right-skewed</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Distribution Analysis
-        st.subheader("📊 Distribution Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Histogram
-            hist_feature = st.selectbox(
-                "Select feature for histogram:",
-                numeric_df.columns.tolist(),
-                index=numeric_df.columns.tolist().index('G3') if 'G3' in numeric_df.columns else 0
-            )
-            
-            fig_hist = px.histogram(
-                filtered_df,
-                x=hist_feature,
-                color='sex',
-                title=f'Distribution of {hist_feature}',
-                marginal='box',
-                nbins=20
-            )
-            st.plotly_chart(fig_hist, use_container_width=True)
-        
-        with col2:
-            # Violin plot
-            violin_feature = st.selectbox(
-                "Select feature for violin plot:",
-                numeric_df.columns.tolist(),
-                index=numeric_df.columns.tolist().index('Average_Grade') if 'Average_Grade' in numeric_df.columns else 0
-            )
-            
-            fig_violin = px.violin(
-                filtered_df,
-                y=violin_feature,
-                x='sex',
-                color='sex',
-                box=True,
-                title=f'Violin Plot: {violin_feature} by Gender'
-            )
-            st.plotly_chart(fig_violin, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Categorical Analysis
-        st.subheader("🏷️ Categorical Feature Analysis")
-        
-        categorical_cols = ['school', 'sex', 'address', 'famsize', 'Pstatus', 'Mjob', 'Fjob', 
-                           'reason', 'guardian', 'schoolsup', 'famsup', 'paid', 'activities',
-                           'nursery', 'higher', 'internet', 'romantic']
-        
-        selected_cat = st.selectbox(
-            "Select categorical feature for detailed analysis:",
-            categorical_cols,
-            index=0
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Count distribution
-            cat_counts = filtered_df[selected_cat].value_counts().reset_index()
-            cat_counts.columns = [selected_cat, 'count']
-            
-            fig_cat_count = px.bar(
-                cat_counts,
-                x=selected_cat,
-                y='count',
-                title=f'Distribution of {selected_cat}',
-                color='count',
-                color_continuous_scale='viridis',
-                text='count'
-            )
-            fig_cat_count.update_traces(textposition='outside')
-            st.plotly_chart(fig_cat_count, use_container_width=True)
-        
-        with col2:
-            # Performance by category
-            cat_perf = filtered_df.groupby(selected_cat)['Average_Grade'].mean().reset_index()
-            cat_perf = cat_perf.sort_values('Average_Grade', ascending=False)
-            
-            fig_cat_perf = px.bar(
-                cat_perf,
-                x=selected_cat,
-                y='Average_Grade',
-                title=f'Average Grade by {selected_cat}',
-                color='Average_Grade',
-                color_continuous_scale='RdYlGn',
-                text='Average_Grade'
-            )
-            fig_cat_perf.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-            st.plotly_chart(fig_cat_perf, use_container_width=True)
-        
-        # Summary statistics
-        st.write(f"**📈 Statistical Summary by {selected_cat}:**")
-        
-        summary_stats = filtered_df.groupby(selected_cat).agg({
-            'Average_Grade': ['count', 'mean', 'std', 'min', 'max'],
-            'studytime': 'mean',
-            'failures': 'mean',
-            'absences': 'mean',
-            'G3': 'mean'
-        }).round(2)
-        
-        summary_stats.columns = ['Count', 'Mean_Grade', 'Std_Grade', 'Min_Grade', 'Max_Grade', 
-                                 'Avg_StudyTime', 'Avg_Failures', 'Avg_Absences', 'Avg_G3']
-        
-        st.dataframe(summary_stats, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Advanced Filters and Custom Analysis
-        st.subheader("🔬 Custom Analysis Builder")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            x_axis = st.selectbox("X-axis:", numeric_df.columns.tolist(), index=0)
-        with col2:
-            y_axis = st.selectbox("Y-axis:", numeric_df.columns.tolist(), 
-                                 index=1 if len(numeric_df.columns) > 1 else 0)
-        with col3:
-            color_var = st.selectbox("Color by:", 
-                                    ['None', 'sex', 'school', 'address', 'Performance_Category'],
-                                    index=1)
-        
-        color_param = None if color_var == 'None' else color_var
-        
-        fig_custom = px.scatter(
-            filtered_df,
-            x=x_axis,
-            y=y_axis,
-            color=color_param,
-            size='G3',
-            title=f'Custom Analysis: {x_axis} vs {y_axis}',
-            hover_data=['school', 'sex', 'age', 'Average_Grade'],
-            trendline="ols" if color_param is None else None
-        )
-        st.plotly_chart(fig_custom, use_container_width=True)
+    if tab2.open:
+        with tab2:
+            render_performance(filtered_df, filter_key, cube_view)
     
-    # ==================== TAB 5: KEY QUESTIONS ====================
-    with tab5:
-        st.header("❓ Key Questions & Answers")
-        
-        st.markdown("""
-        This section addresses the key analytical questions from the lab exercise.
-        """)
-        
-        # Question 1
-        st.subheader("1️⃣ Which features have the highest correlation with final exam scores (G1, G2, G3)?")
-        
-        g1_corr = numeric_df.corr()['G1'].sort_values(ascending=False).drop('G1')
-        g2_corr = numeric_df.corr()['G2'].sort_values(ascending=False).drop('G2')
-        g3_corr = numeric_df.corr()['G3'].sort_values(ascending=False).drop('G3')
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("**📝 G1 (First Period)**")
-            st.write("Top 5 Correlations:")
-            for feat, val in g1_corr.head(5).items():
-                st.write(f"- {feat}: **{val:.3f}**")
-        
-        with col2:
-            st.markdown("**📝 G2 (Second Period)**")
-            st.write("Top 5 Correlations:")
-            for feat, val in g2_corr.head(5).items():
-                st.write(f"- {feat}: **{val:.3f}**")
-        
-        with col3:
-            st.markdown("**📝 G3 (Final Grade)**")
-            st.write("Top 5 Correlations:")
-            for feat, val in g3_corr.head(5).items():
-                st.write(f"- {feat}: **{val:.3f}**")
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>💡 Answer:</strong>
-        <ul>
-            <li><strong>Strongest Predictors:</strong> G1 and G2 are the strongest predictors of G3 (correlation >0.8)</li>
-            <li><strong>Academic History:</strong> Previous grades show the highest correlation with final performance</li>
-            <li><strong>Other Factors:</strong> Parental education (Medu, Fedu) and past failures also show moderate correlations</li>
-            <li><strong>Key Insight:</strong> Early academic performance is the best predictor of final outcomes</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Question 2
-        st.subheader("2️⃣ How does study time correlate with exam performance?")
-        
-        corr_study_g1 = filtered_df['studytime'].corr(filtered_df['G1'])
-        corr_study_g2 = filtered_df['studytime'].corr(filtered_df['G2'])
-        corr_study_g3 = filtered_df['studytime'].corr(filtered_df['G3'])
-        corr_study_avg = filtered_df['studytime'].corr(filtered_df['Average_Grade'])
-        
-        # Visualization
-        study_grade_data = pd.DataFrame({
-            'Grade Type': ['G1', 'G2', 'G3', 'Average'],
-            'Correlation': [corr_study_g1, corr_study_g2, corr_study_g3, corr_study_avg]
-        })
-        
-        fig_q2 = px.bar(
-            study_grade_data,
-            x='Grade Type',
-            y='Correlation',
-            title='Study Time Correlation with Different Grade Types',
-            color='Correlation',
-            color_continuous_scale='RdYlGn',
-            color_continuous_midpoint=0,
-            text='Correlation'
-        )
-        fig_q2.update_traces(texttemplate='%{text:.3f}', textposition='outside')
-        st.plotly_chart(fig_q2, use_container_width=True)
-        
-        # Detailed analysis by study time level
-        study_analysis = filtered_df.groupby('studytime').agg({
-            'G1': 'mean',
-            'G2': 'mean',
-            'G3': 'mean',
-            'Average_Grade': 'mean',
-            'studytime': 'count'
-        }).round(2)
-        study_analysis.columns = ['Avg_G1', 'Avg_G2', 'Avg_G3', 'Avg_Grade', 'Student_Count']
-        study_analysis.index.name = 'Study_Time_Level'
-        
-        st.write("**Average Grades by Study Time Level:**")
-        st.dataframe(study_analysis, use_container_width=True)
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>💡 Answer:</strong>
-        <ul>
-            <li><strong>Overall Correlation:</strong> {corr_study_avg:.3f} - {"Positive but moderate" if 0.1 < corr_study_avg < 0.3 else "Strong positive" if corr_study_avg >= 0.3 else "Weak"} relationship</li>
-            <li><strong>Pattern:</strong> Study time shows {"consistent positive correlation" if corr_study_avg > 0.1 else "minimal correlation"} with all grade periods</li>
-            <li><strong>Quality vs Quantity:</strong> Some students achieve high grades with less study time, suggesting study efficiency matters</li>
-            <li><strong>Recommendation:</strong> Focus on effective study strategies rather than just increasing hours</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Question 3
-        st.subheader("3️⃣ What insights can you draw from the boxplot?")
-        
-        # Create comprehensive boxplot for key metrics
-        key_metrics = ['G1', 'G2', 'G3', 'studytime', 'failures', 'absences', 'Medu', 'Fedu']
-        available_metrics = [m for m in key_metrics if m in numeric_df.columns]
-        
-        fig_q3 = go.Figure()
-        
-        for col in available_metrics:
-            fig_q3.add_trace(go.Box(
-                y=filtered_df[col],
-                name=col,
-                boxmean='sd'
-            ))
-        
-        fig_q3.update_layout(
-            title='Boxplot Distribution of Key Features',
-            yaxis_title='Values',
-            height=500,
-            showlegend=True
-        )
-        st.plotly_chart(fig_q3, use_container_width=True)
-        
-        # Calculate statistics
-        grade_outliers = len(filtered_df[filtered_df['G3'] < (filtered_df['G3'].quantile(0.25) - 1.5 * (filtered_df['G3'].quantile(0.75) - filtered_df['G3'].quantile(0.25)))])
-        absence_outliers = len(filtered_df[filtered_df['absences'] > (filtered_df['absences'].quantile(0.75) + 1.5 * (filtered_df['absences'].quantile(0.75) - filtered_df['absences'].quantile(0.25)))])
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>💡 Answer - Key Boxplot Insights:</strong>
-        <ul>
-            <li><strong>Grade Distribution:</strong> G1, G2, G3 show relatively symmetric distributions around median of ~{filtered_df['G3'].median():.1f}</li>
-            <li><strong>Spread:</strong> Interquartile range indicates diverse student performance levels</li>
-            <li><strong>Outliers:</strong> {grade_outliers} students with exceptionally low grades; {absence_outliers} students with very high absences</li>
-            <li><strong>Study Time:</strong> Most students cluster around level 2 (2-5 hours weekly)</li>
-            <li><strong>Failures:</strong> Right-skewed distribution - most students have 0 failures, few with multiple</li>
-            <li><strong>Absences:</strong> Heavy right skew - most attend regularly, some chronic absentees</li>
-            <li><strong>Parental Education:</strong> Varies widely, showing diverse family backgrounds</li>
-            <li><strong>Actionable Insight:</strong> Focus intervention on outlier students (low performers, high absences)</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Question 4
-        st.subheader("4️⃣ How does gender impact the final exam score?")
-        
-        # Statistical comparison
-        male_stats = filtered_df[filtered_df['sex'] == 'M']['G3'].describe()
-        female_stats = filtered_df[filtered_df['sex'] == 'F']['G3'].describe()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**👨 Male Students (M)**")
-            st.write(f"- **Count:** {male_stats['count']:.0f}")
-            st.write(f"- **Mean:** {male_stats['mean']:.2f}")
-            st.write(f"- **Median:** {male_stats['50%']:.2f}")
-            st.write(f"- **Std Dev:** {male_stats['std']:.2f}")
-            st.write(f"- **Min:** {male_stats['min']:.0f}")
-            st.write(f"- **Max:** {male_stats['max']:.0f}")
-        
-        with col2:
-            st.markdown("**👩 Female Students (F)**")
-            st.write(f"- **Count:** {female_stats['count']:.0f}")
-            st.write(f"- **Mean:** {female_stats['mean']:.2f}")
-            st.write(f"- **Median:** {female_stats['50%']:.2f}")
-            st.write(f"- **Std Dev:** {female_stats['std']:.2f}")
-            st.write(f"- **Min:** {female_stats['min']:.0f}")
-            st.write(f"- **Max:** {female_stats['max']:.0f}")
-        
-        # Visualization
-        fig_q4 = go.Figure()
-        
-        fig_q4.add_trace(go.Box(
-            y=filtered_df[filtered_df['sex'] == 'M']['G3'],
-            name='Male',
-            marker_color='lightblue',
-            boxmean='sd'
-        ))
-        
-        fig_q4.add_trace(go.Box(
-            y=filtered_df[filtered_df['sex'] == 'F']['G3'],
-            name='Female',
-            marker_color='lightpink',
-            boxmean='sd'
-        ))
-        
-        fig_q4.update_layout(
-            title='Final Grade (G3) Distribution by Gender',
-            yaxis_title='Final Grade (G3)',
-            height=500
-        )
-        st.plotly_chart(fig_q4, use_container_width=True)
-        
-        # Additional analysis
-        gender_perf_cat = pd.crosstab(filtered_df['sex'], filtered_df['Performance_Category'], normalize='index') * 100
-        
-        fig_gender_cat = px.bar(
-            gender_perf_cat.T,
-            title='Performance Category Distribution by Gender (%)',
-            labels={'value': 'Percentage', 'Performance_Category': 'Performance Category'},
-            barmode='group'
-        )
-        st.plotly_chart(fig_gender_cat, use_container_width=True)
-        
-        diff = female_stats['mean'] - male_stats['mean']
-        
-        st.markdown(f"""
-        <div class='insight-box'>
-        <strong>💡 Answer - Gender Impact on Performance:</strong>
-        <ul>
-            <li><strong>Mean Difference:</strong> {"Females" if diff > 0 else "Males"} score {abs(diff):.2f} points higher on average</li>
-            <li><strong>Statistical Significance:</strong> {"Moderate" if abs(diff) > 1 else "Minimal"} gender difference in performance</li>
-            <li><strong>Distribution:</strong> Both genders show similar spread and distribution patterns</li>
-            <li><strong>Pass Rates:</strong> {"Females" if (filtered_df[filtered_df['sex']=='F']['G3']>=10).mean() > (filtered_df[filtered_df['sex']=='M']['G3']>=10).mean() else "Males"} have slightly higher pass rates</li>
-            <li><strong>Variability:</strong> {"Males" if male_stats['std'] > female_stats['std'] else "Females"} show slightly more variation in scores</li>
-            <li><strong>Conclusion:</strong> Gender has {"minimal" if abs(diff) < 1 else "moderate"} direct impact; individual factors matter more</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Summary and Recommendations
-        st.subheader("📌 Overall Summary & Recommendations")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>🎯 Key Findings:</strong>
-            <ul>
-                <li>Early grades (G1, G2) are strongest predictors of final performance</li>
-                <li>Study time shows positive but moderate correlation with grades</li>
-                <li>Past failures and absences negatively impact performance</li>
-                <li>Parental education influences student outcomes</li>
-                <li>Gender differences are minimal compared to individual factors</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>💼 Recommendations:</strong>
-            <ul>
-                <li>Implement early intervention for students with low G1 scores</li>
-                <li>Focus on study quality and efficiency training</li>
-                <li>Monitor and support students with high absence rates</li>
-                <li>Provide additional resources for students with past failures</li>
-                <li>Consider family background in support programs</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
+    if tab3.open:
+        with tab3:
+            render_correlations(filtered_df, filter_key)
+    
+    if tab4.open:
+        with tab4:
+            render_exploration(filtered_df, filter_key)
+    
+    if tab5.open:
+        with tab5:
+            render_key_questions(filtered_df, filter_key)
 
 else:
     # Use Markdown to render the Flaticon icon and message in white
@@ -0,0 +1,27 @@
+"""Datasets shared by the equivalence tests."""
+import os
+
+import pytest
+
+from benchmark import synthetic_csv
+from data_loader import parse_dataset
+
+SAMPLE_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'student-mat.csv')
+
+
+@pytest.fixture(scope='session')
+def sample_df():
+    """The bundled student-mat.csv, parsed like an upload."""
+    with open(SAMPLE_CSV, 'rb') as f:
+        return parse_dataset(f.read())[0]
+
+
+@pytest.fixture(scope='session')
+def synthetic_df():
+    """A larger synthetic dataset with the same schema."""
+    return parse_dataset(synthetic_csv(20_000, seed=1))[0]
+
+
+@pytest.fixture(params=['sample_df', 'synthetic_df'])
+def students(request):
+    return request.getfixturevalue(request.param)
@@ -0,0 +1,19 @@
+"""Random sidebar states for the equivalence tests."""
+
+
+def random_selection(rng, df, full_age_absences=False):
+    """Random sidebar state ``(isin, between)`` in the form taken by ``FilterEngine.mask``."""
+    isin = {}
+    for col in ['school', 'sex', 'address', 'internet']:
+        values = list(df[col].unique())
+        keep = rng.random(len(values)) < 0.7
+        isin[col] = [v for v, k in zip(values, keep) if k]
+    between = {}
+    for col in ['age', 'Medu', 'Fedu', 'studytime', 'failures', 'absences']:
+        low, high = int(df[col].min()), int(df[col].max())
+        if full_age_absences and col in ('age', 'absences'):
+            between[col] = (low, high)
+            continue
+        a, b = sorted(rng.integers(low, high + 1, 2))
+        between[col] = (int(a), int(b)) if rng.random() < 0.5 else (low, high)
+    return isin, between
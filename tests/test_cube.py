@@ -0,0 +1,61 @@
+"""GradeCube views against pandas groupby on the filtered frame."""
+import numpy as np
+import pytest
+
+from cube import CUBE_STATISTICS, MEASURES, grade_cube
+from filter_engine import FilterEngine
+from tests.selections import random_selection
+
+GROUPINGS = ['school', 'sex', 'address', 'Medu', 'Fedu', 'studytime', 'failures', 'internet',
+             ['school', 'sex'], ['address', 'sex'], ['studytime', 'failures']]
+
+
+def _selections(df, n, seed):
+    # The cube answers only selections over its dimensions, so age and absences keep their full range
+    rng = np.random.default_rng(seed)
+    return [random_selection(rng, df, full_age_absences=True) for _ in range(n)]
+
+
+@pytest.mark.parametrize('by', GROUPINGS, ids=str)
+def test_view_matches_groupby(students, by):
+    cube = grade_cube(students)
+    engine = FilterEngine(students)
+    for isin, between in _selections(students, 10, seed=0):
+        view = cube.view(isin=isin, between=between)
+        assert view is not None
+        filtered = engine.apply(isin=isin, between=between)
+
+        size = view.size(by)
+        assert size.sum() == len(filtered)
+        expected_size = filtered.groupby(by, observed=True).size()
+        assert list(size[size > 0].index) == list(expected_size.index)
+        np.testing.assert_array_equal(size[size > 0].to_numpy(), expected_size.to_numpy())
+
+        table = view.table(by)
+        expected = filtered.groupby(by, observed=True)[MEASURES].agg(CUBE_STATISTICS)
+        assert list(table.index) == list(expected.index)
+        for value in MEASURES:
+            np.testing.assert_array_equal(table[(value, 'count')].to_numpy(dtype=np.float64),
+                                          expected[(value, 'count')].to_numpy(dtype=np.float64))
+            for name in ['sum', 'mean']:
+                np.testing.assert_allclose(table[(value, name)].to_numpy(dtype=np.float64),
+                                           expected[(value, name)].to_numpy(dtype=np.float64), rtol=1e-12, atol=1e-9)
+            # Variances come from sums of squares, which lose digits to cancellation
+            np.testing.assert_allclose(table[(value, 'std')].to_numpy(dtype=np.float64),
+                                       expected[(value, 'std')].to_numpy(dtype=np.float64), rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.parametrize('column', ['age', 'absences'])
+def test_view_declines_age_and_absence_ranges(students, column):
+    # The dashboard then falls back to grouping the filtered rows
+    low, high = int(students[column].min()), int(students[column].max())
+    cube = grade_cube(students)
+    assert cube.view(between={column: (low + 1, high)}) is None
+    assert cube.view(between={column: (low, high - 1)}) is None
+    assert cube.view(between={column: (low, high)}) is not None
+
+
+def test_empty_selection(sample_df):
+    view = grade_cube(sample_df).view(isin={'school': []})
+    assert view.size('sex').sum() == 0
+    assert view.table('sex').empty
@@ -0,0 +1,71 @@
+"""GroupedAggregates and the analysis tables built on it against pandas groupby."""
+import numpy as np
+import pytest
+
+from analysis import categorical_summary, study_time_analysis
+from filter_engine import FilterEngine
+from grouping import STATISTICS, VALUE_COLUMNS, GroupedAggregates
+from tests.selections import random_selection
+
+GROUPINGS = ['school', 'sex', 'Mjob', 'studytime', 'internet', 'Medu', ['school', 'sex'], ['address', 'sex']]
+
+
+def _selections(df, n, seed):
+    engine = FilterEngine(df)
+    rng = np.random.default_rng(seed)
+    return [engine.apply(*random_selection(rng, df)) for _ in range(n)]
+
+
+def _assert_rounding_ties(ours, expected, unrounded):
+    # Rounded to 2 decimals, a mean may only differ from pandas' where pandas' own value sits on a
+    # rounding tie: both sums are correct to the last bit or two, but are formed in a different order
+    differs = ~np.isclose(ours.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64), rtol=0, atol=1e-9, equal_nan=True)
+    if differs.any():
+        hundredths = unrounded.to_numpy(dtype=np.float64)[differs] * 100
+        assert np.all(np.abs(hundredths - np.floor(hundredths) - 0.5) < 1e-6)
+        assert np.all(np.abs(ours.to_numpy(dtype=np.float64)[differs] - expected.to_numpy(dtype=np.float64)[differs]) < 0.01 + 1e-9)
+
+
+@pytest.mark.parametrize('by', GROUPINGS, ids=str)
+def test_table_matches_groupby(students, by):
+    for filtered in _selections(students, 10, seed=0):
+        table = GroupedAggregates(filtered).table(by)
+        expected = filtered.groupby(by, observed=True)[VALUE_COLUMNS].agg(STATISTICS)
+        assert list(table.index) == list(expected.index)
+        for value in VALUE_COLUMNS:
+            for name in ['count', 'min', 'max']:
+                np.testing.assert_array_equal(table[(value, name)].to_numpy(dtype=np.float64),
+                                              expected[(value, name)].to_numpy(dtype=np.float64))
+            for name in ['sum', 'mean', 'std']:
+                np.testing.assert_allclose(table[(value, name)].to_numpy(dtype=np.float64),
+                                           expected[(value, name)].to_numpy(dtype=np.float64), rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize('column', ['school', 'sex', 'address', 'Mjob', 'Fjob', 'reason', 'guardian', 'activities', 'higher'])
+def test_categorical_summary_matches_groupby_up_to_ties(students, column):
+    spec = {'Average_Grade': ['count', 'mean', 'std', 'min', 'max'], 'studytime': 'mean', 'failures': 'mean',
+            'absences': 'mean', 'G3': 'mean'}
+    for filtered in _selections(students, 40, seed=1):
+        summary = categorical_summary(filtered, column)
+        unrounded = filtered.groupby(column, observed=True).agg(spec)
+        expected = unrounded.round(2)
+        assert list(summary.index) == list(expected.index)
+        for i, name in enumerate(summary.columns):
+            _assert_rounding_ties(summary[name], expected.iloc[:, i], unrounded.iloc[:, i])
+
+
+def test_study_time_analysis_matches_groupby_up_to_ties(students):
+    spec = {'G1': 'mean', 'G2': 'mean', 'G3': 'mean', 'Average_Grade': 'mean', 'studytime': 'count'}
+    for filtered in _selections(students, 10, seed=2):
+        analysis = study_time_analysis(filtered)
+        unrounded = filtered.groupby('studytime').agg(spec)
+        expected = unrounded.round(2)
+        assert list(analysis.index) == list(expected.index)
+        for i, name in enumerate(analysis.columns):
+            _assert_rounding_ties(analysis[name], expected.iloc[:, i], unrounded.iloc[:, i])
+
+
+def test_empty_selection(sample_df):
+    table = GroupedAggregates(sample_df.iloc[:0]).table('school')
+    assert table.empty
+    assert GroupedAggregates(sample_df.iloc[:0]).size('school').sum() == 0
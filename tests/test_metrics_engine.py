@@ -0,0 +1,87 @@
+"""IncrementalMetrics over mask sequences against analysis.overview_metrics and pandas."""
+import numpy as np
+import pytest
+
+from analysis import overview_metrics
+from metrics_engine import PASS_GRADE, SCHOOLS, SEXES, IncrementalMetrics, MetricsKernel
+
+
+def _pandas_metrics(df):
+    # overview_metrics reads the kernel's baseline, so the tiles are also checked against plain pandas
+    return {
+        'total_students': len(df),
+        'avg_final_grade': df['G3'].mean(),
+        'avg_study_time': df['studytime'].mean(),
+        'pass_rate': (df['G3'] >= PASS_GRADE).mean() * 100 if len(df) else np.nan,
+        'school_counts': {school: int((df['school'] == school).sum()) for school in SCHOOLS},
+        'gender_counts': {sex: int((df['sex'] == sex).sum()) for sex in SEXES},
+        'avg_absences': df['absences'].mean(),
+        'failure_rate': (df['failures'] > 0).mean() * 100 if len(df) else np.nan,
+    }
+
+
+def _assert_metrics_equal(ours, expected):
+    assert ours.keys() == expected.keys()
+    for name, value in expected.items():
+        if isinstance(value, (int, dict)):
+            assert ours[name] == value
+        else:
+            np.testing.assert_allclose(ours[name], value, rtol=1e-12, equal_nan=True)
+
+
+def _mask_sequence(rng, n_rows, length):
+    # Small moves like a slider drag, interleaved with jumps that change more than half the rows
+    mask = rng.random(n_rows) < 0.5
+    masks = [mask]
+    for _ in range(length):
+        step = rng.integers(4)
+        if step == 0:
+            mask = ~mask
+        elif step == 1:
+            mask = rng.random(n_rows) < rng.random()
+        else:
+            mask = mask.copy()
+            mask[rng.integers(n_rows, size=rng.integers(1, 20))] ^= True
+        masks.append(mask)
+    return masks
+
+
+def _check_sequence(df, masks):
+    metrics = IncrementalMetrics(MetricsKernel(df))
+    for mask in masks:
+        ours = metrics.update(mask)
+        _assert_metrics_equal(ours, overview_metrics(df[mask]))
+        _assert_metrics_equal(ours, _pandas_metrics(df[mask]))
+
+
+def test_random_mask_sequences(students):
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        masks = _mask_sequence(rng, len(students), 30)
+        # Both the recompute branch and the delta branch run
+        changed = [np.count_nonzero(a != b) for a, b in zip(masks, masks[1:])]
+        assert max(changed) > len(students) // 2
+        assert min(changed) <= len(students) // 2
+        _check_sequence(students, masks)
+
+
+def test_empty_and_full_masks(students):
+    n_rows = len(students)
+    empty, full = np.zeros(n_rows, dtype=bool), np.ones(n_rows, dtype=bool)
+    one = empty.copy()
+    one[n_rows // 2] = True
+    _check_sequence(students, [full, empty, one, empty, full, one, full])
+
+
+def test_empty_mask_first(sample_df):
+    _check_sequence(sample_df, [np.zeros(len(sample_df), dtype=bool), np.ones(len(sample_df), dtype=bool)])
+
+
+@pytest.mark.parametrize('column', ['G3', 'absences'])
+def test_missing_values(sample_df, column):
+    # A float column with gaps makes the kernel inexact, so every update recomputes
+    df = sample_df.copy()
+    df[column] = df[column].astype(np.float64)
+    df.loc[df.index[::7], column] = np.nan
+    assert not MetricsKernel(df).exact
+    _check_sequence(df, _mask_sequence(np.random.default_rng(1), len(df), 20))